@@ -0,0 +1,3 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Benchmarks for some aspects of the ``sp-variant`` library."""
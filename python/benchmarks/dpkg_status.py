@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Measure the time it takes to list the installed packages on a Debian system.
+
+Compare reading a synthetic dpkg status database directly with running
+`dpkg-query` on it and parsing its output, if `dpkg-query` is available.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import shutil
+import statistics
+import tempfile
+import time
+import typing
+from unittest import mock
+
+import click
+
+from sp_variant import dpkg
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    from typing import Callable, Final
+
+    from sp_variant import defs
+
+
+def write_status(path: pathlib.Path, count: int) -> None:
+    """Generate a status database with the specified number of packages."""
+    with path.open(mode="w", encoding="UTF-8") as statf:
+        for idx in range(count):
+            print(
+                f"Package: pkg{idx:05d}\n"
+                f"Status: install ok {'installed' if idx % 10 else 'config-files'}\n"
+                "Priority: optional\n"
+                "Maintainer: Nobody <nobody@example.com>\n"
+                f"Architecture: {'all' if idx % 3 else 'amd64'}\n"
+                f"Version: 1:{idx}.0-1\n"
+                "Depends: libc6 (>= 2.36)\n"
+                "Description: a synthetic package\n"
+                " This is not a real package.\n",
+                file=statf,
+            )
+
+
+def run_once(func: Callable[[], list[defs.OSPackage]]) -> tuple[float, int]:
+    """List the packages once, return the elapsed time and the number of packages."""
+    start: Final = time.perf_counter()
+    count: Final = len(func())
+    return time.perf_counter() - start, count
+
+
+@click.command(name="dpkg_status")
+@click.option(
+    "-n",
+    "--count",
+    type=int,
+    default=20,
+    help="the number of times to run each benchmark",
+)
+@click.option(
+    "-p",
+    "--packages",
+    type=int,
+    default=20000,
+    help="the number of packages in the synthetic status database",
+)
+def main(*, count: int, packages: int) -> None:
+    """Run the benchmarks, display the results."""
+    with tempfile.TemporaryDirectory() as tempd_obj:
+        tempd: Final = pathlib.Path(tempd_obj)
+        path: Final = tempd / "status"
+        write_status(path, packages)
+
+        debian: Final = variant.get_variant("DEBIAN12")
+        subproc: Final = debian._replace(
+            commands=debian.commands._replace(
+                package=debian.commands.package._replace(
+                    list_all=(
+                        "dpkg-query",
+                        f"--admindir={tempd}",
+                        *debian.commands.package.list_all[1:],
+                    ),
+                ),
+            ),
+        )
+
+        def run_native() -> list[defs.OSPackage]:
+            """Read the status database directly."""
+            return list(dpkg.iter_installed(path=path))
+
+        def run_dpkg_query() -> list[defs.OSPackage]:
+            """Run `dpkg-query`, parse its output."""
+            with mock.patch("sp_variant.dpkg.STATUS_PATH", new=tempd / "nothing"):
+                return variant.list_all_packages(subproc)
+
+        modes: Final = [("native", run_native)]
+        if shutil.which("dpkg-query") is not None:
+            modes.append(("dpkg", run_dpkg_query))
+            if run_native() != run_dpkg_query():
+                raise click.ClickException("The two methods produced different results")
+
+        results: Final = {name: [run_once(func) for _ in range(count)] for name, func in modes}
+        for name, res in results.items():
+            times = [elapsed for elapsed, _ in res]
+            print(
+                f"{name:8} median {statistics.median(times) * 1000:8.3f} ms "
+                f"min {min(times) * 1000:8.3f} ms "
+                f"packages {res[0][1]}",
+            )
+
+
+if __name__ == "__main__":
+    main()
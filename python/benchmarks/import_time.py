@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Measure the time it takes to import the variant definitions.
+
+Compare the current lazily-compiled regular expressions with compiling all of
+them right away, the way the `re.compile()` calls in `_VARIANT_DEF` used to.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import typing
+
+import click
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+_CODE_IMPORT: Final = """
+import time
+
+start = time.perf_counter()
+from sp_variant import vbuild
+{extra}
+print(time.perf_counter() - start)
+"""
+
+_CODE_COMPILE: Final = """
+for var in vbuild._VARIANT_DEF:
+    var.detect.regex.compiled()
+    var.detect.os_version_regex.compiled()
+"""
+
+_MODES: Final = [
+    ("lazy", ""),
+    ("eager", _CODE_COMPILE),
+]
+
+
+def run_once(code: str) -> float:
+    """Import the module in a new Python interpreter, return the elapsed time."""
+    env: Final = dict(os.environ)
+    env["PYTHONPATH"] = str(pathlib.Path(__file__).absolute().parent.parent)
+    output: Final = subprocess.check_output(
+        [sys.executable, "-B", "-c", code],
+        encoding="UTF-8",
+        env=env,
+    )
+    return float(output)
+
+
+@click.command(name="import_time")
+@click.option(
+    "-n",
+    "--count",
+    type=int,
+    default=50,
+    help="the number of times to run each benchmark",
+)
+def main(*, count: int) -> None:
+    """Run the benchmarks, display the results."""
+    results: Final = {
+        name: [run_once(_CODE_IMPORT.format(extra=extra)) for _ in range(count)]
+        for name, extra in _MODES
+    }
+    for name, times in results.items():
+        print(
+            f"{name:8} median {statistics.median(times) * 1000:7.3f} ms "
+            f"min {min(times) * 1000:7.3f} ms",
+        )
+
+    saved: Final = statistics.median(results["eager"]) - statistics.median(results["lazy"])
+    print(f"saved    median {saved * 1000:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Measure the memory needed to keep a list of installed packages around.
+
+Compare a list of `OSPackage` records with a `PackageTable`, and
+a dictionary lookup by name with the table's binary search.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+import tracemalloc
+import typing
+
+import click
+
+from sp_variant import defs
+from sp_variant import pkgtable
+
+
+if typing.TYPE_CHECKING:
+    from typing import Callable, Final
+
+
+def build_packages(count: int) -> list[defs.OSPackage]:
+    """Generate package records that look more or less like the real ones."""
+    return [
+        defs.OSPackage(
+            name=f"lib{idx:05d}-{'dev' if idx % 3 else 'common'}",
+            version=f"{idx % 4}:{idx // 10}.{idx % 10}.{idx % 7}-{idx % 5}+deb12u{idx % 3}",
+            arch=("amd64", "all", "i386")[idx % 3],
+            status="installed",
+        )
+        for idx in range(count)
+    ]
+
+
+def measure(func: Callable[[], object]) -> tuple[object, int]:
+    """Build a container, return it and the memory it takes up."""
+    tracemalloc.start()
+    try:
+        res: Final = func()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return res, size
+
+
+@click.command(name="pkg_table")
+@click.option(
+    "-n",
+    "--count",
+    type=int,
+    default=5,
+    help="the number of times to run the lookup benchmark",
+)
+@click.option(
+    "-p",
+    "--packages",
+    type=int,
+    default=20000,
+    help="the number of packages to store",
+)
+def main(*, count: int, packages: int) -> None:
+    """Run the benchmarks, display the results."""
+    lines: Final = ["\t".join(pkg) for pkg in build_packages(packages)]
+
+    # Build the records from scratch, so that the strings are not shared.
+    def build_list() -> list[defs.OSPackage]:
+        """Parse the lines into a list of records."""
+        return [defs.OSPackage(*line.split("\t")) for line in lines]
+
+    def build_table() -> pkgtable.PackageTable:
+        """Parse the lines into a package table."""
+        return pkgtable.PackageTable(defs.OSPackage(*line.split("\t")) for line in lines)
+
+    pkgs, list_size = measure(build_list)
+    table, table_size = measure(build_table)
+    assert isinstance(pkgs, list)  # noqa: S101  # mypy needs this
+    assert isinstance(table, pkgtable.PackageTable)  # noqa: S101  # mypy needs this
+    if table.to_list() != pkgs:
+        raise click.ClickException("The table does not contain the same packages")
+
+    index, index_size = measure(lambda: {pkg.name: pkg.version for pkg in pkgs})
+    assert isinstance(index, dict)  # noqa: S101  # mypy needs this
+    names: Final = [pkg.name for pkg in random.sample(pkgs, min(len(pkgs), 1000))]
+
+    def lookup(func: Callable[[str], str | None]) -> float:
+        """Look up all the names, return the elapsed time."""
+        start: Final = time.perf_counter()
+        for name in names:
+            func(name)
+        return time.perf_counter() - start
+
+    dict_times: Final = [lookup(index.get) for _ in range(count)]
+    table_times: Final = [lookup(table.get_version) for _ in range(count)]
+    print(f"list     {list_size / 1024:10.1f} KiB, +{index_size / 1024:.1f} KiB for a name index")
+    print(f"table    {table_size / 1024:10.1f} KiB")
+    print(f"lookup   dict  median {statistics.median(dict_times) * 1e6 / len(names):7.3f} us")
+    print(f"lookup   table median {statistics.median(table_times) * 1e6 / len(names):7.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Measure the time it takes to produce the `show all` output.
+
+Compare the streaming serializer with building a tree of dictionaries and
+lists using `defs.jsonify()` and passing it to `json.dumps()`.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import pathlib
+import statistics
+import time
+import tracemalloc
+import typing
+
+import click
+
+from sp_variant import defs
+from sp_variant import serialize
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    from typing import IO, Any, Callable, Final
+
+
+def show_jsonify(data: Any, stream: IO[str]) -> None:  # noqa: ANN401
+    """Output the data the way the command-line tool used to."""
+    print(json.dumps(defs.jsonify(data), sort_keys=True, indent=2), file=stream)
+
+
+def show_stream(data: Any, stream: IO[str]) -> None:  # noqa: ANN401
+    """Output the data using the streaming serializer."""
+    serialize.dump(data, stream)
+    print(file=stream)
+
+
+_MODES: Final[list[tuple[str, Callable[[Any, IO[str]], None]]]] = [
+    ("jsonify", show_jsonify),
+    ("stream", show_stream),
+]
+
+
+def build_data() -> dict[str, Any]:
+    """Build the same data structure that `show all` outputs."""
+    return serialize.build_show_all(
+        variant.get_all_variants(),
+        variant.get_all_variants_in_order(),
+    )
+
+
+def run_once(func: Callable[[Any, IO[str]], None], data: Any) -> float:  # noqa: ANN401
+    """Serialize the data once, return the elapsed time."""
+    with io.StringIO() as buf:
+        start: Final = time.perf_counter()
+        func(data, buf)
+        return time.perf_counter() - start
+
+
+def peak_memory(func: Callable[[Any, IO[str]], None], data: Any) -> int:  # noqa: ANN401
+    """Serialize the data once, return the peak memory usage, not counting the output."""
+    with pathlib.Path(os.devnull).open(mode="w", encoding="UTF-8") as devnull:
+        tracemalloc.start()
+        try:
+            func(data, devnull)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+
+@click.command(name="show_all")
+@click.option(
+    "-n",
+    "--count",
+    type=int,
+    default=200,
+    help="the number of times to run each benchmark",
+)
+def main(*, count: int) -> None:
+    """Run the benchmarks, display the results."""
+    data: Final = build_data()
+    outputs: Final = set()
+    for _, func in _MODES:
+        with io.StringIO() as buf:
+            func(data, buf)
+            outputs.add(buf.getvalue())
+    if len(outputs) != 1:
+        raise click.ClickException("The serializers produced different output")
+
+    results: Final = {name: [run_once(func, data) for _ in range(count)] for name, func in _MODES}
+    for name, func in _MODES:
+        times = results[name]
+        print(
+            f"{name:8} median {statistics.median(times) * 1000:7.3f} ms "
+            f"min {min(times) * 1000:7.3f} ms "
+            f"peak {peak_memory(func, data) / 1024:8.1f} KiB",
+        )
+
+    saved: Final = statistics.median(results["jsonify"]) - statistics.median(results["stream"])
+    print(f"saved    median {saved * 1000:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
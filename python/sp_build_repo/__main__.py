@@ -21,7 +21,6 @@ import typedload.dataloader
 from sp_build_repo import diag
 from sp_variant import defs
 from sp_variant import variant
-from sp_variant import vbuild
 
 
 if TYPE_CHECKING:
@@ -277,8 +276,7 @@ def build_repo(cfg: Config) -> pathlib.Path:
         executable=True,
     )
 
-    vbuild.build_variants(variant.Config(verbose=cfg.verbose))
-    for var in vbuild.VARIANTS.values():
+    for var in variant.get_all_variants(variant.Config(verbose=cfg.verbose)).values():
         vardir = distdir / var.name
         vardir.mkdir()
 
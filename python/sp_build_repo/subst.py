@@ -9,6 +9,7 @@ import functools
 import json
 import logging
 import pathlib
+import re
 import typing
 
 import click
@@ -17,7 +18,9 @@ import trivver
 
 from sp_build_repo import diag
 from sp_variant import defs
+from sp_variant import serialize
 from sp_variant import variant
+from sp_variant import vbuild
 
 
 if typing.TYPE_CHECKING:
@@ -45,11 +48,35 @@ def regex_un_x(value: str) -> str:
     )
 
 
+_PY_FLAGS: Final = ((re.I, "re.I"), (re.M, "re.M"), (re.S, "re.S"), (re.X, "re.X"))
+
+
+def py_flags(value: int) -> str:
+    """Format a set of regular expression flags as a Python expression."""
+    names: Final = [name for flag, name in _PY_FLAGS if value & flag]
+    return " | ".join(names) if names else "0"
+
+
+def py_str(value: str) -> str:
+    """Format a string as a Python string literal, preferably a double-quoted one."""
+    # Use single quotes if that would lead to fewer escaped characters, same as `ruff format`.
+    if value.count('"') > value.count("'"):
+        return repr(value)
+
+    # A JSON string is also a valid Python string literal.
+    return json.dumps(value)
+
+
 def rust_bool(value: bool) -> str:  # noqa: FBT001  # this is a conversion routine
     """Format a boolean value as a Rust bool one."""
     return "true" if value else "false"
 
 
+def typename(value: object) -> str:
+    """Return the name of the object's class."""
+    return type(value).__name__
+
+
 def dictvsort(data: dict[str, variant.Variant]) -> list[tuple[str, variant.Variant]]:
     """Sort a dict of variants by name, preserving some numerical order."""
 
@@ -75,7 +102,9 @@ def build_json(var: variant.Variant) -> str:
 def substitute(cfg: Config) -> None:
     """Perform the substitutions."""
     logging.debug("Building the variants data")
-    variants: Final = variant.get_all_variants_in_order()
+    merged: Final = vbuild.merge_definitions(defs.Config(verbose=cfg.verbose))
+    variants: Final = list(reversed(merged.values()))
+    show_all: Final = serialize.dumps(serialize.build_show_all(merged, variants)) + "\n"
 
     logging.debug("Preparing the Jinja substitution environment")
     jenv: Final = jinja2.Environment(
@@ -84,14 +113,19 @@ def substitute(cfg: Config) -> None:
         undefined=jinja2.StrictUndefined,
     )
     jenv.filters["dictvsort"] = dictvsort
+    jenv.filters["pyflags"] = py_flags
+    jenv.filters["pystr"] = py_str
     jenv.filters["regexunx"] = regex_un_x
     jenv.filters["rust_bool"] = rust_bool
+    jenv.filters["typename"] = typename
     jenv.filters["vsort"] = vsort
     jvars: Final = {
         "format_version": defs.FORMAT_VERSION,
         "order": [var.name for var in variants],
         "repotypes": {repo.name: repo for repo in defs.REPO_TYPES},
-        "variants": {var.name: var for var in variants},
+        "show_all": show_all,
+        "show_all_fingerprint": serialize.fingerprint(show_all),
+        "variants": merged,
         "variants_json": {var.name: build_json(var) for var in variants},
         "version": defs.VERSION,
     }
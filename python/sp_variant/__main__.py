@@ -5,10 +5,8 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import pathlib
-import shlex
-import subprocess
 import sys
 import typing
 
@@ -18,15 +16,23 @@ from . import vbuild
 
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Callable, Final
+    from typing import Any, Callable, Final, Iterable
 
-    SubPAction: Final = argparse._SubParsersAction[argparse.ArgumentParser]  # noqa: SLF001
+    SubPAction = argparse._SubParsersAction[argparse.ArgumentParser]  # noqa: SLF001
 
 
 CMD_LIST_BRIEF: Final = [
     ("pkgfile", "install"),
 ]
 
+_PATH_CACHE_DIR = pathlib.Path("/run/sp-variant")
+
+_ENV_CACHE = "SP_VARIANT_CACHE"
+"""If set to a non-empty value other than "0", use the detection cache by default."""
+
+EXIT_UNCHANGED = 3
+"""The exit code of `show --if-changed` if the fingerprint of the output is the same."""
+
 _PATH_APT_SOURCES = pathlib.Path("/etc/apt/sources.list.d")
 _PATH_APT_KEYRINGS = pathlib.Path("/usr/share/keyrings")
 _PATH_RPM_GPG = pathlib.Path("/etc/pki/rpm-gpg")
@@ -46,6 +52,8 @@ def cmd_detect(cfg: defs.Config) -> None:
 
 def copy_file(cfg: defs.Config, src: pathlib.Path, dstdir: pathlib.Path) -> None:
     """Use `install(8)` to install a configuration file."""
+    import subprocess
+
     dst: Final = dstdir / src.name
     mode: Final = "0644"
     cfg.diag(f"{src} -> {dst} [{mode}]")
@@ -78,16 +86,42 @@ def repo_name_with_extension(cfg: defs.Config, path: pathlib.Path) -> str:
     return f"{path.stem}{cfg.repotype.extension}{path.suffix}"
 
 
+def missing_packages(cfg: defs.Config, var: defs.Variant, names: Iterable[str]) -> list[str]:
+    """Return the packages that are not installed, or all of them if we cannot tell."""
+    import subprocess
+
+    wanted: Final = list(names)
+    try:
+        installed: Final = variant.are_installed(var, wanted)
+    except (OSError, subprocess.CalledProcessError, variant.VariantError) as err:
+        cfg.diag(f"Could not check which packages are installed: {err}")
+        return wanted
+
+    missing: Final = [name for name in wanted if not installed[name]]
+    if len(missing) != len(wanted):
+        cfg.diag(
+            "Already installed: " + " ".join(name for name in wanted if installed[name]),
+        )
+    return missing
+
+
 def repo_add_deb(cfg: defs.Config, var: defs.Variant, vardir: pathlib.Path) -> None:
     """Install the StorPool Debian-like repo configuration."""
+    import subprocess
+
     assert isinstance(var.repo, defs.DebRepo)  # noqa: S101  # mypy needs this
 
-    try:
-        subprocess.check_call(var.commands.package.install + var.repo.req_packages, shell=False)
-    except subprocess.CalledProcessError as err:
-        raise variant.VariantFileError(
-            f"Could not install the required packages {' '.join(var.repo.req_packages)}: {err}",
-        ) from err
+    req_packages: Final = missing_packages(cfg, var, var.repo.req_packages)
+    if req_packages:
+        try:
+            subprocess.check_call(
+                [*var.commands.package.install, *req_packages],
+                shell=False,
+            )
+        except subprocess.CalledProcessError as err:
+            raise variant.VariantFileError(
+                f"Could not install the required packages {' '.join(req_packages)}: {err}",
+            ) from err
 
     copy_file(
         cfg,
@@ -108,24 +142,27 @@ def repo_add_deb(cfg: defs.Config, var: defs.Variant, vardir: pathlib.Path) -> N
 
 def repo_add_yum(cfg: defs.Config, var: defs.Variant, vardir: pathlib.Path) -> None:
     """Install the StorPool RedHat/CentOS-like repo configuration."""
+    import subprocess
+
     assert isinstance(var.repo, defs.YumRepo)  # noqa: S101  # mypy needs this
 
-    try:
-        subprocess.check_call(
-            [
-                "yum",
-                "--disablerepo=storpool-*'",
-                "install",
-                "-q",
-                "-y",
-                "ca-certificates",
-            ],
-            shell=False,
-        )
-    except subprocess.CalledProcessError as err:
-        raise variant.VariantFileError(
-            f"Could not install the required ca-certificates package: {err}",
-        ) from err
+    if missing_packages(cfg, var, ["ca-certificates"]):
+        try:
+            subprocess.check_call(
+                [
+                    "yum",
+                    "--disablerepo=storpool-*'",
+                    "install",
+                    "-q",
+                    "-y",
+                    "ca-certificates",
+                ],
+                shell=False,
+            )
+        except subprocess.CalledProcessError as err:
+            raise variant.VariantFileError(
+                f"Could not install the required ca-certificates package: {err}",
+            ) from err
 
     copy_file(
         cfg,
@@ -191,13 +228,13 @@ def cmd_repo_add(cfg: defs.Config) -> None:
         sys.exit(1)
 
 
-def command_find(cfg: defs.Config, var: defs.Variant) -> list[str]:
+def command_find(cfg: defs.Config, var: defs.Variant) -> tuple[str, ...]:
     """Get a distribution-specific command from the variant definition."""
     assert cfg.command is not None  # noqa: S101  # mypy needs this
 
-    current = var.commands
+    current: Any = var.commands
     for comp in cfg.command.split("."):
-        if not isinstance(current, tuple):
+        if not hasattr(current, "_fields"):
             raise defs.VariantConfigError("Too many command components")
 
         fields: tuple[str, ...] = current._fields
@@ -207,20 +244,35 @@ def command_find(cfg: defs.Config, var: defs.Variant) -> list[str]:
             )
         current = getattr(current, comp)
 
-    if not isinstance(current, list):
+    if hasattr(current, "_fields"):
         fields = current._fields
         raise defs.VariantConfigError(
             f"Incomplete command specification, should continue with one of {' '.join(fields)}",
         )
 
-    return current
+    cmd: Final[tuple[str, ...]] = current
+    return cmd
 
 
 def command_run(cfg: defs.Config) -> None:
     """Run a distribution-specific command."""
+    import shlex
+    import subprocess
+
     assert cfg.args is not None  # noqa: S101  # mypy needs this
 
-    cmd: Final = command_find(cfg, variant.detect_variant(cfg=cfg)) + cfg.args
+    var: Final = variant.detect_variant(cfg=cfg)
+    base: Final = command_find(cfg, var)
+    args = cfg.args
+    if cfg.only_missing:
+        if cfg.command != "package.install":
+            raise defs.VariantConfigError("--only-missing may only be used with package.install")
+        args = missing_packages(cfg, var, args)
+        if not args:
+            cfg.diag("All the packages are already installed, nothing to do")
+            return
+
+    cmd: Final = [*base, *args]
     cmdstr: Final = shlex.join(cmd)
     cfg.diag(f"About to run `{cmdstr}`")
     if cfg.noop:
@@ -235,6 +287,8 @@ def command_run(cfg: defs.Config) -> None:
 
 def cmd_command_list(cfg: defs.Config) -> None:
     """List the distribution-specific commands."""
+    import shlex
+
     var: Final = variant.detect_variant(cfg=cfg)
 
     # We only have two levels, right?
@@ -265,66 +319,196 @@ def cmd_features(_cfg: defs.Config) -> None:
     )
 
 
+def show_lookup_variant(cfg: defs.Config, name: str) -> defs.Variant | None:
+    """Detect the current variant or look one up by name or builder alias."""
+    if name == "current":
+        return variant.detect_variant(cfg)
+    return vbuild.lookup_variant(cfg, name) or vbuild.lookup_by_alias(cfg, name)
+
+
+def cmd_rpc(cfg: defs.Config) -> None:
+    """Answer JSON-RPC requests read from the standard input."""
+    from . import rpc
+
+    rpc.serve(cfg, sys.stdin, sys.stdout)
+
+
+def cmd_serve(cfg: defs.Config) -> None:
+    """Answer queries about the build variants over a Unix-domain socket."""
+    import signal
+
+    from . import server
+
+    def terminate(signum: int, _frame: object) -> None:
+        """Stop listening, remove the socket."""
+        cfg.diag(f"Received signal {signum}, exiting")
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, terminate)
+    try:
+        server.serve(cfg)
+    except (OSError, variant.VariantError) as err:
+        print(str(err), file=sys.stderr)
+        sys.exit(1)
+
+
+def show_find_variant(cfg: defs.Config) -> defs.Variant:
+    """Detect or look up the single variant to display."""
+    assert cfg.command is not None  # noqa: S101  # mypy needs this
+    var: Final = show_lookup_variant(cfg, cfg.command)
+    if var is None:
+        sys.exit(f"Invalid build variant '{cfg.command}'")
+
+    return var
+
+
+def show_get_data(cfg: defs.Config) -> Any:  # noqa: ANN401  # well, we know it's a dict...
+    """Build up the variant description."""
+    from . import serialize
+
+    if cfg.command == "all":
+        registry: Final = vbuild.get_registry(cfg)
+        registry.build(cfg)
+        return serialize.build_show_all(registry.variants, registry.detect_order)
+
+    return serialize.build_show(show_find_variant(cfg))
+
+
+def show_get_projection(cfg: defs.Config) -> str | bytes:
+    """Only output some fields of the variant definition, or output them as shell variables."""
+    import itertools
+
+    from . import cbor
+    from . import serialize
+
+    if cfg.command == "all":
+        sys.exit("The --field and --format shell options may not be used with 'all'")
+
+    try:
+        var: Final = show_find_variant(cfg)
+        values: Final = serialize.project(var, cfg.fields) if cfg.fields else None
+        if cfg.output_format == "shell":
+            return serialize.format_shell(
+                serialize.flatten(var)
+                if values is None
+                else itertools.chain.from_iterable(
+                    serialize.flatten(value, path) for path, value in values.items()
+                ),
+            )
+
+        assert values is not None  # noqa: S101  # mypy needs this
+        if cfg.output_format == "cbor":
+            return cbor.dumps(values)
+        return serialize.format_projection(values) + "\n"
+    except variant.VariantError as err:
+        print(str(err), file=sys.stderr)
+        sys.exit(1)
+
+
+def show_is_precomputed(cfg: defs.Config) -> bool:
+    """Check whether the precomputed `show all` output may be used."""
+    return (
+        cfg.command == "all"
+        and cfg.output_format == "json"
+        and not cfg.fields
+        and not vbuild.get_registry(cfg).overrides
+    )
+
+
+def show_get_output(cfg: defs.Config) -> tuple[str | bytes, str]:
+    """Return the output and its fingerprint, precomputed if possible."""
+    from . import cbor
+    from . import serialize
+
+    if cfg.fields or cfg.output_format == "shell":
+        projection: Final = show_get_projection(cfg)
+        return projection, serialize.fingerprint(projection)
+
+    if cfg.output_format == "cbor":
+        encoded: Final = cbor.dumps(show_get_data(cfg))
+        return encoded, serialize.fingerprint(encoded)
+
+    if show_is_precomputed(cfg):
+        from . import show_all
+
+        return show_all.SHOW_ALL, show_all.SHOW_ALL_FINGERPRINT
+
+    text: Final = serialize.dumps(show_get_data(cfg)) + "\n"
+    return text, serialize.fingerprint(text)
+
+
 def cmd_show(cfg: defs.Config) -> None:
     """Display information about a single build variant."""
-    vbuild.build_variants(cfg)
-
-    def get_data() -> Any:  # noqa: ANN401  # well, we know it's a dict...
-        """Build up the variant description."""
-        if cfg.command == "all":
-            return defs.jsonify(
-                {
-                    "format": {
-                        "version": {
-                            "major": defs.FORMAT_VERSION[0],
-                            "minor": defs.FORMAT_VERSION[1],
-                        },
-                    },
-                    "version": defs.VERSION,
-                    "variants": vbuild.VARIANTS,
-                    "order": [var.name for var in vbuild.DETECT_ORDER],
-                },
-            )
+    from . import serialize
 
-        assert cfg.command is not None  # noqa: S101  # mypy needs this
-        var: Final[defs.Variant | None] = (
-            variant.detect_variant(cfg)
-            if cfg.command == "current"
-            else vbuild.VARIANTS.get(cfg.command)
-        )
-        if var is None:
-            sys.exit(f"Invalid build variant '{cfg.command}'")
-
-        return defs.jsonify(
-            {
-                "format": {
-                    "version": {
-                        "major": defs.FORMAT_VERSION[0],
-                        "minor": defs.FORMAT_VERSION[1],
-                    },
-                },
-                "version": defs.VERSION,
-                "variant": var,
-            },
-        )
+    if (
+        cfg.if_changed is None
+        and cfg.output_format == "json"
+        and not cfg.fields
+        and not show_is_precomputed(cfg)
+    ):
+        serialize.dump(show_get_data(cfg), sys.stdout)
+        print()
+        return
 
-    print(json.dumps(get_data(), sort_keys=True, indent=2))
+    output, fingerprint = show_get_output(cfg)
+    if fingerprint == cfg.if_changed:
+        cfg.diag(f"The {fingerprint} fingerprint has not changed")
+        sys.exit(EXIT_UNCHANGED)
 
+    if isinstance(output, bytes):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(output)
 
-def parse_arguments() -> tuple[defs.Config, Callable[[defs.Config], None]]:
-    """Parse the command-line arguments."""
-    parser: Final = argparse.ArgumentParser(prog="storpool_variant")
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        action="store_true",
-        default=False,
-        help="verbose operation; display diagnostic output",
+
+def show_batch_line(cfg: defs.Config, name: str) -> str:
+    """Build the single-line JSON document describing a variant."""
+    from . import serialize
+
+    var: Final = show_lookup_variant(cfg, name)
+    if var is None:
+        raise defs.VariantConfigError(f"Invalid build variant '{name}'")
+
+    if cfg.fields:
+        return serialize.format_projection(serialize.project(var, cfg.fields), compact=True)
+    return serialize.dumps(serialize.build_show(var), compact=True)
+
+
+def cmd_show_batch(cfg: defs.Config) -> None:
+    """Display information about several build variants, one JSON document per line."""
+    from . import serialize
+
+    if cfg.output_format != "json" or cfg.if_changed is not None:
+        sys.exit("The --format and --if-changed options may not be used with several variants")
+
+    names: Final = (
+        (line.strip() for line in sys.stdin if line.strip())
+        if cfg.names is None
+        else iter(cfg.names)
     )
-    subp = parser.add_subparsers()
+    failed = False
+    for name in names:
+        try:
+            print(show_batch_line(cfg, name), flush=True)
+        except variant.VariantError as err:
+            print(f"{name}: {err}", file=sys.stderr, flush=True)
+            print(
+                serialize.dumps({"error": str(err), "name": name}, compact=True),
+                flush=True,
+            )
+            failed = True
+
+    if failed:
+        sys.exit(1)
 
-    p_cmd = subp.add_parser("command", help="Distribition-specific commands")
-    subp_cmd = p_cmd.add_subparsers()
+
+def add_command_parsers(subp: SubPAction) -> None:
+    """Add the `command list` and `command run` subcommands."""
+    p_cmd: Final = subp.add_parser("command", help="Distribition-specific commands")
+    subp_cmd: Final = p_cmd.add_subparsers()
 
     p_subcmd = subp_cmd.add_parser("list", help="List the distribution-specific commands")
     p_subcmd.set_defaults(func=cmd_command_list)
@@ -336,10 +520,45 @@ def parse_arguments() -> tuple[defs.Config, Callable[[defs.Config], None]]:
         action="store_true",
         help="display the command instead of executing it",
     )
+    p_subcmd.add_argument(
+        "-m",
+        "--only-missing",
+        action="store_true",
+        help="package.install: only install the packages that are not installed yet",
+    )
     p_subcmd.add_argument("command", type=str, help="The identifier of the command to run")
     p_subcmd.add_argument("args", type=str, nargs="*", help="Arguments to pass to the command")
     p_subcmd.set_defaults(func=cmd_command_run)
 
+
+def parse_arguments() -> tuple[defs.Config, Callable[[defs.Config], None]]:
+    """Parse the command-line arguments."""
+    parser: Final = argparse.ArgumentParser(prog="storpool_variant")
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        default=False,
+        help="verbose operation; display diagnostic output",
+    )
+    cache_group: Final = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--cache",
+        action="store_true",
+        default=os.environ.get(_ENV_CACHE, "") not in {"", "0"},
+        help=f"use and update the detection cache in {_PATH_CACHE_DIR}; "
+        f"the default if the {_ENV_CACHE} environment variable is set",
+    )
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_false",
+        dest="cache",
+        help=f"do not use the detection cache even if {_ENV_CACHE} is set",
+    )
+    subp = parser.add_subparsers()
+
+    add_command_parsers(subp)
+
     p_cmd = subp.add_parser("detect", help="Detect the build variant for the current host")
     p_cmd.set_defaults(func=cmd_detect)
 
@@ -367,13 +586,78 @@ def parse_arguments() -> tuple[defs.Config, Callable[[defs.Config], None]]:
     )
     p_subcmd.set_defaults(func=cmd_repo_add)
 
+    p_cmd = subp.add_parser(
+        "rpc",
+        help="Answer newline-delimited JSON-RPC requests read from the standard input",
+    )
+    p_cmd.set_defaults(func=cmd_rpc)
+
+    p_cmd = subp.add_parser(
+        "serve",
+        help="Answer queries about the build variants over a Unix-domain socket",
+    )
+    p_cmd.add_argument(
+        "-s",
+        "--socket",
+        type=pathlib.Path,
+        default=pathlib.Path(defs.SOCKET_PATH),
+        dest="socket_path",
+        help=f"the path to the socket to listen on (default: {defs.SOCKET_PATH})",
+    )
+    p_cmd.set_defaults(func=cmd_serve)
+
     p_cmd = subp.add_parser("show", help="Display information about a build variant")
     p_cmd.add_argument(
-        "name",
+        "names",
+        type=str,
+        nargs="*",
+        metavar="name",
+        help=(
+            "the name or builder alias of the build variant to query, 'all' for all, "
+            "or 'current' for the one detected; if more than one is specified, "
+            "output a single-line JSON document for each one"
+        ),
+    )
+    p_cmd.add_argument(
+        "-f",
+        "--field",
+        type=str,
+        action="append",
+        dest="fields",
+        metavar="PATH",
+        help=(
+            "only output this field, specified as a dotted path, e.g. "
+            "'builder.utf8_locale'; may be given more than once"
+        ),
+    )
+    p_cmd.add_argument(
+        "--format",
+        type=str,
+        default="json",
+        choices=["json", "shell", "cbor"],
+        dest="output_format",
+        help=(
+            "the output format: a JSON document (default), shell-quoted "
+            "SP_VARIANT_* variable assignments suitable for `eval`, or "
+            "a binary CBOR document with the same structure as the JSON one"
+        ),
+    )
+    p_cmd.add_argument(
+        "--if-changed",
         type=str,
+        metavar="FINGERPRINT",
+        help=(
+            "only output the data if its SHA-256 digest differs from this one; "
+            f"exit with code {EXIT_UNCHANGED} otherwise"
+        ),
+    )
+    p_cmd.add_argument(
+        "--stdin",
+        action="store_true",
+        default=False,
         help=(
-            "the name of the build variant to query, 'all' for all, or "
-            "'current' for the one detected"
+            "read the names of the build variants from the standard input, one per line, "
+            "output a single-line JSON document for each one"
         ),
     )
     p_cmd.set_defaults(func=cmd_show)
@@ -382,18 +666,37 @@ def parse_arguments() -> tuple[defs.Config, Callable[[defs.Config], None]]:
     if getattr(args, "func", None) is None:
         sys.exit("No command specified")
 
+    names: Final[list[str] | None] = getattr(args, "names", None)
+    func: Callable[[defs.Config], None] = args.func
+    if names is not None:
+        if getattr(args, "stdin", False):
+            if names:
+                sys.exit("No build variant names may be specified with --stdin")
+            func = cmd_show_batch
+        elif len(names) > 1:
+            func = cmd_show_batch
+        elif not names:
+            sys.exit("No build variant specified")
+
     return (
         defs.Config(
             args=getattr(args, "args", None),
-            command=getattr(args, "command", getattr(args, "name", None)),
+            cache_dir=_PATH_CACHE_DIR if args.cache else None,
+            command=getattr(args, "command", names[0] if names and func is cmd_show else None),
+            fields=getattr(args, "fields", None),
+            if_changed=getattr(args, "if_changed", None),
+            names=names if func is cmd_show_batch and names else None,
             noop=bool(getattr(args, "noop", False)),
+            only_missing=bool(getattr(args, "only_missing", False)),
+            output_format=getattr(args, "output_format", "json"),
             repodir=getattr(args, "repodir", None),
             repotype=next(rtype for rtype in defs.REPO_TYPES if rtype.name == args.repotype)
             if hasattr(args, "repotype")
             else defs.REPO_TYPES[0],
+            socket_path=getattr(args, "socket_path", None),
             verbose=args.verbose,
         ),
-        args.func,
+        func,
     )
 
 
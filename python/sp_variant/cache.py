@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Cache the result of the build variant detection on disk."""
+
+from __future__ import annotations
+
+import errno
+import itertools
+import os
+import typing
+from typing import Optional, Tuple
+
+from . import defs
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+FileId = Optional[Tuple[int, int, int, int]]
+"""The device, inode, size, and modification time of a file, or None if it is missing."""
+
+
+CACHE_FILENAME: Final = "detect.cache"
+"""The name of the cache file within the cache directory."""
+
+CACHE_FORMAT: Final = 1
+"""The version of the cache file format."""
+
+_CACHE_MAGIC: Final = "sp-variant-detect-cache"
+
+
+def file_id(filename: str) -> FileId:
+    """Obtain the identity of a file that the detection routines will examine."""
+    try:
+        stat: Final = os.stat(filename)  # noqa: PTH116  # this is a hot path
+    except OSError as err:
+        if err.errno != errno.ENOENT:
+            raise
+        return None
+
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _format_file_id(filename: str, fid: FileId) -> str:
+    """Build a single cache line describing a file."""
+    if fid is None:
+        return f"missing\t{filename}"
+    return "file\t{filename}\t{fields}".format(
+        filename=filename,
+        fields="\t".join(str(value) for value in fid),
+    )
+
+
+class _CacheFormatError(defs.VariantError):
+    """An unexpected line was found in the cache file."""
+
+
+def _parse_file_line(line: str) -> tuple[str, FileId]:
+    """Parse a single "file" or "missing" line in the cache file."""
+    fields: Final = line.split("\t")
+    if fields[0] == "missing" and len(fields) == 2:
+        return fields[1], None
+    if fields[0] == "file" and len(fields) == 6 and all(f.isdigit() for f in fields[2:]):
+        return fields[1], (int(fields[2]), int(fields[3]), int(fields[4]), int(fields[5]))
+    raise _CacheFormatError(f"unexpected line {line!r}")
+
+
+def load(cfg: defs.Config) -> str | None:
+    """Return the cached variant name if none of the examined files has changed."""
+    if cfg.cache_dir is None:
+        return None
+
+    path: Final = cfg.cache_dir / CACHE_FILENAME
+    try:
+        lines: Final = path.read_text(encoding="UTF-8").splitlines()
+    except (OSError, ValueError) as err:
+        cfg.diag(f"Could not read the {path} detection cache: {err}")
+        return None
+
+    if (
+        len(lines) < 2
+        or lines[0] != f"{_CACHE_MAGIC}\t{CACHE_FORMAT}\t{defs.VERSION}"
+        or not lines[1].startswith("variant\t")
+    ):
+        cfg.diag(f"Ignoring the {path} detection cache: unexpected header")
+        return None
+
+    try:
+        for filename, expected in (_parse_file_line(line) for line in lines[2:]):
+            if file_id(filename) != expected:
+                cfg.diag(f"The {filename} file has changed, ignoring the detection cache")
+                return None
+    except (OSError, _CacheFormatError) as err:
+        cfg.diag(f"Ignoring the {path} detection cache: {err}")
+        return None
+
+    return lines[1].split("\t", 1)[1]
+
+
+def write_file(cfg: defs.Config, filename: str, contents: str, what: str) -> bool:
+    """Atomically replace a file in the cache directory, report any errors."""
+    if cfg.cache_dir is None:
+        return False
+
+    import tempfile  # noqa: PLC0415  # only needed when the cache is updated
+
+    path: Final = cfg.cache_dir / filename
+    try:
+        cfg.cache_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="UTF-8",
+            dir=cfg.cache_dir,
+            prefix=f".{filename}.",
+            delete=False,
+        ) as tempf:
+            tempname = tempf.name
+            tempf.write(contents)
+
+        try:
+            os.chmod(tempname, 0o644)  # noqa: PTH101
+            os.replace(tempname, path)  # noqa: PTH105
+        except OSError:
+            os.unlink(tempname)  # noqa: PTH108
+            raise
+    except OSError as err:
+        cfg.diag(f"Could not update the {path} {what}: {err}")
+        return False
+
+    cfg.diag(f"Updated the {path} {what}")
+    return True
+
+
+def store(cfg: defs.Config, name: str, files: dict[str, FileId]) -> None:
+    """Record the detected variant and the identity of the examined files."""
+    if cfg.cache_dir is None:
+        return
+
+    contents: Final = "".join(
+        f"{line}\n"
+        for line in [
+            f"{_CACHE_MAGIC}\t{CACHE_FORMAT}\t{defs.VERSION}",
+            f"variant\t{name}",
+            *itertools.starmap(_format_file_id, files.items()),
+        ]
+    )
+    write_file(cfg, CACHE_FILENAME, contents, "detection cache")
@@ -0,0 +1,395 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Encode the variant definitions in the compact binary CBOR format (RFC 8949).
+
+The encoded document has the same structure as the JSON one output by
+`sp_variant show`: a `format.version` map with the `major` and `minor`
+members of `defs.FORMAT_VERSION`, the `version` of the sp-variant library,
+and either a single `variant` or all the `variants` and their detection
+`order`. The map keys are sorted in the same way as in the JSON output, so
+the encoded document is the same every time. It is prefixed with the CBOR
+"self-described" tag (55799) so that tools may recognize it.
+
+Only the subset of CBOR needed for the variant definitions is supported:
+integers, strings, arrays, maps, booleans, null, and floating-point numbers.
+As in the JSON document, only the source text of the regular expressions is
+stored, so `dumps()` refuses to encode a variant definition if they were not
+compiled with the flags that `load_variant()` assumes.
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+import struct
+import typing
+from typing import Mapping
+
+from . import defs
+
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Callable, Final
+
+
+class VariantCBORError(defs.VariantError):
+    """An error that occurred while encoding or decoding a CBOR document."""
+
+
+_MAJOR_UINT: Final = 0
+_MAJOR_NEGINT: Final = 1
+_MAJOR_BYTES: Final = 2
+_MAJOR_TEXT: Final = 3
+_MAJOR_ARRAY: Final = 4
+_MAJOR_MAP: Final = 5
+_MAJOR_TAG: Final = 6
+_MAJOR_SIMPLE: Final = 7
+
+_SIMPLE_FALSE: Final = 20
+_SIMPLE_TRUE: Final = 21
+_SIMPLE_NULL: Final = 22
+_FLOAT16: Final = 25
+_FLOAT32: Final = 26
+_FLOAT64: Final = 27
+
+MAX_DEPTH: Final = 64
+"""The maximum nesting level of the arrays, maps, and tags in a decoded document."""
+
+DETECT_REGEX_FLAGS: Final = re.X
+"""The flags that the `detect.regex` patterns are compiled with."""
+
+OS_VERSION_REGEX_FLAGS: Final = 0
+"""The flags that the `detect.os_version_regex` patterns are compiled with."""
+
+TAG_SELF_DESCRIBED: Final = 55799
+"""The tag that marks the data as CBOR, encoded as the magic bytes d9 d9 f7."""
+
+_HEAD_FORMATS: Final = ((0xFF, 24, ">BB"), (0xFFFF, 25, ">BH"), (0xFFFFFFFF, 26, ">BI"))
+
+
+def _head(major: int, value: int) -> bytes:
+    """Encode the initial byte of a data item and its argument."""
+    if value < 24:  # the smallest values are stored in the initial byte
+        return bytes((major << 5 | value,))
+    for limit, info, fmt in _HEAD_FORMATS:
+        if value <= limit:
+            return struct.pack(fmt, major << 5 | info, value)
+    if value > 0xFFFFFFFFFFFFFFFF:  # the largest CBOR argument
+        raise TypeError(f"Integer too large for CBOR: {value}")
+    return struct.pack(">BQ", major << 5 | 27, value)
+
+
+def _check_flags(pattern: re.Pattern[str] | defs.LazyPattern, expected: int, field: str) -> None:
+    """Make sure `load_variant()` will compile the pattern with the same flags."""
+    if pattern.flags & ~re.UNICODE != expected:
+        raise VariantCBORError(
+            f"Cannot encode the {pattern.pattern!r} {field} pattern: "
+            f"unexpected flags {pattern.flags:#x}, expected {expected:#x}",
+        )
+
+
+def _encode(obj: Any, out: bytearray) -> None:  # noqa: ANN401,C901,PLR0912
+    """Append the CBOR representation of an object to the output buffer."""
+    if isinstance(obj, str):
+        data: Final = obj.encode("UTF-8")
+        out += _head(_MAJOR_TEXT, len(data))
+        out += data
+    elif isinstance(obj, bool):
+        out.append(_MAJOR_SIMPLE << 5 | (_SIMPLE_TRUE if obj else _SIMPLE_FALSE))
+    elif obj is None:
+        out.append(_MAJOR_SIMPLE << 5 | _SIMPLE_NULL)
+    elif isinstance(obj, int):
+        out += _head(_MAJOR_UINT, obj) if obj >= 0 else _head(_MAJOR_NEGINT, -1 - obj)
+    elif isinstance(obj, float):
+        out += struct.pack(">Bd", _MAJOR_SIMPLE << 5 | _FLOAT64, obj)
+    elif isinstance(obj, bytes):
+        out += _head(_MAJOR_BYTES, len(obj))
+        out += obj
+    elif isinstance(obj, (re.Pattern, defs.LazyPattern)):
+        _encode(obj.pattern, out)
+    elif hasattr(obj, "_fields"):
+        if isinstance(obj, defs.Detect):
+            _check_flags(obj.regex, DETECT_REGEX_FLAGS, "detect.regex")
+            _check_flags(obj.os_version_regex, OS_VERSION_REGEX_FLAGS, "detect.os_version_regex")
+        fields: Final[tuple[str, ...]] = obj._fields
+        out += _head(_MAJOR_MAP, len(fields))
+        for name in sorted(fields):
+            _encode(name, out)
+            _encode(getattr(obj, name), out)
+    elif isinstance(obj, Mapping):
+        out += _head(_MAJOR_MAP, len(obj))
+        for key, value in sorted(obj.items(), key=operator.itemgetter(0)):
+            _encode(key, out)
+            _encode(value, out)
+    elif isinstance(obj, (list, tuple)):
+        out += _head(_MAJOR_ARRAY, len(obj))
+        for value in obj:
+            _encode(value, out)
+    else:
+        raise TypeError(f"Object of type {type(obj).__name__} is not CBOR serializable")
+
+
+def dumps(obj: Any) -> bytes:  # noqa: ANN401
+    """Return the self-described CBOR representation of the object.
+
+    Raise `VariantCBORError` if a variant definition contains regular expressions
+    compiled with flags that `load_variant()` would not use.
+    """
+    out: Final = bytearray(_head(_MAJOR_TAG, TAG_SELF_DESCRIBED))
+    _encode(obj, out)
+    return bytes(out)
+
+
+class _Decoder:
+    """Decode the data items one by one, keeping track of the position."""
+
+    data: bytes
+    pos: int
+
+    depth: int
+    """The number of arrays, maps, and tags that the current item is nested in."""
+
+    def __init__(self, data: bytes) -> None:
+        """Start at the beginning of the data."""
+        self.data = data
+        self.pos = 0
+        self.depth = 0
+
+    def take(self, count: int) -> bytes:
+        """Consume the specified number of bytes."""
+        end: Final = self.pos + count
+        if end > len(self.data):
+            raise VariantCBORError(f"Truncated CBOR data at offset {self.pos}")
+        chunk: Final = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+    def argument(self, info: int) -> int:
+        """Decode the argument of a data item."""
+        if info < 24:  # the smallest values are stored in the initial byte
+            return info
+        if info > 27:  # indefinite lengths and reserved values
+            raise VariantCBORError(f"Unsupported CBOR additional information {info}")
+        size: Final = 1 << (info - 24)
+        return int.from_bytes(self.take(size), "big")
+
+    def simple(self, info: int) -> Any:  # noqa: ANN401
+        """Decode a simple value or a floating-point number."""
+        if info == _SIMPLE_FALSE:
+            return False
+        if info == _SIMPLE_TRUE:
+            return True
+        if info == _SIMPLE_NULL:
+            return None
+        if info == _FLOAT16:
+            return struct.unpack(">e", self.take(2))[0]
+        if info == _FLOAT32:
+            return struct.unpack(">f", self.take(4))[0]
+        if info == _FLOAT64:
+            return struct.unpack(">d", self.take(8))[0]
+        raise VariantCBORError(f"Unsupported CBOR simple value {info}")
+
+    def text(self, length: int) -> str:
+        """Decode a UTF-8 text string."""
+        try:
+            return self.take(length).decode("UTF-8")
+        except UnicodeDecodeError as err:
+            raise VariantCBORError(f"Invalid CBOR text string: {err}") from err
+
+    def array(self, length: int) -> list[Any]:
+        """Decode the elements of an array."""
+        return [self.item() for _ in range(length)]
+
+    def map(self, length: int) -> dict[str, Any]:
+        """Decode the members of a map with string keys."""
+        result: Final[dict[str, Any]] = {}
+        for _ in range(length):
+            key = self.item()
+            if not isinstance(key, str):
+                raise VariantCBORError(f"Unsupported CBOR map key {key!r}")
+            result[key] = self.item()
+        return result
+
+    def tag(self, value: int) -> Any:  # noqa: ANN401
+        """Skip the "self-described" tag, reject any others."""
+        if value != TAG_SELF_DESCRIBED:
+            raise VariantCBORError(f"Unsupported CBOR tag {value}")
+        return self.item()
+
+    def item(self) -> Any:  # noqa: ANN401
+        """Decode a single data item, limiting the nesting level."""
+        if self.depth >= MAX_DEPTH:
+            raise VariantCBORError(f"CBOR data nested too deeply at offset {self.pos}")
+        self.depth += 1
+        try:
+            return self._item()
+        finally:
+            self.depth -= 1
+
+    def _item(self) -> Any:  # noqa: ANN401
+        """Decode a single data item without checking the nesting level."""
+        initial: Final = self.take(1)[0]
+        major: Final = initial >> 5
+        info: Final = initial & 0x1F
+        if major == _MAJOR_SIMPLE:
+            return self.simple(info)
+
+        value: Final = self.argument(info)
+        if major == _MAJOR_UINT:
+            return value
+        if major == _MAJOR_NEGINT:
+            return -1 - value
+        handler: Final[Callable[[int], Any]] = {
+            _MAJOR_BYTES: self.take,
+            _MAJOR_TEXT: self.text,
+            _MAJOR_ARRAY: self.array,
+            _MAJOR_MAP: self.map,
+        }.get(major, self.tag)
+        return handler(value)
+
+
+def loads(data: bytes) -> Any:  # noqa: ANN401
+    """Decode a single CBOR data item, e.g. the output of `dumps()`."""
+    decoder: Final = _Decoder(data)
+    result: Final = decoder.item()
+    if decoder.pos != len(data):
+        raise VariantCBORError(f"Extra data after the CBOR data item at offset {decoder.pos}")
+    return result
+
+
+def _get(raw: Mapping[str, Any], key: str, vtype: type[Any], where: str) -> Any:  # noqa: ANN401
+    """Fetch a member of a map, make sure it is of the expected type."""
+    value: Final = raw.get(key)
+    if not isinstance(value, vtype):
+        raise VariantCBORError(f"Expected a {vtype.__name__} '{key}' member in {where}")
+    return value
+
+
+def _get_strings(raw: Mapping[str, Any], key: str, where: str) -> tuple[str, ...]:
+    """Fetch a list of strings, e.g. a command."""
+    value: Final[list[Any]] = _get(raw, key, list, where)
+    if not all(isinstance(item, str) for item in value):
+        raise VariantCBORError(f"Expected a list of strings '{key}' member in {where}")
+    return defs.intern_command(value)
+
+
+def _get_map(raw: Mapping[str, Any], key: str, where: str) -> dict[str, Any]:
+    """Fetch a map member."""
+    value: Final[dict[str, Any]] = _get(raw, key, dict, where)
+    return value
+
+
+def _load_repo(raw: dict[str, Any], where: str) -> defs.DebRepo | defs.YumRepo:
+    """Build a Debian or a Yum repository definition."""
+    if "yumdef" in raw:
+        return defs.YumRepo(
+            yumdef=_get(raw, "yumdef", str, where),
+            keyring=_get(raw, "keyring", str, where),
+        )
+
+    return defs.DebRepo(
+        codename=_get(raw, "codename", str, where),
+        vendor=_get(raw, "vendor", str, where),
+        sources=_get(raw, "sources", str, where),
+        keyring=_get(raw, "keyring", str, where),
+        req_packages=_get_strings(raw, "req_packages", where),
+    )
+
+
+def load_variant(raw: Mapping[str, Any]) -> defs.Variant:
+    """Build a variant definition from a decoded map.
+
+    The detection regular expressions are compiled with `DETECT_REGEX_FLAGS` and
+    the os-release version ones with `OS_VERSION_REGEX_FLAGS`; `dumps()` makes
+    sure that the encoded variant definitions used the same ones.
+    """
+    name: Final[str] = _get(raw, "name", str, "the variant definition")
+    where: Final = f"the {name} variant definition"
+    detect: Final = _get_map(raw, "detect", where)
+    commands: Final = _get_map(raw, "commands", where)
+    cmd_package: Final = _get_map(commands, "package", where)
+    cmd_pkgfile: Final = _get_map(commands, "pkgfile", where)
+    package: Final = _get_map(raw, "package", where)
+    builder: Final = _get_map(raw, "builder", where)
+    if not all(isinstance(value, str) for value in package.values()):
+        raise VariantCBORError(f"Expected string package names in {where}")
+
+    return defs.Variant(
+        name=name,
+        descr=_get(raw, "descr", str, where),
+        parent=_get(raw, "parent", str, where),
+        family=_get(raw, "family", str, where),
+        detect=defs.Detect(
+            filename=_get(detect, "filename", str, where),
+            regex=defs.lazy_pattern(_get(detect, "regex", str, where), DETECT_REGEX_FLAGS),
+            os_id=_get(detect, "os_id", str, where),
+            os_version_regex=defs.lazy_pattern(
+                _get(detect, "os_version_regex", str, where),
+                OS_VERSION_REGEX_FLAGS,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=_get(_get_map(raw, "supported", where), "repo", bool, where),
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                **{
+                    field: _get_strings(cmd_package, field, where)
+                    for field in defs.CommandsPackage._fields
+                },
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                **{
+                    field: _get_strings(cmd_pkgfile, field, where)
+                    for field in defs.CommandsPkgFile._fields
+                },
+            ),
+        ),
+        min_sys_python=_get(raw, "min_sys_python", str, where),
+        repo=_load_repo(_get_map(raw, "repo", where), where),
+        package=defs.FrozenDict(package),
+        systemd_lib=_get(raw, "systemd_lib", str, where),
+        file_ext=_get(raw, "file_ext", str, where),
+        initramfs_flavor=_get(raw, "initramfs_flavor", str, where),
+        builder=defs.Builder(
+            **{field: _get(builder, field, str, where) for field in defs.Builder._fields},
+        ),
+    )
+
+
+def _load_document(data: bytes) -> dict[str, Any]:
+    """Decode a `show` document, make sure its format version is supported."""
+    doc: Final = loads(data)
+    if not isinstance(doc, dict):
+        raise VariantCBORError("Expected a CBOR map at the top level")
+    version: Final = _get_map(_get_map(doc, "format", "the document"), "version", "the format")
+    major: Final[int] = _get(version, "major", int, "the format version")
+    minor: Final[int] = _get(version, "minor", int, "the format version")
+    if major != defs.FORMAT_VERSION[0]:
+        raise VariantCBORError(
+            f"Unsupported format version {major}.{minor}, expected {defs.FORMAT_VERSION[0]}.x",
+        )
+    return doc
+
+
+def load_show(data: bytes) -> defs.Variant:
+    """Decode the output of `sp_variant show --format cbor NAME`."""
+    return load_variant(_get_map(_load_document(data), "variant", "the document"))
+
+
+def load_show_all(data: bytes) -> tuple[dict[str, defs.Variant], list[defs.Variant]]:
+    """Decode the output of `sp_variant show --format cbor all`.
+
+    Return the variants keyed by name and the variants in detection order.
+    """
+    doc: Final = _load_document(data)
+    raw_variants: Final = _get_map(doc, "variants", "the document")
+    variants: Final = {name: load_variant(raw) for name, raw in raw_variants.items()}
+    if any(name != var.name for name, var in variants.items()):
+        raise VariantCBORError("Mismatched variant names in the 'variants' map")
+
+    order: Final = _get_strings(doc, "order", "the document")
+    missing: Final = [name for name in order if name not in variants]
+    if missing:
+        raise VariantCBORError(f"Unknown variants in the detection order: {' '.join(missing)}")
+    return variants, [variants[name] for name in order]
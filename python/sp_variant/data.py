@@ -0,0 +1,2312 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Pre-merged definitions of the supported build variants.
+
+This file is autogenerated from the variant definitions in `vbuild.py`
+using the `sp_build_repo.subst` tool and the `data.py.j2` template.
+Do not edit it by hand.
+"""
+
+from __future__ import annotations
+
+import re
+import typing
+
+from . import defs
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+VARIANTS: Final[dict[str, defs.Variant]] = {
+    "DEBIAN13": defs.Variant(
+        name="DEBIAN13",
+        descr="Debian 13.x (trixie/unstable)",
+        parent="",
+        family="debian",
+        detect=defs.Detect(
+            filename="/etc/os-release",
+            regex=defs.lazy_pattern(
+                "^\n                    PRETTY_NAME= .*\n                    Debian \\s+ GNU/Linux \\s+\n                    (?: trixie | 13 ) (?: \\s | / )\n                ",
+                re.X,
+            ),
+            os_id="debian",
+            os_version_regex=defs.lazy_pattern(
+                "^13$",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=False,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    (
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "update",
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "--no-install-recommends",
+                        "install",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "dpkg-query",
+                        "-W",
+                        "-f",
+                        "${Package}\\t${Version}\\t${Architecture}\\t${db:Status-Abbrev}\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "purge",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "remove",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "dpkg",
+                        "-r",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages",
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.11",
+        repo=defs.DebRepo(
+            codename="unstable",
+            vendor="debian",
+            sources="debian/repo/storpool.sources",
+            keyring="debian/repo/storpool-keyring.gpg",
+            req_packages=defs.intern_command(
+                ("ca-certificates",),
+            ),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python3",
+                "BINDINGS_PYTHON_CONFGET": "python3-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-cpupower",
+                "LIBSSL": "libssl3",
+                "MCELOG": "bash",
+            },
+        ),
+        systemd_lib="lib/systemd/system",
+        file_ext="deb",
+        initramfs_flavor="update-initramfs",
+        builder=defs.Builder(
+            alias="debian13",
+            base_image="debian:unstable",
+            branch="debian/unstable",
+            kernel_package="linux-headers",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "DEBIAN12": defs.Variant(
+        name="DEBIAN12",
+        descr="Debian 12.x (bookworm)",
+        parent="DEBIAN13",
+        family="debian",
+        detect=defs.Detect(
+            filename="/etc/os-release",
+            regex=defs.lazy_pattern(
+                "^\n                    PRETTY_NAME= .*\n                    Debian \\s+ GNU/Linux \\s+\n                    (?: bookworm | 12 ) (?: \\s | / )\n                ",
+                re.X,
+            ),
+            os_id="debian",
+            os_version_regex=defs.lazy_pattern(
+                "^12$",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    (
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "update",
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "--no-install-recommends",
+                        "install",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "dpkg-query",
+                        "-W",
+                        "-f",
+                        "${Package}\\t${Version}\\t${Architecture}\\t${db:Status-Abbrev}\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "purge",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "remove",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "dpkg",
+                        "-r",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages",
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.11",
+        repo=defs.DebRepo(
+            codename="bookworm",
+            vendor="debian",
+            sources="debian/repo/storpool.sources",
+            keyring="debian/repo/storpool-keyring.gpg",
+            req_packages=defs.intern_command(
+                ("ca-certificates",),
+            ),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python3",
+                "BINDINGS_PYTHON_CONFGET": "python3-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-cpupower",
+                "LIBSSL": "libssl3",
+                "MCELOG": "bash",
+            },
+        ),
+        systemd_lib="lib/systemd/system",
+        file_ext="deb",
+        initramfs_flavor="update-initramfs",
+        builder=defs.Builder(
+            alias="debian12",
+            base_image="debian:bookworm",
+            branch="debian/bookworm",
+            kernel_package="linux-headers",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "DEBIAN11": defs.Variant(
+        name="DEBIAN11",
+        descr="Debian 11.x (bullseye)",
+        parent="DEBIAN12",
+        family="debian",
+        detect=defs.Detect(
+            filename="/etc/os-release",
+            regex=defs.lazy_pattern(
+                "^\n                    PRETTY_NAME= .*\n                    Debian \\s+ GNU/Linux \\s+\n                    (?: bullseye | 11 ) (?: \\s | / )\n                ",
+                re.X,
+            ),
+            os_id="debian",
+            os_version_regex=defs.lazy_pattern(
+                "^11$",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    (
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "update",
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "--no-install-recommends",
+                        "install",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "dpkg-query",
+                        "-W",
+                        "-f",
+                        "${Package}\\t${Version}\\t${Architecture}\\t${db:Status-Abbrev}\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "purge",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "remove",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "dpkg",
+                        "-r",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages",
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.9",
+        repo=defs.DebRepo(
+            codename="bullseye",
+            vendor="debian",
+            sources="debian/repo/storpool.sources",
+            keyring="debian/repo/storpool-keyring.gpg",
+            req_packages=defs.intern_command(
+                ("ca-certificates",),
+            ),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python3",
+                "BINDINGS_PYTHON_CONFGET": "python3-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-cpupower",
+                "LIBSSL": "libssl1.1",
+                "MCELOG": "bash",
+            },
+        ),
+        systemd_lib="lib/systemd/system",
+        file_ext="deb",
+        initramfs_flavor="update-initramfs",
+        builder=defs.Builder(
+            alias="debian11",
+            base_image="debian:bullseye",
+            branch="debian/bullseye",
+            kernel_package="linux-headers",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "DEBIAN10": defs.Variant(
+        name="DEBIAN10",
+        descr="Debian 10.x (buster)",
+        parent="DEBIAN11",
+        family="debian",
+        detect=defs.Detect(
+            filename="/etc/os-release",
+            regex=defs.lazy_pattern(
+                "^\n                    PRETTY_NAME= .*\n                    Debian \\s+ GNU/Linux \\s+\n                    (?: buster | 10 ) (?: \\s | / )\n                ",
+                re.X,
+            ),
+            os_id="debian",
+            os_version_regex=defs.lazy_pattern(
+                "^10$",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=False,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    (
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "update",
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "--no-install-recommends",
+                        "install",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "dpkg-query",
+                        "-W",
+                        "-f",
+                        "${Package}\\t${Version}\\t${Architecture}\\t${db:Status-Abbrev}\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "purge",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "remove",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "dpkg",
+                        "-r",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages",
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.7",
+        repo=defs.DebRepo(
+            codename="buster",
+            vendor="debian",
+            sources="debian/repo/storpool.sources",
+            keyring="debian/repo/storpool-keyring.gpg",
+            req_packages=defs.intern_command(
+                ("ca-certificates",),
+            ),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python",
+                "BINDINGS_PYTHON_CONFGET": "python-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-cpupower",
+                "LIBSSL": "libssl1.1",
+                "MCELOG": "bash",
+            },
+        ),
+        systemd_lib="lib/systemd/system",
+        file_ext="deb",
+        initramfs_flavor="update-initramfs",
+        builder=defs.Builder(
+            alias="debian10",
+            base_image="debian:buster",
+            branch="debian/buster",
+            kernel_package="linux-headers",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "UBUNTU2404": defs.Variant(
+        name="UBUNTU2404",
+        descr="Ubuntu 24.04 LTS (Noble Numbat)",
+        parent="DEBIAN13",
+        family="debian",
+        detect=defs.Detect(
+            filename="/etc/os-release",
+            regex=defs.lazy_pattern(
+                "^ PRETTY_NAME= .* Ubuntu \\s+ .* Noble ",
+                re.X,
+            ),
+            os_id="ubuntu",
+            os_version_regex=defs.lazy_pattern(
+                "^24\\.04$",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=False,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    (
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "update",
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "--no-install-recommends",
+                        "install",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "dpkg-query",
+                        "-W",
+                        "-f",
+                        "${Package}\\t${Version}\\t${Architecture}\\t${db:Status-Abbrev}\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "purge",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "remove",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "dpkg",
+                        "-r",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages",
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.12",
+        repo=defs.DebRepo(
+            codename="noble",
+            vendor="ubuntu",
+            sources="debian/repo/storpool.sources",
+            keyring="debian/repo/storpool-keyring.gpg",
+            req_packages=defs.intern_command(
+                ("ca-certificates",),
+            ),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python3",
+                "BINDINGS_PYTHON_CONFGET": "python3-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-tools-generic",
+                "LIBSSL": "libssl3",
+                "MCELOG": "bash",
+            },
+        ),
+        systemd_lib="lib/systemd/system",
+        file_ext="deb",
+        initramfs_flavor="update-initramfs",
+        builder=defs.Builder(
+            alias="ubuntu-24.04",
+            base_image="ubuntu:noble",
+            branch="ubuntu/noble",
+            kernel_package="linux-headers",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "UBUNTU2204": defs.Variant(
+        name="UBUNTU2204",
+        descr="Ubuntu 22.04 LTS (Jammy Jellyfish)",
+        parent="UBUNTU2404",
+        family="debian",
+        detect=defs.Detect(
+            filename="/etc/os-release",
+            regex=defs.lazy_pattern(
+                "^ PRETTY_NAME= .* (?: Ubuntu \\s+ 22 \\. 04 | Mint \\s+ 21 ) ",
+                re.X,
+            ),
+            os_id="ubuntu",
+            os_version_regex=defs.lazy_pattern(
+                "^22\\.04$",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    (
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "update",
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "--no-install-recommends",
+                        "install",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "dpkg-query",
+                        "-W",
+                        "-f",
+                        "${Package}\\t${Version}\\t${Architecture}\\t${db:Status-Abbrev}\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "purge",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "remove",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "dpkg",
+                        "-r",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages",
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.10",
+        repo=defs.DebRepo(
+            codename="jammy",
+            vendor="ubuntu",
+            sources="debian/repo/storpool.sources",
+            keyring="debian/repo/storpool-keyring.gpg",
+            req_packages=defs.intern_command(
+                ("ca-certificates",),
+            ),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python3",
+                "BINDINGS_PYTHON_CONFGET": "python3-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-tools-generic",
+                "LIBSSL": "libssl3",
+                "MCELOG": "bash",
+            },
+        ),
+        systemd_lib="lib/systemd/system",
+        file_ext="deb",
+        initramfs_flavor="update-initramfs",
+        builder=defs.Builder(
+            alias="ubuntu-22.04",
+            base_image="ubuntu:jammy",
+            branch="ubuntu/jammy",
+            kernel_package="linux-headers",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "UBUNTU2004": defs.Variant(
+        name="UBUNTU2004",
+        descr="Ubuntu 20.04 LTS (Focal Fossa)",
+        parent="UBUNTU2204",
+        family="debian",
+        detect=defs.Detect(
+            filename="/etc/os-release",
+            regex=defs.lazy_pattern(
+                "^ PRETTY_NAME= .* (?: Ubuntu \\s+ 20 \\. 04 | Mint \\s+ 20 ) ",
+                re.X,
+            ),
+            os_id="ubuntu",
+            os_version_regex=defs.lazy_pattern(
+                "^20\\.04$",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    (
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "update",
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "--no-install-recommends",
+                        "install",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "dpkg-query",
+                        "-W",
+                        "-f",
+                        "${Package}\\t${Version}\\t${Architecture}\\t${db:Status-Abbrev}\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "purge",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "remove",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "dpkg",
+                        "-r",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages",
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.8",
+        repo=defs.DebRepo(
+            codename="focal",
+            vendor="ubuntu",
+            sources="debian/repo/storpool.sources",
+            keyring="debian/repo/storpool-keyring.gpg",
+            req_packages=defs.intern_command(
+                ("ca-certificates",),
+            ),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python3",
+                "BINDINGS_PYTHON_CONFGET": "python3-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-tools-generic",
+                "LIBSSL": "libssl1.1",
+                "MCELOG": "bash",
+            },
+        ),
+        systemd_lib="lib/systemd/system",
+        file_ext="deb",
+        initramfs_flavor="update-initramfs",
+        builder=defs.Builder(
+            alias="ubuntu-20.04",
+            base_image="ubuntu:focal",
+            branch="ubuntu/focal",
+            kernel_package="linux-headers",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "UBUNTU1804": defs.Variant(
+        name="UBUNTU1804",
+        descr="Ubuntu 18.04 LTS (Bionic Beaver)",
+        parent="UBUNTU2004",
+        family="debian",
+        detect=defs.Detect(
+            filename="/etc/os-release",
+            regex=defs.lazy_pattern(
+                "^ PRETTY_NAME= .* Ubuntu \\s+ 18 \\. 04 ",
+                re.X,
+            ),
+            os_id="ubuntu",
+            os_version_regex=defs.lazy_pattern(
+                "^18\\.04$",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    (
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "update",
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "--no-install-recommends",
+                        "install",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "dpkg-query",
+                        "-W",
+                        "-f",
+                        "${Package}\\t${Version}\\t${Architecture}\\t${db:Status-Abbrev}\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "purge",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "apt-get",
+                        "-q",
+                        "-y",
+                        "remove",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "env",
+                        "DEBIAN_FRONTEND=noninteractive",
+                        "dpkg",
+                        "-r",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages",
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.6",
+        repo=defs.DebRepo(
+            codename="bionic",
+            vendor="ubuntu",
+            sources="debian/repo/storpool.sources",
+            keyring="debian/repo/storpool-keyring.gpg",
+            req_packages=defs.intern_command(
+                ("ca-certificates",),
+            ),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python",
+                "BINDINGS_PYTHON_CONFGET": "python-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-tools-generic",
+                "LIBSSL": "libssl1.1",
+                "MCELOG": "bash",
+            },
+        ),
+        systemd_lib="lib/systemd/system",
+        file_ext="deb",
+        initramfs_flavor="update-initramfs",
+        builder=defs.Builder(
+            alias="ubuntu-18.04",
+            base_image="ubuntu:bionic",
+            branch="ubuntu/bionic",
+            kernel_package="linux-headers",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "ALMA9": defs.Variant(
+        name="ALMA9",
+        descr="AlmaLinux 9.x",
+        parent="",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/redhat-release",
+            regex=defs.lazy_pattern(
+                "^ AlmaLinux \\s .* \\s 9 \\. [0-9]",
+                re.X,
+            ),
+            os_id="almalinux",
+            os_version_regex=defs.lazy_pattern(
+                "^9(?:$|\\.[0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=False,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "dnf",
+                        "--disablerepo=*",
+                        "--enablerepo=appstream",
+                        "--enablerepo=baseos",
+                        "--enablerepo=crb",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.9",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "bash",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "bash",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="alma9",
+            base_image="almalinux:9",
+            branch="",
+            kernel_package="kernel-core",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "ALMA8": defs.Variant(
+        name="ALMA8",
+        descr="AlmaLinux 8.x",
+        parent="ALMA9",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/redhat-release",
+            regex=defs.lazy_pattern(
+                "^ AlmaLinux \\s .* \\s 8 \\. (?: [4-9] | [1-9][0-9] )",
+                re.X,
+            ),
+            os_id="almalinux",
+            os_version_regex=defs.lazy_pattern(
+                "^8(?:$|\\.[4-9]|\\.[1-9][0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "dnf",
+                        "--disablerepo=*",
+                        "--enablerepo=appstream",
+                        "--enablerepo=baseos",
+                        "--enablerepo=powertools",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.6",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "libcgroup-tools",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "python2-simplejson",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="alma8",
+            base_image="almalinux:8",
+            branch="",
+            kernel_package="kernel-core",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "CENTOS9": defs.Variant(
+        name="CENTOS9",
+        descr="CentOS Stream 9.x",
+        parent="ALMA9",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/redhat-release",
+            regex=defs.lazy_pattern(
+                "^ CentOS Stream release 9",
+                re.X,
+            ),
+            os_id="centos",
+            os_version_regex=defs.lazy_pattern(
+                "^9(?:$|\\.[4-9]|\\.[1-9][0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=False,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "dnf",
+                        "--disablerepo=*",
+                        "--enablerepo=appstream",
+                        "--enablerepo=baseos",
+                        "--enablerepo=crb",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.9",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "bash",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "bash",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="centos9",
+            base_image="quay.io/centos/centos:stream9",
+            branch="centos/9",
+            kernel_package="kernel-core",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "CENTOS8": defs.Variant(
+        name="CENTOS8",
+        descr="CentOS 8.x",
+        parent="ALMA8",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/redhat-release",
+            regex=defs.lazy_pattern(
+                "^ CentOS \\s .* \\s 8 \\. (?: [3-9] | (?: [12][0-9] ) )",
+                re.X,
+            ),
+            os_id="centos",
+            os_version_regex=defs.lazy_pattern(
+                "^8(?:$|\\.[4-9]|\\.[1-9][0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "dnf",
+                        "--disablerepo=*",
+                        "--enablerepo=appstream",
+                        "--enablerepo=baseos",
+                        "--enablerepo=powertools",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.6",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "libcgroup-tools",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "python2-simplejson",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="centos8",
+            base_image="centos:8",
+            branch="centos/8",
+            kernel_package="kernel-core",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "CENTOS7": defs.Variant(
+        name="CENTOS7",
+        descr="CentOS 7.x",
+        parent="CENTOS8",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/redhat-release",
+            regex=defs.lazy_pattern(
+                "^ (?: CentOS | Virtuozzo ) \\s .* \\s 7 \\.",
+                re.X,
+            ),
+            os_id="centos",
+            os_version_regex=defs.lazy_pattern(
+                "^7(?:$|\\.[0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "yum",
+                        "--disablerepo=*",
+                        "--enablerepo=base",
+                        "--enablerepo=updates",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    yum install -y --disablerepo=\'*\' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    yum reinstall -y --disablerepo=\'*\' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.6",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "libcgroup-tools",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "python2-simplejson",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="centos7",
+            base_image="centos:7",
+            branch="centos/7",
+            kernel_package="kernel",
+            utf8_locale="en_US.utf8",
+        ),
+    ),
+    "ORACLE7": defs.Variant(
+        name="ORACLE7",
+        descr="Oracle Linux 7.x",
+        parent="CENTOS7",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/oracle-release",
+            regex=defs.lazy_pattern(
+                "^ Oracle \\s+ Linux \\s .* \\s 7 \\.",
+                re.X,
+            ),
+            os_id="ol",
+            os_version_regex=defs.lazy_pattern(
+                "^7(?:$|\\.[0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "yum",
+                        "--disablerepo=*",
+                        "--enablerepo=base",
+                        "--enablerepo=updates",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    yum install -y --disablerepo=\'*\' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    yum reinstall -y --disablerepo=\'*\' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.6",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "libcgroup-tools",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "python2-simplejson",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="oracle7",
+            base_image="IGNORE",
+            branch="",
+            kernel_package="kernel",
+            utf8_locale="en_US.utf8",
+        ),
+    ),
+    "ORACLE8": defs.Variant(
+        name="ORACLE8",
+        descr="Oracle Linux 8.x",
+        parent="ALMA8",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/oracle-release",
+            regex=defs.lazy_pattern(
+                "^ Oracle \\s+ Linux \\s+ Server \\s+ release \\s .* \\s 8 \\. (?: [4-9] | [1-9][0-9] )",
+                re.X,
+            ),
+            os_id="ol",
+            os_version_regex=defs.lazy_pattern(
+                "^8(?:$|\\.[4-9]|\\.[1-9][0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "dnf",
+                        "--disablerepo=*",
+                        "--enablerepo=ol8_appstream",
+                        "--enablerepo=ol8_baseos_latest",
+                        "--enablerepo=ol8_codeready_builder",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    dnf install -y --disablerepo=\'*\' --enablerepo=ol8_appstream,ol8_baseos_latest,ol8_codeready_builder,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=ol8_appstream,ol8_baseos_latest,ol8_codeready_builder,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.6",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "libcgroup-tools",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "python2-simplejson",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="oracle8",
+            base_image="oraclelinux:8",
+            branch="",
+            kernel_package="kernel-core",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "RHEL8": defs.Variant(
+        name="RHEL8",
+        descr="RedHat Enterprise Linux 8.x",
+        parent="CENTOS8",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/redhat-release",
+            regex=defs.lazy_pattern(
+                "^ Red \\s+ Hat \\s+ Enterprise \\s+ Linux \\s .* \\s 8 \\. (?: [4-9] | [1-9][0-9] )",
+                re.X,
+            ),
+            os_id="rhel",
+            os_version_regex=defs.lazy_pattern(
+                "^8(?:$|\\.[4-9]|\\.[1-9][0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "dnf",
+                        "--disablerepo=*",
+                        "--enablerepo=appstream",
+                        "--enablerepo=baseos",
+                        "--enablerepo=storpool-contrib",
+                        "--enablerepo=codeready-builder-for-rhel-8-x86_64-rpms",
+                        "install",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,codeready-builder-for-rhel-8-x86_64-rpms --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,codeready-builder-for-rhel-8-x86_64-rpms --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.6",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "libcgroup-tools",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "python2-simplejson",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="rhel8",
+            base_image="redhat/ubi8:reg",
+            branch="",
+            kernel_package="kernel-core",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "ROCKY9": defs.Variant(
+        name="ROCKY9",
+        descr="Rocky Linux 9.x",
+        parent="ALMA9",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/redhat-release",
+            regex=defs.lazy_pattern(
+                "^ Rocky \\s+ Linux \\s .* \\s 9 \\. [0-9]",
+                re.X,
+            ),
+            os_id="rocky",
+            os_version_regex=defs.lazy_pattern(
+                "^8(?:$|\\.[0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=False,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "dnf",
+                        "--disablerepo=*",
+                        "--enablerepo=appstream",
+                        "--enablerepo=baseos",
+                        "--enablerepo=crb",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.9",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "bash",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "bash",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="rocky9",
+            base_image="rockylinux:9",
+            branch="",
+            kernel_package="kernel-core",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+    "ROCKY8": defs.Variant(
+        name="ROCKY8",
+        descr="Rocky Linux 8.x",
+        parent="CENTOS8",
+        family="redhat",
+        detect=defs.Detect(
+            filename="/etc/redhat-release",
+            regex=defs.lazy_pattern(
+                "^ Rocky \\s+ Linux \\s .* \\s 8 \\. (?: [4-9] | [1-9][0-9] )",
+                re.X,
+            ),
+            os_id="rocky",
+            os_version_regex=defs.lazy_pattern(
+                "^8(?:$|\\.[4-9]|\\.[1-9][0-9])",
+                0,
+            ),
+        ),
+        supported=defs.Supported(
+            repo=True,
+        ),
+        commands=defs.Commands(
+            package=defs.CommandsPackage(
+                update_db=defs.intern_command(
+                    ("true",),
+                ),
+                install=defs.intern_command(
+                    (
+                        "dnf",
+                        "--disablerepo=*",
+                        "--enablerepo=appstream",
+                        "--enablerepo=baseos",
+                        "--enablerepo=powertools",
+                        "--enablerepo=storpool-contrib",
+                        "install",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                list_all=defs.intern_command(
+                    (
+                        "rpm",
+                        "-qa",
+                        "--qf",
+                        "%{Name}\\t%{EVR}\\t%{Arch}\\tii\\n",
+                        "--",
+                    ),
+                ),
+                purge=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove=defs.intern_command(
+                    (
+                        "yum",
+                        "remove",
+                        "-q",
+                        "-y",
+                        "--",
+                    ),
+                ),
+                remove_impl=defs.intern_command(
+                    (
+                        "rpm",
+                        "-e",
+                        "--",
+                    ),
+                ),
+            ),
+            pkgfile=defs.CommandsPkgFile(
+                dep_query=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        'rpm -qpR -- "$pkg"',
+                    ),
+                ),
+                install=defs.intern_command(
+                    (
+                        "sh",
+                        "-c",
+                        '\nunset to_install to_reinstall\nfor f in $packages; do\n    package="$(rpm -qp "$f")"\n    if rpm -q -- "$package"; then\n        to_reinstall="$to_reinstall ./$f"\n    else\n        to_install="$to_install ./$f"\n    fi\ndone\n\nif [ -n "$to_install" ]; then\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_install\nfi\nif [ -n "$to_reinstall" ]; then\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_reinstall\nfi\n',
+                    ),
+                ),
+            ),
+        ),
+        min_sys_python="3.6",
+        repo=defs.YumRepo(
+            yumdef="redhat/repo/storpool-centos.repo",
+            keyring="redhat/repo/RPM-GPG-KEY-StorPool",
+        ),
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "libcgroup-tools",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PROCPS": "procps-ng",
+                "PYTHON_SIMPLEJSON": "python2-simplejson",
+                "UDEV": "systemd",
+            },
+        ),
+        systemd_lib="usr/lib/systemd/system",
+        file_ext="rpm",
+        initramfs_flavor="mkinitrd",
+        builder=defs.Builder(
+            alias="rocky8",
+            base_image="rockylinux:8",
+            branch="",
+            kernel_package="kernel-core",
+            utf8_locale="C.UTF-8",
+        ),
+    ),
+}
+
+DETECT_ORDER: Final[list[str]] = [
+    "ROCKY8",
+    "ROCKY9",
+    "RHEL8",
+    "ORACLE8",
+    "ORACLE7",
+    "CENTOS7",
+    "CENTOS8",
+    "CENTOS9",
+    "ALMA8",
+    "ALMA9",
+    "UBUNTU1804",
+    "UBUNTU2004",
+    "UBUNTU2204",
+    "UBUNTU2404",
+    "DEBIAN10",
+    "DEBIAN11",
+    "DEBIAN12",
+    "DEBIAN13",
+]
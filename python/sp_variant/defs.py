@@ -5,13 +5,150 @@
 from __future__ import annotations
 
 import dataclasses
+import re
 import sys
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING, Mapping, NamedTuple
 
 
 if TYPE_CHECKING:
     import pathlib
-    from typing import Any, Final, Pattern
+    from typing import Any, Final, Iterable, Iterator, Match, Pattern
+
+    from .vbuild import VariantRegistry
+
+
+class LazyPattern:
+    """A regular expression that is only compiled the first time it is used.
+
+    The `pattern` and `flags` attributes are available right away; the rest of
+    the `re.Pattern` interface is forwarded to the compiled regular expression.
+    Use `lazy_pattern()` to share a single object between all the variants that
+    use the same regular expression.
+    """
+
+    __slots__ = ("_compiled", "flags", "pattern")
+
+    pattern: str
+    """The source text of the regular expression."""
+
+    flags: int
+    """The `re` module flags to compile the regular expression with."""
+
+    _compiled: Pattern[str] | None
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        """Store the pattern and the flags, do not compile anything yet."""
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled = None
+
+    def __repr__(self) -> str:
+        """Provide a Python-esque representation of the pattern."""
+        return f"{type(self).__name__}({self.pattern!r}, {self.flags!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the source text and the flags of two patterns."""
+        if not isinstance(other, LazyPattern):
+            return NotImplemented
+        return (self.pattern, self.flags) == (other.pattern, other.flags)
+
+    def __hash__(self) -> int:
+        """Hash the source text and the flags of the pattern."""
+        return hash((self.pattern, self.flags))
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401  # whatever re.Pattern has
+        """Forward any other attributes to the compiled pattern."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.compiled(), name)
+
+    def compiled(self) -> Pattern[str]:
+        """Compile the regular expression if this has not been done yet."""
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern, self.flags)
+        return self._compiled
+
+    def match(self, string: str, pos: int = 0, endpos: int = sys.maxsize) -> Match[str] | None:
+        """Compile the pattern if needed, try to match it at the start of the string."""
+        return self.compiled().match(string, pos, endpos)
+
+    def fullmatch(self, string: str, pos: int = 0, endpos: int = sys.maxsize) -> Match[str] | None:
+        """Compile the pattern if needed, try to match it against the whole string."""
+        return self.compiled().fullmatch(string, pos, endpos)
+
+    def search(self, string: str, pos: int = 0, endpos: int = sys.maxsize) -> Match[str] | None:
+        """Compile the pattern if needed, look for it anywhere in the string."""
+        return self.compiled().search(string, pos, endpos)
+
+
+_LAZY_PATTERNS: dict[tuple[str, int], LazyPattern] = {}
+
+
+def lazy_pattern(pattern: str, flags: int = 0) -> LazyPattern:
+    """Return a lazily-compiled pattern, shared with any other users of the same one."""
+    key: Final = (pattern, flags)
+    res: Final = _LAZY_PATTERNS.get(key)
+    if res is not None:
+        return res
+
+    return _LAZY_PATTERNS.setdefault(key, LazyPattern(pattern, flags))
+
+
+class FrozenDict(Mapping[str, str]):
+    """A read-only, hashable string-to-string mapping."""
+
+    __slots__ = ("_data", "_hash")
+
+    _data: dict[str, str]
+    _hash: int | None
+
+    def __init__(self, data: Mapping[str, str] | Iterable[tuple[str, str]] = ()) -> None:
+        """Copy the data into an internal dictionary."""
+        self._data = dict(data)
+        self._hash = None
+
+    def __repr__(self) -> str:
+        """Provide a Python-esque representation of the mapping."""
+        return f"{type(self).__name__}({self._data!r})"
+
+    def __getitem__(self, key: str) -> str:
+        """Look a single value up."""
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of elements."""
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the contents to those of any other mapping."""
+        if isinstance(other, FrozenDict):
+            return self._data == other._data
+        if isinstance(other, Mapping):
+            return self._data == dict(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the contents of the mapping; they cannot change anyway."""
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __or__(self, other: Mapping[str, str]) -> FrozenDict:
+        """Return a new mapping with some values added or replaced."""
+        return FrozenDict({**self._data, **other})
+
+
+_COMMANDS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def intern_command(words: Iterable[str]) -> tuple[str, ...]:
+    """Return a command vector, shared with any other users of the same one."""
+    cmd: Final = tuple(words)
+    return _COMMANDS.setdefault(cmd, cmd)
 
 
 class Detect(NamedTuple):
@@ -20,45 +157,45 @@ class Detect(NamedTuple):
     filename: str
     """The name of the file to read."""
 
-    regex: Pattern[str]
+    regex: Pattern[str] | LazyPattern
     """The regular expression pattern to look for in the file."""
 
     os_id: str
     """The "ID" field in the /etc/os-release file."""
 
-    os_version_regex: Pattern[str]
+    os_version_regex: Pattern[str] | LazyPattern
     """The regular expression pattern for the "VERSION_ID" os-release field."""
 
 
 class CommandsPackage(NamedTuple):
     """Variant-specific commands related to OS packages."""
 
-    update_db: list[str]
+    update_db: tuple[str, ...]
     """Make the package manager fetch new data from the upstream repositories."""
 
-    install: list[str]
+    install: tuple[str, ...]
     """Install one or more packages from the upstream repositories."""
 
-    list_all: list[str]
+    list_all: tuple[str, ...]
     """List the currently installed packages."""
 
-    purge: list[str]
+    purge: tuple[str, ...]
     """Remove a package and all its files, including configuration ones."""
 
-    remove: list[str]
+    remove: tuple[str, ...]
     """Remove a package and all its files, possibly leaving configuration ones."""
 
-    remove_impl: list[str]
+    remove_impl: tuple[str, ...]
     """Remove a package using the low-level OS package manager."""
 
 
 class CommandsPkgFile(NamedTuple):
     """Variant-specific commands related to OS package files."""
 
-    dep_query: list[str]
+    dep_query: tuple[str, ...]
     """List the packages that the one in the specified package file depends on."""
 
-    install: list[str]
+    install: tuple[str, ...]
     """Install a package from a locally-fetched file."""
 
 
@@ -87,7 +224,7 @@ class DebRepo(NamedTuple):
     keyring: str
     """The GnuPG keyring file to copy to /usr/share/keyrings/."""
 
-    req_packages: list[str]
+    req_packages: tuple[str, ...]
     """OS packages that need to be installed before `apt-get update` is run."""
 
 
@@ -157,7 +294,7 @@ class Variant(NamedTuple):
     repo: DebRepo | YumRepo
     """The StorPool repository files to install."""
 
-    package: dict[str, str]
+    package: FrozenDict
     """The names of the packages to be used for this variant."""
 
     systemd_lib: str
@@ -224,6 +361,9 @@ class RepoType(NamedTuple):
 VERSION: Final = "3.5.2"
 FORMAT_VERSION: Final = (1, 4)
 
+SOCKET_PATH: Final = "/run/sp-variant.sock"
+"""The default Unix-domain socket that `sp_variant serve` listens on."""
+
 REPO_TYPES: Final = [
     RepoType(name="contrib", extension="", url="https://repo.storpool.com/public/"),
     RepoType(
@@ -254,18 +394,42 @@ class Config:
     args: list[str] | None = None
     """Additional arguments passed to the command."""
 
+    cache_dir: pathlib.Path | None = None
+    """The directory to cache the detected variant in; no caching if None."""
+
     command: str | None = None
     """The main argument: a command to execute, a variant specification to show, etc."""
 
+    fields: list[str] | None = None
+    """Only output these fields of the variant definition, specified as dotted paths."""
+
+    if_changed: str | None = None
+    """Only output the variant data if its fingerprint differs from this one."""
+
+    names: list[str] | None = None
+    """The build variants to display one per line; read from the standard input if None."""
+
     noop: bool = False
     """No-operation mode; display what would have been done."""
 
+    only_missing: bool = False
+    """Only pass the packages that are not installed yet to the package manager."""
+
+    output_format: str = "json"
+    """The format to display the variant data in: "json", "shell", or "cbor"."""
+
+    registry: VariantRegistry | None = None
+    """The variant definitions to use; the default registry if None."""
+
     repodir: pathlib.Path | None = None
     """The path to the directory containing the `add-storpool-repo` data files to install."""
 
     repotype: RepoType = REPO_TYPES[0]
     """Which StorPool repository to configure."""
 
+    socket_path: pathlib.Path | None = None
+    """The Unix-domain socket to listen on for queries."""
+
     verbose: bool = False
     """Verbose operation; display diagnostic output."""
 
@@ -299,15 +463,17 @@ Config.__setattr__ = Config._do_setattr  # type: ignore[method-assign,assignment
 
 def jsonify(obj: Any) -> Any:  # noqa: ANN401  # this needs to operate on, well, anything
     """Return a more readable representation of an object."""
-    if type(obj).__name__.endswith("Pattern") and hasattr(obj, "pattern"):
+    if isinstance(obj, LazyPattern) or (
+        type(obj).__name__.endswith("Pattern") and hasattr(obj, "pattern")
+    ):
         return jsonify(obj.pattern)
 
     if hasattr(obj, "_asdict"):
         return {name: jsonify(value) for name, value in obj._asdict().items()}
-    if isinstance(obj, dict):
+    if isinstance(obj, (dict, FrozenDict)):
         return {name: jsonify(value) for name, value in obj.items()}
 
-    if isinstance(obj, list):
+    if isinstance(obj, (list, tuple)):
         return [jsonify(item) for item in obj]
 
     return obj
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Read the list of installed packages directly from the dpkg status database.
+
+The `/var/lib/dpkg/status` file is memory-mapped and examined one stanza
+at a time by a single regular expression; only the `Package`, `Version`,
+`Architecture`, and `Status` fields of each stanza are decoded. The result is the same as the one
+obtained by parsing the output of the `dpkg-query` command used by
+the Debian-family build variants, without starting a child process.
+
+The journal entries that dpkg leaves in the `updates/` directory next to
+the status file if it was interrupted are not applied; `has_pending_updates()`
+tells the caller to run `dpkg-query` instead if there are any.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import mmap
+import os
+import pathlib
+import re
+import typing
+
+from . import defs
+
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from typing import Final
+
+
+STATUS_PATH: Final = pathlib.Path("/var/lib/dpkg/status")
+"""The default location of the dpkg status database."""
+
+
+class VariantDpkgError(defs.VariantError):
+    """The dpkg status database could not be parsed."""
+
+
+class VariantDpkgNoMatchError(VariantDpkgError):
+    """Some of the patterns did not match any packages, as `dpkg-query` would report."""
+
+    patterns: list[str]
+    """The patterns that did not match any packages."""
+
+    def __init__(self, patterns: list[str]) -> None:
+        """Store the patterns that did not match anything."""
+        super().__init__(
+            "; ".join(f"no packages found matching {pattern}" for pattern in patterns),
+        )
+        self.patterns = patterns
+
+
+_STANZA_RE: Final = re.compile(
+    rb"""
+    ^
+    (?:
+        (?:
+            Package: \x20 (?P<name> [^\n]* )
+            |
+            Status: \x20 (?P<status> [^\n]* )
+            |
+            Version: \x20 (?P<version> [^\n]* )
+            |
+            Architecture: \x20 (?P<arch> [^\n]* )
+            |
+            [^\n]+
+        )
+        (?: \n | \Z )
+    )+
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+"""Match a whole stanza, remember the last value of each of the fields we need."""
+
+
+def _is_installed(status: bytes) -> bool:
+    """Check for the "ii" status abbreviation: selected for installation, installed."""
+    words: Final = status.split()
+    return len(words) == 3 and words[0] == b"install" and words[2] == b"installed"
+
+
+def _format_version(raw: bytes) -> str:
+    """Decode a version string, omit a zero epoch as `dpkg-query` does."""
+    return (raw[2:] if raw.startswith(b"0:") else raw).decode("UTF-8")
+
+
+def _matches(name: str, arch: str, patterns: list[tuple[str, str | None]]) -> bool:
+    """Check whether a package matches any of the `dpkg-query` name[:arch] patterns."""
+    return bool(_matching(name, arch, patterns))
+
+
+def _matching(name: str, arch: str, patterns: list[tuple[str, str | None]]) -> list[int]:
+    """Return the indices of the `dpkg-query` name[:arch] patterns that match a package."""
+    return [
+        idx
+        for idx, (name_pat, arch_pat) in enumerate(patterns)
+        if fnmatch.fnmatchcase(name, name_pat)
+        and (arch_pat is None or fnmatch.fnmatchcase(arch, arch_pat))
+    ]
+
+
+def _parse_patterns(patterns: Iterable[str]) -> list[tuple[str, str | None]]:
+    """Split the patterns into name and optional architecture parts."""
+    result: Final[list[tuple[str, str | None]]] = []
+    for pattern in patterns:
+        name, sep, arch = pattern.partition(":")
+        result.append((name, arch if sep else None))
+    return result
+
+
+def has_pending_updates(path: pathlib.Path | None = None) -> bool:
+    """Check whether an interrupted dpkg run left journal entries next to the status file.
+
+    If the `updates/` directory cannot be examined, assume that there are some.
+    """
+    updates: Final = (path if path is not None else STATUS_PATH).parent / "updates"
+    try:
+        with os.scandir(updates) as entries:
+            return any(entry.name.isdigit() for entry in entries)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return True
+
+
+def _parse(
+    path: pathlib.Path,
+    data: mmap.mmap,
+    pats: list[tuple[str, str | None]] | None,
+    unmatched: set[int],
+) -> Generator[defs.OSPackage, None, None]:
+    """Yield the installed packages, remove the patterns that matched any from `unmatched`."""
+    for stanza in _STANZA_RE.finditer(data):
+        status = stanza.group("status")
+        installed = status is not None and _is_installed(status)
+        if not installed and pats is None:
+            continue
+        raw_name = stanza.group("name")
+        if raw_name is None:
+            if not installed:
+                continue
+            raise VariantDpkgError(
+                f"No Package field in the {path} stanza at offset {stanza.start()}",
+            )
+        name = raw_name.decode("UTF-8")
+        raw_arch = stanza.group("arch")
+        arch = raw_arch.decode("UTF-8") if raw_arch is not None else ""
+        if pats is not None:
+            matching = _matching(name, arch, pats)
+            if not matching:
+                continue
+            unmatched.difference_update(matching)
+        if not installed:
+            continue
+
+        raw_version = stanza.group("version")
+        yield defs.OSPackage(
+            name=name,
+            version=_format_version(raw_version) if raw_version is not None else "",
+            arch=arch,
+            status="installed",
+        )
+
+
+def iter_installed(
+    patterns: Iterable[str] | None = None,
+    *,
+    path: pathlib.Path | None = None,
+) -> Generator[defs.OSPackage, None, None]:
+    """Parse the dpkg status database, yield the installed packages.
+
+    The patterns are matched against the package names in the same way as
+    `dpkg-query -W` does it, shell-style with an optional `:arch` suffix.
+    As with `dpkg-query`, a pattern only needs to match a package known to
+    dpkg, even one that is not installed; `VariantDpkgNoMatchError` is raised
+    after all the matching packages have been yielded if some did not.
+    An `OSError` is raised if the status database cannot be read.
+    The pending journal entries are not applied, see `has_pending_updates()`.
+    """
+    if path is None:
+        path = STATUS_PATH
+    pat_list: Final = list(patterns) if patterns is not None else None
+    pats: Final = _parse_patterns(pat_list) if pat_list is not None else None
+    unmatched: Final = set(range(len(pats))) if pats is not None else set()
+    data: mmap.mmap | None
+    with path.open(mode="rb") as statf:
+        try:
+            data = mmap.mmap(statf.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be mapped; there are no packages in it.
+            data = None
+
+    if data is not None:
+        with data:
+            yield from _parse(path, data, pats, unmatched)
+
+    if pat_list is not None and unmatched:
+        raise VariantDpkgNoMatchError([pat_list[idx] for idx in sorted(unmatched)])
+
+
+__all__ = (
+    "STATUS_PATH",
+    "VariantDpkgError",
+    "VariantDpkgNoMatchError",
+    "has_pending_updates",
+    "iter_installed",
+)
@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""A compact, column-oriented table of OS packages.
+
+A list of `OSPackage` records needs a tuple and four string objects for
+each package. The `PackageTable` class stores all the package names in
+a single string and all the versions in another one, with arrays of
+offsets into them; the architectures and statuses, which only take
+a handful of distinct values, are stored as indices into tuples of
+the distinct strings. An array of row numbers sorted by package name
+groups the packages with the same name, and a small open-addressing hash
+index into it allows packages to be looked up by name without a dictionary.
+"""
+
+from __future__ import annotations
+
+import array
+import typing
+
+from . import defs
+
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from typing import Final
+
+
+class PackageTable:
+    """A read-only, memory-efficient table of OS packages."""
+
+    __slots__ = (
+        "_arch_idx",
+        "_arches",
+        "_by_name",
+        "_index",
+        "_name_off",
+        "_names",
+        "_status_idx",
+        "_statuses",
+        "_version_off",
+        "_versions",
+    )
+
+    _names: str
+    """All the package names concatenated."""
+
+    _name_off: array.array[int]
+    """The offsets of the package names; one more than the number of packages."""
+
+    _versions: str
+    """All the package versions concatenated."""
+
+    _version_off: array.array[int]
+    """The offsets of the package versions; one more than the number of packages."""
+
+    _arches: tuple[str, ...]
+    """The distinct architecture names."""
+
+    _arch_idx: array.array[int]
+    """The index of each package's architecture in `_arches`."""
+
+    _statuses: tuple[str, ...]
+    """The distinct package statuses."""
+
+    _status_idx: array.array[int]
+    """The index of each package's status in `_statuses`."""
+
+    _by_name: array.array[int]
+    """The row numbers sorted by package name, in table order for the same name."""
+
+    _index: array.array[int]
+    """A hash table of one plus the position in `_by_name` of the first row for each name."""
+
+    def __init__(self, pkgs: Iterable[defs.OSPackage] = ()) -> None:
+        """Pack the specified packages into the table, preserving their order."""
+        names: Final[list[str]] = []
+        versions: Final[list[str]] = []
+        self._name_off = array.array("I", [0])
+        self._version_off = array.array("I", [0])
+        self._arch_idx = array.array("H")
+        self._status_idx = array.array("H")
+        arches: Final[dict[str, int]] = {}
+        statuses: Final[dict[str, int]] = {}
+        for pkg in pkgs:
+            names.append(pkg.name)
+            self._name_off.append(self._name_off[-1] + len(pkg.name))
+            versions.append(pkg.version)
+            self._version_off.append(self._version_off[-1] + len(pkg.version))
+            self._arch_idx.append(arches.setdefault(pkg.arch, len(arches)))
+            self._status_idx.append(statuses.setdefault(pkg.status, len(statuses)))
+
+        self._names = "".join(names)
+        self._versions = "".join(versions)
+        self._arches = tuple(arches)
+        self._statuses = tuple(statuses)
+        self._by_name = array.array(
+            "I",
+            sorted(range(len(names)), key=names.__getitem__),
+        )
+        self._index = self._build_index()
+
+    def _build_index(self) -> array.array[int]:
+        """Build a hash table with linear probing, at most half full."""
+        size = 8
+        while size < 2 * len(self._by_name):
+            size *= 2
+        mask: Final = size - 1
+        index: Final = array.array("I", bytes(4 * size))
+        last = None
+        for pos, idx in enumerate(self._by_name):
+            name = self.name(idx)
+            if name == last:
+                continue
+            last = name
+            slot = hash(name) & mask
+            while index[slot]:
+                slot = (slot + 1) & mask
+            index[slot] = pos + 1
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of packages in the table."""
+        return len(self._arch_idx)
+
+    def name(self, idx: int) -> str:
+        """Return the name of the package at the specified row."""
+        return self._names[self._name_off[idx] : self._name_off[idx + 1]]
+
+    def version(self, idx: int) -> str:
+        """Return the version of the package at the specified row."""
+        return self._versions[self._version_off[idx] : self._version_off[idx + 1]]
+
+    def __getitem__(self, idx: int) -> defs.OSPackage:
+        """Build a package record for the specified row."""
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        return defs.OSPackage(
+            name=self.name(idx),
+            version=self.version(idx),
+            arch=self._arches[self._arch_idx[idx]],
+            status=self._statuses[self._status_idx[idx]],
+        )
+
+    def __iter__(self) -> Iterator[defs.OSPackage]:
+        """Build package records for all the rows in table order."""
+        return (self[idx] for idx in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether two tables contain the same packages in the same order."""
+        if not isinstance(other, PackageTable):
+            return NotImplemented
+        return len(self) == len(other) and list(self) == list(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Provide a short description of the table."""
+        return f"<{type(self).__name__} of {len(self)} packages>"
+
+    def _first_row(self, name: str) -> int:
+        """Find the position of the first row with the specified name in `_by_name`.
+
+        Return -1 if there is no such package.
+        """
+        mask: Final = len(self._index) - 1
+        slot = hash(name) & mask
+        while True:
+            value = self._index[slot]
+            if not value:
+                return -1
+            if self.name(self._by_name[value - 1]) == name:
+                return value - 1
+            slot = (slot + 1) & mask
+
+    def rows(self, name: str) -> list[int]:
+        """Return the rows of the packages with the specified name, in table order."""
+        res: Final[list[int]] = []
+        pos = self._first_row(name)
+        if pos == -1:
+            return res
+        while pos < len(self._by_name) and self.name(self._by_name[pos]) == name:
+            res.append(self._by_name[pos])
+            pos += 1
+        return res
+
+    def __contains__(self, item: object) -> bool:
+        """Check for a package name or a full package record."""
+        if isinstance(item, defs.OSPackage):
+            return any(self[idx] == item for idx in self.rows(item.name))
+        if isinstance(item, str):
+            return self._first_row(item) != -1
+        return False
+
+    def find(self, name: str) -> list[defs.OSPackage]:
+        """Return all the packages with the specified name, e.g. for several architectures."""
+        return [self[idx] for idx in self.rows(name)]
+
+    def get_version(self, name: str, arch: str | None = None) -> str | None:
+        """Return the version of the first package with the specified name and architecture."""
+        for idx in self.rows(name):
+            if arch is None or self._arches[self._arch_idx[idx]] == arch:
+                return self.version(idx)
+        return None
+
+    def to_list(self) -> list[defs.OSPackage]:
+        """Build a list of package records in table order."""
+        return list(self)
+
+
+__all__ = ("PackageTable",)
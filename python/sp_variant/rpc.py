@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Answer JSON-RPC 2.0 requests about the build variants on the standard input.
+
+The `sp_variant rpc` command reads newline-delimited JSON-RPC requests and
+writes a single-line response for each one that has an `id` member, so that
+a program written in another language may keep a single child process
+around instead of running `sp_variant` once for each question.
+The methods and their parameters are the same as the ones supported by
+the `sp_variant serve` daemon; see the `sp_variant.server` module.
+Batch requests (JSON arrays) are also supported.
+"""
+
+from __future__ import annotations
+
+import json
+import typing
+
+from . import defs
+from . import serialize
+from . import server
+
+
+if typing.TYPE_CHECKING:
+    from typing import IO, Any, Final
+
+
+JSONRPC_VERSION: Final = "2.0"
+
+PARSE_ERROR: Final = -32700
+"""The request is not valid JSON."""
+
+INVALID_REQUEST: Final = -32600
+"""The request is not a valid JSON-RPC request object."""
+
+METHOD_NOT_FOUND: Final = -32601
+"""The requested method is not supported."""
+
+INVALID_PARAMS: Final = -32602
+"""The parameters of the request are not valid."""
+
+SERVER_ERROR: Final = -32000
+"""The request could not be processed, e.g. the build variant could not be detected."""
+
+
+def _error(req_id: Any, code: int, msg: str) -> dict[str, Any]:  # noqa: ANN401
+    """Build an error response."""
+    return {"jsonrpc": JSONRPC_VERSION, "id": req_id, "error": {"code": code, "message": msg}}
+
+
+def handle_request(handler: server.Handler, req: Any) -> dict[str, Any] | None:  # noqa: ANN401
+    """Handle a single decoded request, return the response unless it is a notification."""
+    if not isinstance(req, dict) or req.get("jsonrpc") != JSONRPC_VERSION:
+        return _error(None, INVALID_REQUEST, "Not a JSON-RPC 2.0 request object")
+
+    req_id: Final = req.get("id")
+    method: Final = req.get("method")
+    params: Final = req.get("params", {})
+    if not isinstance(method, str):
+        return _error(req_id, INVALID_REQUEST, "No 'method' string specified")
+    if not isinstance(params, dict):
+        return _error(req_id, INVALID_PARAMS, "Only by-name parameters are supported")
+
+    try:
+        result: Final = handler.handle(method, params)
+    except server.VariantUnknownMethodError as err:
+        resp = _error(req_id, METHOD_NOT_FOUND, str(err))
+    except server.VariantRequestError as err:
+        resp = _error(req_id, INVALID_PARAMS, str(err))
+    except defs.VariantError as err:
+        resp = _error(req_id, SERVER_ERROR, str(err))
+    except Exception as err:  # noqa: BLE001  # keep the co-process running
+        handler.cfg.diag(f"Could not handle the {method} request: {err!r}")
+        resp = _error(req_id, SERVER_ERROR, f"Could not handle the request: {err}")
+    else:
+        resp = {"jsonrpc": JSONRPC_VERSION, "id": req_id, "result": result}
+
+    return resp if "id" in req else None
+
+
+def respond(handler: server.Handler, line: str | bytes) -> str | None:
+    """Handle a single request line, return the response line, if any."""
+    try:
+        req: Final = json.loads(line)
+    except ValueError as err:
+        return serialize.dumps(_error(None, PARSE_ERROR, str(err)), compact=True) + "\n"
+
+    resp: dict[str, Any] | list[dict[str, Any]] | None
+    if not isinstance(req, list):
+        resp = handle_request(handler, req)
+    elif not req:
+        resp = _error(None, INVALID_REQUEST, "Empty batch request")
+    else:
+        resp = [
+            item for item in (handle_request(handler, single) for single in req) if item is not None
+        ] or None
+
+    if resp is None:
+        return None
+    return serialize.dumps(resp, compact=True) + "\n"
+
+
+def serve(cfg: defs.Config, infile: IO[str], outfile: IO[str]) -> None:
+    """Answer the requests read from the input stream until it is closed."""
+    handler: Final = server.Handler(cfg)
+    for line in infile:
+        if not line.strip():
+            continue
+
+        resp = respond(handler, line)
+        if resp is not None:
+            outfile.write(resp)
+            outfile.flush()
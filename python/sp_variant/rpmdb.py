@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Read the list of installed packages directly from the SQLite RPM database.
+
+Recent versions of RPM (e.g. the ones in RHEL 9 and its derivatives) store
+the package headers in the `/var/lib/rpm/rpmdb.sqlite` database.
+Each header is a binary blob: the number of index entries and the size of
+the data store as 32-bit big-endian integers, the index entries themselves
+(tag, type, offset, count), and the data store. Only the name, epoch,
+version, release, and architecture tags are decoded; the result is
+the same as the one obtained by parsing the output of the `rpm -qa`
+command used by the Red Hat-family build variants.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import pathlib
+import sqlite3
+import struct
+import typing
+
+from . import defs
+
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from typing import Final
+
+
+class VariantRpmdbError(defs.VariantError):
+    """An RPM package header could not be parsed."""
+
+
+DB_PATH: Final = pathlib.Path("/var/lib/rpm/rpmdb.sqlite")
+"""The default location of the SQLite RPM database."""
+
+TAG_NAME: Final = 1000
+"""The package name."""
+
+TAG_VERSION: Final = 1001
+"""The upstream version of the package."""
+
+TAG_RELEASE: Final = 1002
+"""The distribution-specific release of the package."""
+
+TAG_EPOCH: Final = 1003
+"""The epoch of the package version, if any."""
+
+TAG_ARCH: Final = 1022
+"""The architecture the package was built for."""
+
+TYPE_INT32: Final = 4
+"""A 32-bit big-endian integer."""
+
+TYPE_STRING: Final = 6
+"""A single NUL-terminated string."""
+
+_TAGS: Final = {TAG_NAME, TAG_VERSION, TAG_RELEASE, TAG_EPOCH, TAG_ARCH}
+"""The tags that we need to examine."""
+
+_HEADER: Final = struct.Struct(">II")
+"""The number of index entries and the size of the data store."""
+
+_ENTRY: Final = struct.Struct(">iIiI")
+"""A single index entry: tag, type, offset, count."""
+
+_INT32: Final = struct.Struct(">I")
+
+
+def parse_header(blob: bytes) -> dict[int, str | int]:
+    """Decode the name, epoch, version, release, and architecture tags of a header."""
+    try:
+        count, data_len = _HEADER.unpack_from(blob)
+    except struct.error as err:
+        raise VariantRpmdbError(f"Truncated RPM header: {err}") from err
+    data_start: Final = _HEADER.size + _ENTRY.size * count
+    data_end: Final = data_start + data_len
+    if len(blob) < data_end:
+        raise VariantRpmdbError(
+            f"Truncated RPM header: {len(blob)} bytes, expected {data_end}",
+        )
+
+    result: Final[dict[int, str | int]] = {}
+    for tag, tag_type, offset, tag_count in _ENTRY.iter_unpack(blob[_HEADER.size : data_start]):
+        if tag not in _TAGS:
+            continue
+
+        pos = data_start + offset
+        if pos < data_start or pos >= data_end:
+            raise VariantRpmdbError(f"RPM header tag {tag}: invalid offset {offset}")
+        if tag_type == TYPE_STRING:
+            end = blob.find(b"\0", pos, data_end)
+            if end == -1:
+                raise VariantRpmdbError(f"RPM header tag {tag}: unterminated string")
+            result[tag] = blob[pos:end].decode("UTF-8")
+        elif tag_type == TYPE_INT32 and tag_count == 1 and pos + _INT32.size <= data_end:
+            result[tag] = _INT32.unpack_from(blob, pos)[0]
+        else:
+            raise VariantRpmdbError(
+                f"RPM header tag {tag}: unexpected type {tag_type} count {tag_count}",
+            )
+
+    return result
+
+
+def header_to_package(hdr: dict[int, str | int]) -> defs.OSPackage:
+    """Build a package record the same way the `rpm -qa` query format does."""
+    name: Final = hdr.get(TAG_NAME)
+    if not isinstance(name, str):
+        raise VariantRpmdbError("No name in the RPM header")
+    epoch: Final = hdr.get(TAG_EPOCH)
+    evr: Final = f"{hdr.get(TAG_VERSION, '(none)')}-{hdr.get(TAG_RELEASE, '(none)')}"
+    return defs.OSPackage(
+        name=name,
+        version=f"{epoch}:{evr}" if epoch is not None else evr,
+        arch=str(hdr.get(TAG_ARCH, "(none)")),
+        status="installed",
+    )
+
+
+def iter_installed(
+    patterns: Iterable[str] | None = None,
+    *,
+    path: pathlib.Path | None = None,
+) -> Generator[defs.OSPackage, None, None]:
+    """Read the RPM database, yield the installed packages.
+
+    The patterns are shell-style globs matched against the package names,
+    the same as `rpm -qa` does it.
+    An `OSError` is raised if the database cannot be opened or read.
+    """
+    if path is None:
+        path = DB_PATH
+    pats: Final = list(patterns) if patterns is not None else None
+
+    # Report a missing database the same way as any other missing file.
+    path.stat()
+    try:
+        conn: Final = sqlite3.connect(f"{path.absolute().as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error as err:
+        raise OSError(f"Could not open the {path} RPM database: {err}") from err
+
+    try:
+        for (blob,) in conn.execute("SELECT blob FROM Packages ORDER BY hnum"):
+            pkg = header_to_package(parse_header(blob))
+            if pats is None or any(fnmatch.fnmatchcase(pkg.name, pat) for pat in pats):
+                yield pkg
+    except sqlite3.Error as err:
+        raise OSError(f"Could not read the {path} RPM database: {err}") from err
+    finally:
+        conn.close()
+
+
+__all__ = (
+    "DB_PATH",
+    "VariantRpmdbError",
+    "header_to_package",
+    "iter_installed",
+    "parse_header",
+)
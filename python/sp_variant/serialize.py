@@ -0,0 +1,329 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Serialize the variant definitions as JSON, writing the output as it is built.
+
+The output is the same as the one produced by passing the result of
+`defs.jsonify()` to `json.dumps(..., sort_keys=True, indent=2)`, but
+no intermediate tree of dictionaries and lists is built. In compact mode,
+the output is the same as with `separators=(",", ":")` and no indentation.
+The encoder for each type is looked up in a dispatch table; the ones for
+named tuples and subclasses of the supported types are added the first time
+they are needed.
+
+The `flatten()` and `format_shell()` functions provide an alternative
+output format: shell variable assignments that may be passed to `eval`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import operator
+import re
+import shlex
+import typing
+from json import encoder as json_encoder
+from typing import Mapping
+
+from . import defs
+
+
+if typing.TYPE_CHECKING:
+    from typing import IO, Any, Callable, Final, Iterable, Iterator
+
+    _Write = Callable[[str], object]
+    _Encoder = Callable[[Any, _Write, str | None], None]
+
+
+_INDENT: Final = "  "
+
+_encode_string: Final[Callable[[str], str]] = json_encoder.encode_basestring_ascii
+
+
+def _encode_str(obj: str, write: _Write, _indent: str | None) -> None:
+    """Output a quoted string."""
+    write(_encode_string(obj))
+
+
+def _encode_none(_obj: None, write: _Write, _indent: str | None) -> None:
+    """Output a null value."""
+    write("null")
+
+
+def _encode_bool(obj: bool, write: _Write, _indent: str | None) -> None:  # noqa: FBT001
+    """Output a boolean value."""
+    write("true" if obj else "false")
+
+
+def _encode_int(obj: int, write: _Write, _indent: str | None) -> None:
+    """Output an integer."""
+    write(int.__repr__(obj))  # noqa: PLC2801  # ignore any overrides, like `json` does
+
+
+def _encode_float(obj: float, write: _Write, _indent: str | None) -> None:
+    """Output a floating-point number the same way the `json` module does."""
+    if obj != obj:  # noqa: PLR0124  # this is how NaN is detected
+        write("NaN")
+    elif obj in {float("inf"), float("-inf")}:
+        write("Infinity" if obj > 0 else "-Infinity")
+    else:
+        write(float.__repr__(obj))  # noqa: PLC2801  # ignore any overrides, like `json` does
+
+
+def _encode_pattern(
+    obj: re.Pattern[str] | defs.LazyPattern,
+    write: _Write,
+    indent: str | None,
+) -> None:
+    """Output the source text of a regular expression."""
+    encode(obj.pattern, write, indent)
+
+
+def _inner(indent: str | None) -> tuple[str | None, str, str]:
+    """Get the indentation of the members of a container, the separators to use."""
+    if indent is None:
+        return None, "", ":"
+    inner: Final = indent + _INDENT
+    return inner, "\n" + inner, ": "
+
+
+def _encode_items(items: Iterable[tuple[str, Any]], write: _Write, indent: str | None) -> None:
+    """Output a JSON object with its keys already sorted."""
+    inner, newline, colon = _inner(indent)
+    sep = "{" + newline
+    for key, value in items:
+        write(sep)
+        write(_encode_string(key))
+        write(colon)
+        encode(value, write, inner)
+        sep = "," + newline
+
+    if sep[0] == "{":
+        write("{}")
+    else:
+        write("}" if indent is None else "\n" + indent + "}")
+
+
+def _encode_mapping(obj: Mapping[str, Any], write: _Write, indent: str | None) -> None:
+    """Output a dictionary or any other mapping with its keys sorted."""
+    _encode_items(sorted(obj.items(), key=operator.itemgetter(0)), write, indent)
+
+
+def _encode_sequence(obj: list[Any] | tuple[Any, ...], write: _Write, indent: str | None) -> None:
+    """Output a list or a plain tuple."""
+    if not obj:
+        write("[]")
+        return
+
+    inner, newline, _ = _inner(indent)
+    sep = "[" + newline
+    for value in obj:
+        write(sep)
+        encode(value, write, inner)
+        sep = "," + newline
+    write("]" if indent is None else "\n" + indent + "]")
+
+
+def _namedtuple_encoder(cls: type[tuple[Any, ...]]) -> _Encoder:
+    """Build an encoder that outputs the fields of a named tuple in sorted order."""
+    fields: Final[tuple[str, ...]] = cls._fields  # type: ignore[attr-defined]
+    order: Final = sorted(enumerate(fields), key=operator.itemgetter(1))
+
+    def encode_namedtuple(obj: tuple[Any, ...], write: _Write, indent: str | None) -> None:
+        """Output the fields of the named tuple as a JSON object."""
+        _encode_items(((name, obj[idx]) for idx, name in order), write, indent)
+
+    return encode_namedtuple
+
+
+_ENCODERS: Final[dict[type[Any], _Encoder]] = {
+    str: _encode_str,
+    type(None): _encode_none,
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float,
+    dict: _encode_mapping,
+    defs.FrozenDict: _encode_mapping,
+    list: _encode_sequence,
+    tuple: _encode_sequence,
+    re.Pattern: _encode_pattern,
+    defs.LazyPattern: _encode_pattern,
+}
+
+# The order matters: `bool` is a subclass of `int`, named tuples are tuples.
+_BASE_ENCODERS: Final[tuple[tuple[type[Any], _Encoder], ...]] = (
+    (str, _encode_str),
+    (bool, _encode_bool),
+    (int, _encode_int),
+    (float, _encode_float),
+    (Mapping, _encode_mapping),
+    (list, _encode_sequence),
+)
+
+
+def _find_encoder(cls: type[Any]) -> _Encoder:
+    """Figure out how to output an object of a type not in the dispatch table yet."""
+    if issubclass(cls, tuple):
+        return _namedtuple_encoder(cls) if hasattr(cls, "_fields") else _encode_sequence
+
+    for base, base_encoder in _BASE_ENCODERS:
+        if issubclass(cls, base):
+            return base_encoder
+
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+
+def encode(obj: Any, write: _Write, indent: str | None = "") -> None:  # noqa: ANN401
+    """Output a single object of any supported type, indented at the specified level.
+
+    If `indent` is None, output the object on a single line without any whitespace.
+    """
+    cls: Final = type(obj)
+    obj_encoder = _ENCODERS.get(cls)
+    if obj_encoder is None:
+        obj_encoder = _ENCODERS.setdefault(cls, _find_encoder(cls))
+    obj_encoder(obj, write, indent)
+
+
+def dump(obj: Any, stream: IO[str], *, compact: bool = False) -> None:  # noqa: ANN401
+    """Write the JSON representation of the object to a text stream."""
+    encode(obj, stream.write, None if compact else "")
+
+
+def dumps(obj: Any, *, compact: bool = False) -> str:  # noqa: ANN401
+    """Return the JSON representation of the object as a string."""
+    with io.StringIO() as buf:
+        encode(obj, buf.write, None if compact else "")
+        return buf.getvalue()
+
+
+def _format_version() -> dict[str, Any]:
+    """Describe the version of the output format."""
+    return {
+        "version": {
+            "major": defs.FORMAT_VERSION[0],
+            "minor": defs.FORMAT_VERSION[1],
+        },
+    }
+
+
+def build_show_all(
+    variants: Mapping[str, defs.Variant],
+    order: Iterable[defs.Variant],
+) -> dict[str, Any]:
+    """Build the data structure output by `sp_variant show all`."""
+    return {
+        "format": _format_version(),
+        "version": defs.VERSION,
+        "variants": variants,
+        "order": [var.name for var in order],
+    }
+
+
+def build_show(var: defs.Variant) -> dict[str, Any]:
+    """Build the data structure output by `sp_variant show` for a single variant."""
+    return {
+        "format": _format_version(),
+        "version": defs.VERSION,
+        "variant": var,
+    }
+
+
+def resolve_field(obj: Any, path: str) -> Any:  # noqa: ANN401
+    """Look up a field specified as a dotted path, e.g. `builder.utf8_locale`.
+
+    Named tuples are examined by field name and mappings (e.g. `package`) by key.
+    """
+    current: Any = obj
+    for comp in path.split("."):
+        if hasattr(current, "_fields"):
+            fields: tuple[str, ...] = current._fields
+            if comp not in fields:
+                raise defs.VariantConfigError(
+                    f"Invalid field component '{comp}' in '{path}', "
+                    f"should be one of {' '.join(fields)}",
+                )
+            current = getattr(current, comp)
+        elif isinstance(current, Mapping):
+            if comp not in current:
+                raise defs.VariantConfigError(
+                    f"Invalid field component '{comp}' in '{path}', "
+                    f"should be one of {' '.join(sorted(current))}",
+                )
+            current = current[comp]
+        else:
+            raise defs.VariantConfigError(f"Too many field components in '{path}'")
+
+    return current
+
+
+def project(obj: Any, paths: Iterable[str]) -> dict[str, Any]:  # noqa: ANN401
+    """Look up the specified fields, return them keyed by their dotted paths."""
+    return {path: resolve_field(obj, path) for path in paths}
+
+
+def format_projection(values: Mapping[str, Any], *, compact: bool = False) -> str:
+    """Output a single string as is, or the JSON representation of the values.
+
+    A single field that is not a string, a list, or an object is also output
+    without being wrapped in a JSON object, e.g. `true` for a boolean value.
+    """
+    if len(values) == 1:
+        value: Final = next(iter(values.values()))
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (bool, int, float)) or value is None:
+            return dumps(value)
+
+    return dumps(values, compact=compact)
+
+
+def _flat_value(obj: Any) -> str:  # noqa: ANN401
+    """Convert a single value to a string suitable for a shell variable."""
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, bool):
+        return "true" if obj else "false"
+    if obj is None:
+        return ""
+    if isinstance(obj, (int, float)):
+        return repr(obj)
+    if isinstance(obj, (re.Pattern, defs.LazyPattern)):
+        return obj.pattern
+    if isinstance(obj, (list, tuple)):
+        return shlex.join(_flat_value(item) for item in obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} cannot be flattened")
+
+
+def flatten(obj: Any, prefix: str = "") -> Iterator[tuple[str, str]]:  # noqa: ANN401
+    """Walk the fields of named tuples and mappings, yield dotted paths and string values.
+
+    Lists and plain tuples (e.g. commands) are joined into a single shell-quoted string.
+    """
+    if hasattr(obj, "_fields"):
+        fields: Final[tuple[str, ...]] = obj._fields
+        items: Iterable[tuple[str, Any]] = ((name, getattr(obj, name)) for name in sorted(fields))
+    elif isinstance(obj, Mapping):
+        items = sorted(obj.items(), key=operator.itemgetter(0))
+    else:
+        yield prefix, _flat_value(obj)
+        return
+
+    for name, value in items:
+        yield from flatten(value, f"{prefix}.{name}" if prefix else name)
+
+
+def shell_var_name(path: str) -> str:
+    """Build the name of the shell variable for a dotted path, e.g. `SP_VARIANT_BUILDER_ALIAS`."""
+    return "SP_VARIANT_" + re.sub("[^A-Za-z0-9]", "_", path).upper()
+
+
+def format_shell(items: Iterable[tuple[str, str]]) -> str:
+    """Output `SP_VARIANT_*` shell variable assignments, one per line."""
+    return "".join(f"{shell_var_name(path)}={shlex.quote(value)}\n" for path, value in items)
+
+
+def fingerprint(text: str | bytes) -> str:
+    """Return the hexadecimal SHA-256 digest of the `show` command's output."""
+    return hashlib.sha256(text.encode("UTF-8") if isinstance(text, str) else text).hexdigest()
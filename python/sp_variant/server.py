@@ -0,0 +1,303 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Answer queries about the build variants over a Unix-domain socket.
+
+The `sp_variant serve` command keeps the variant definitions and
+the detected build variant in memory and answers requests sent as
+single-line JSON objects, e.g. `{"id": 1, "method": "show", "params":
+{"name": "current"}}`. Each response is also a single-line JSON object
+containing either a `result` or an `error` member, as well as the `id` of
+the request if one was specified.
+
+The supported methods are:
+- `detect`: the name of the build variant for the current host
+- `show`: the same data as `sp_variant show`; the `name` parameter may be
+  a variant name, a builder alias, "current" (the default), or "all"
+- `command`: a distribution-specific command as a list of words;
+  the `command` parameter is a dotted path, e.g. "package.install"
+- `command_list`: all the distribution-specific commands keyed by their paths
+- `package`: the name of an OS package, e.g. the `name` parameter "KMOD"
+- `list_packages`: the installed OS packages, optionally only the ones
+  matching the `patterns` list parameter
+- `features`: the same versions as the ones output by `sp_variant features`
+
+The methods that examine a single variant accept an optional `variant`
+parameter that defaults to the build variant detected for the current host.
+The `sp_variant.rpc` module uses the same methods for JSON-RPC requests.
+The detected variant is remembered until the os-release file changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import socket
+import socketserver
+import stat
+import subprocess  # noqa: S404  # only to catch its errors
+import threading
+import typing
+
+from . import cache
+from . import defs
+from . import serialize
+from . import variant
+from . import vbuild
+from .variant import _OS_RELEASE
+
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Callable, Final
+
+
+class VariantRequestError(defs.VariantError):
+    """An invalid request was received."""
+
+
+class VariantUnknownMethodError(VariantRequestError):
+    """The request specified an unsupported method."""
+
+
+class Handler:
+    """Answer queries about the build variants, remember the detected one."""
+
+    cfg: defs.Config
+    """The runtime configuration, including the variant registry to use."""
+
+    _detected: tuple[cache.FileId, defs.Variant] | None
+    """The detected variant and the identity of the os-release file at the time."""
+
+    _lock: threading.Lock
+    """Serialize the detection of the current variant."""
+
+    def __init__(self, cfg: defs.Config) -> None:
+        """Store the runtime configuration, nothing detected yet."""
+        self.cfg = cfg
+        self._detected = None
+        self._lock = threading.Lock()
+
+    def detect(self) -> defs.Variant:
+        """Detect the current variant unless the os-release file is the same as last time."""
+        with self._lock:
+            fid: Final = cache.file_id(_OS_RELEASE)
+            if self._detected is not None and self._detected[0] == fid:
+                return self._detected[1]
+
+            self.cfg.diag(f"Detecting the build variant, {_OS_RELEASE}: {fid}")
+            var: Final = variant.detect_variant(self.cfg)
+            self._detected = (fid, var)
+            return var
+
+    def find_variant(self, name: str | None) -> defs.Variant:
+        """Detect the current variant or look one up by name or builder alias."""
+        if name is None or name == "current":
+            return self.detect()
+
+        var: Final = vbuild.lookup_variant(self.cfg, name) or vbuild.lookup_by_alias(
+            self.cfg,
+            name,
+        )
+        if var is None:
+            raise VariantRequestError(f"Invalid build variant '{name}'")
+        return var
+
+    def _method_detect(self, _params: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return the name of the detected variant."""
+        return self.detect().name
+
+    def _method_show(self, params: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return the same data as `sp_variant show`."""
+        name: Final = _get_str(params, "name")
+        if name == "all":
+            registry: Final = vbuild.get_registry(self.cfg)
+            registry.build(self.cfg)
+            return serialize.build_show_all(registry.variants, registry.detect_order)
+
+        return serialize.build_show(self.find_variant(name))
+
+    def _method_command(self, params: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return a distribution-specific command."""
+        path: Final = _get_str(params, "command")
+        if path is None:
+            raise VariantRequestError("No 'command' parameter specified")
+
+        var: Final = self.find_variant(_get_str(params, "variant"))
+        cmd: Final = serialize.resolve_field(var.commands, path)
+        if hasattr(cmd, "_fields"):
+            raise VariantRequestError(f"Incomplete command specification '{path}'")
+        return cmd
+
+    def _method_command_list(self, params: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return all the distribution-specific commands."""
+        var: Final = self.find_variant(_get_str(params, "variant"))
+        result: Final[dict[str, tuple[str, ...]]] = {}
+        for cat_name in var.commands._fields:
+            category = getattr(var.commands, cat_name)
+            for cmd_name in category._fields:
+                result[f"{cat_name}.{cmd_name}"] = getattr(category, cmd_name)
+        return result
+
+    def _method_list_packages(self, params: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return the installed OS packages."""
+        patterns: Final = params.get("patterns")
+        if patterns is not None and (
+            not isinstance(patterns, list) or not all(isinstance(pat, str) for pat in patterns)
+        ):
+            raise VariantRequestError("The 'patterns' parameter must be a list of strings")
+
+        var: Final = self.find_variant(_get_str(params, "variant"))
+        try:
+            return variant.list_all_packages(var, patterns)
+        except (OSError, subprocess.CalledProcessError) as err:
+            raise variant.VariantFileError(f"Could not list the installed packages: {err}") from err
+
+    def _method_package(self, params: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return the name of an OS package."""
+        name: Final = _get_str(params, "name")
+        if name is None:
+            raise VariantRequestError("No 'name' parameter specified")
+
+        var: Final = self.find_variant(_get_str(params, "variant"))
+        pkg: Final = var.package.get(name)
+        if pkg is None:
+            raise VariantRequestError(f"No '{name}' package defined for {var.name}")
+        return pkg
+
+    @staticmethod
+    def _method_features(_params: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return the versions output by `sp_variant features`."""
+        return {
+            "repo": "0.2",
+            "variant": defs.VERSION,
+            "format": f"{defs.FORMAT_VERSION[0]}.{defs.FORMAT_VERSION[1]}",
+        }
+
+    def has_method(self, method: str) -> bool:
+        """Check whether the specified method is supported."""
+        return hasattr(self, f"_method_{method}")
+
+    def handle(self, method: str, params: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Invoke a method, return its result, raise a `VariantError` on errors."""
+        if not self.has_method(method):
+            raise VariantUnknownMethodError(f"Unknown method '{method}'")
+        func: Final[Callable[[dict[str, Any]], Any]] = getattr(self, f"_method_{method}")
+        return func(params)
+
+
+def _get_str(params: dict[str, Any], name: str) -> str | None:
+    """Get an optional string parameter."""
+    value: Final = params.get(name)
+    if value is not None and not isinstance(value, str):
+        raise VariantRequestError(f"The '{name}' parameter must be a string")
+    return value
+
+
+def parse_request(line: str | bytes) -> tuple[Any, str, dict[str, Any]]:
+    """Parse a single request line, return the request ID, the method, and the parameters."""
+    try:
+        req: Final = json.loads(line)
+    except ValueError as err:
+        raise VariantRequestError(f"Could not parse the request: {err}") from err
+    if not isinstance(req, dict):
+        raise VariantRequestError("The request must be a JSON object")
+
+    method: Final = req.get("method")
+    params: Final = req.get("params", {})
+    if not isinstance(method, str) or not isinstance(params, dict):
+        raise VariantRequestError(
+            "The request must contain a 'method' string and a 'params' object",
+        )
+    return req.get("id"), method, params
+
+
+def respond(handler: Handler, line: str | bytes) -> str:
+    """Handle a single request line, return the response line."""
+    req_id: Any = None
+    try:
+        req_id, method, params = parse_request(line)
+        resp: dict[str, Any] = {"result": handler.handle(method, params)}
+    except defs.VariantError as err:
+        resp = {"error": str(err)}
+    except Exception as err:  # noqa: BLE001  # do not drop the connection
+        handler.cfg.diag(f"Could not handle the {line!r} request: {err!r}")
+        resp = {"error": f"Could not handle the request: {err}"}
+
+    if req_id is not None:
+        resp["id"] = req_id
+    return serialize.dumps(resp, compact=True) + "\n"
+
+
+class _StreamHandler(socketserver.StreamRequestHandler):
+    """Answer the requests sent over a single connection."""
+
+    server: _Server
+
+    def handle(self) -> None:
+        """Read requests until the client closes the connection."""
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.wfile.write(respond(self.server.handler, line).encode("UTF-8"))
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Listen on a Unix-domain socket, handle each connection in a separate thread."""
+
+    daemon_threads = True
+
+    handler: Handler
+    """The handler shared by all the connections."""
+
+    def __init__(self, path: pathlib.Path, handler: Handler) -> None:
+        """Bind to the socket, store the handler."""
+        self.handler = handler
+        super().__init__(str(path), _StreamHandler)
+
+
+def _remove_stale_socket(cfg: defs.Config, path: pathlib.Path) -> None:
+    """Remove a socket left over by a previous instance of the server.
+
+    Refuse to do that if another instance of the server is still listening on it.
+    """
+    try:
+        if not stat.S_ISSOCK(path.lstat().st_mode):
+            raise defs.VariantConfigError(f"Not a socket: {path}")
+    except FileNotFoundError:
+        return
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+    except ConnectionRefusedError:
+        pass
+    except OSError as err:
+        raise defs.VariantConfigError(f"Could not check the {path} socket: {err}") from err
+    else:
+        raise defs.VariantConfigError(f"Another server is already listening on {path}")
+
+    cfg.diag(f"Removing the stale {path} socket")
+    path.unlink()
+
+
+def serve(cfg: defs.Config) -> None:
+    """Listen for requests on the configured Unix-domain socket until interrupted."""
+    path: Final = cfg.socket_path if cfg.socket_path is not None else pathlib.Path(defs.SOCKET_PATH)
+    handler: Final = Handler(cfg)
+    vbuild.get_registry(cfg).build(cfg)
+    try:
+        handler.detect()
+    except variant.VariantError as err:
+        cfg.diag(f"Could not detect the build variant: {err}")
+
+    _remove_stale_socket(cfg, path)
+    with _Server(path, handler) as server:
+        try:
+            os.chmod(path, 0o666)  # noqa: PTH101,S103  # the data is not secret
+            cfg.diag(f"Listening on {path}")
+            server.serve_forever()
+        except KeyboardInterrupt:
+            cfg.diag("Interrupted")
+        finally:
+            path.unlink(missing_ok=True)
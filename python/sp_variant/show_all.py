@@ -0,0 +1,1911 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""The precomputed output of `sp_variant show all`.
+
+This file is autogenerated from the variant definitions in `vbuild.py`
+using the `sp_build_repo.subst` tool and the `show_all.py.j2` template.
+Do not edit it by hand.
+"""
+
+from __future__ import annotations
+
+import typing
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+SHOW_ALL_FINGERPRINT: Final = "852bd6c28b09d02d57e78cbf39a3cae6b40212c4c933ed3fccf43fe2e7db762b"
+"""The hexadecimal SHA-256 digest of the `show all` output."""
+
+SHOW_ALL: Final = (
+    "{\n"
+    '  "format": {\n'
+    '    "version": {\n'
+    '      "major": 1,\n'
+    '      "minor": 4\n'
+    "    }\n"
+    "  },\n"
+    '  "order": [\n'
+    '    "ROCKY8",\n'
+    '    "ROCKY9",\n'
+    '    "RHEL8",\n'
+    '    "ORACLE8",\n'
+    '    "ORACLE7",\n'
+    '    "CENTOS7",\n'
+    '    "CENTOS8",\n'
+    '    "CENTOS9",\n'
+    '    "ALMA8",\n'
+    '    "ALMA9",\n'
+    '    "UBUNTU1804",\n'
+    '    "UBUNTU2004",\n'
+    '    "UBUNTU2204",\n'
+    '    "UBUNTU2404",\n'
+    '    "DEBIAN10",\n'
+    '    "DEBIAN11",\n'
+    '    "DEBIAN12",\n'
+    '    "DEBIAN13"\n'
+    "  ],\n"
+    '  "variants": {\n'
+    '    "ALMA8": {\n'
+    '      "builder": {\n'
+    '        "alias": "alma8",\n'
+    '        "base_image": "almalinux:8",\n'
+    '        "branch": "",\n'
+    '        "kernel_package": "kernel-core",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "dnf",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=appstream",\n'
+    '            "--enablerepo=baseos",\n'
+    '            "--enablerepo=powertools",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "AlmaLinux 8.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/redhat-release",\n'
+    '        "os_id": "almalinux",\n'
+    '        "os_version_regex": "^8(?:$|\\\\.[4-9]|\\\\.[1-9][0-9])",\n'
+    '        "regex": "^ AlmaLinux \\\\s .* \\\\s 8 \\\\. (?: [4-9] | [1-9][0-9] )"\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.6",\n'
+    '      "name": "ALMA8",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "libcgroup-tools",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "python2-simplejson",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "ALMA9",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "ALMA9": {\n'
+    '      "builder": {\n'
+    '        "alias": "alma9",\n'
+    '        "base_image": "almalinux:9",\n'
+    '        "branch": "",\n'
+    '        "kernel_package": "kernel-core",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "dnf",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=appstream",\n'
+    '            "--enablerepo=baseos",\n'
+    '            "--enablerepo=crb",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "AlmaLinux 9.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/redhat-release",\n'
+    '        "os_id": "almalinux",\n'
+    '        "os_version_regex": "^9(?:$|\\\\.[0-9])",\n'
+    '        "regex": "^ AlmaLinux \\\\s .* \\\\s 9 \\\\. [0-9]"\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.9",\n'
+    '      "name": "ALMA9",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "bash",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "bash",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": false\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "CENTOS7": {\n'
+    '      "builder": {\n'
+    '        "alias": "centos7",\n'
+    '        "base_image": "centos:7",\n'
+    '        "branch": "centos/7",\n'
+    '        "kernel_package": "kernel",\n'
+    '        "utf8_locale": "en_US.utf8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "yum",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=base",\n'
+    '            "--enablerepo=updates",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    yum install -y --disablerepo=\'*\' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    yum reinstall -y --disablerepo=\'*\' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "CentOS 7.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/redhat-release",\n'
+    '        "os_id": "centos",\n'
+    '        "os_version_regex": "^7(?:$|\\\\.[0-9])",\n'
+    '        "regex": "^ (?: CentOS | Virtuozzo ) \\\\s .* \\\\s 7 \\\\."\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.6",\n'
+    '      "name": "CENTOS7",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "libcgroup-tools",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "python2-simplejson",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "CENTOS8",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "CENTOS8": {\n'
+    '      "builder": {\n'
+    '        "alias": "centos8",\n'
+    '        "base_image": "centos:8",\n'
+    '        "branch": "centos/8",\n'
+    '        "kernel_package": "kernel-core",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "dnf",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=appstream",\n'
+    '            "--enablerepo=baseos",\n'
+    '            "--enablerepo=powertools",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "CentOS 8.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/redhat-release",\n'
+    '        "os_id": "centos",\n'
+    '        "os_version_regex": "^8(?:$|\\\\.[4-9]|\\\\.[1-9][0-9])",\n'
+    '        "regex": "^ CentOS \\\\s .* \\\\s 8 \\\\. (?: [3-9] | (?: [12][0-9] ) )"\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.6",\n'
+    '      "name": "CENTOS8",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "libcgroup-tools",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "python2-simplejson",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "ALMA8",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "CENTOS9": {\n'
+    '      "builder": {\n'
+    '        "alias": "centos9",\n'
+    '        "base_image": "quay.io/centos/centos:stream9",\n'
+    '        "branch": "centos/9",\n'
+    '        "kernel_package": "kernel-core",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "dnf",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=appstream",\n'
+    '            "--enablerepo=baseos",\n'
+    '            "--enablerepo=crb",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "CentOS Stream 9.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/redhat-release",\n'
+    '        "os_id": "centos",\n'
+    '        "os_version_regex": "^9(?:$|\\\\.[4-9]|\\\\.[1-9][0-9])",\n'
+    '        "regex": "^ CentOS Stream release 9"\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.9",\n'
+    '      "name": "CENTOS9",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "bash",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "bash",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "ALMA9",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": false\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "DEBIAN10": {\n'
+    '      "builder": {\n'
+    '        "alias": "debian10",\n'
+    '        "base_image": "debian:buster",\n'
+    '        "branch": "debian/buster",\n'
+    '        "kernel_package": "linux-headers",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--no-install-recommends",\n'
+    '            "install",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "dpkg-query",\n'
+    '            "-W",\n'
+    '            "-f",\n'
+    '            "${Package}\\\\t${Version}\\\\t${Architecture}\\\\t${db:Status-Abbrev}\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "purge",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "remove",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "dpkg",\n'
+    '            "-r",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "update"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "dpkg-deb -f -- \\"$pkg\\" \\"Depends\\" | sed -e \\"s/ *, */,/g\\" | tr \\",\\" \\"\\\\n\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Debian 10.x (buster)",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/os-release",\n'
+    '        "os_id": "debian",\n'
+    '        "os_version_regex": "^10$",\n'
+    '        "regex": "^\\n                    PRETTY_NAME= .*\\n                    Debian \\\\s+ GNU/Linux \\\\s+\\n                    (?: buster | 10 ) (?: \\\\s | / )\\n                "\n'
+    "      },\n"
+    '      "family": "debian",\n'
+    '      "file_ext": "deb",\n'
+    '      "initramfs_flavor": "update-initramfs",\n'
+    '      "min_sys_python": "3.7",\n'
+    '      "name": "DEBIAN10",\n'
+    '      "package": {\n'
+    '        "BINDINGS_PYTHON": "python",\n'
+    '        "BINDINGS_PYTHON_CONFGET": "python-confget",\n'
+    '        "BINDINGS_PYTHON_SIMPLEJSON": "python-simplejson",\n'
+    '        "CGROUP": "cgroup-tools",\n'
+    '        "CPUPOWER": "linux-cpupower",\n'
+    '        "LIBSSL": "libssl1.1",\n'
+    '        "MCELOG": "bash"\n'
+    "      },\n"
+    '      "parent": "DEBIAN11",\n'
+    '      "repo": {\n'
+    '        "codename": "buster",\n'
+    '        "keyring": "debian/repo/storpool-keyring.gpg",\n'
+    '        "req_packages": [\n'
+    '          "ca-certificates"\n'
+    "        ],\n"
+    '        "sources": "debian/repo/storpool.sources",\n'
+    '        "vendor": "debian"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": false\n'
+    "      },\n"
+    '      "systemd_lib": "lib/systemd/system"\n'
+    "    },\n"
+    '    "DEBIAN11": {\n'
+    '      "builder": {\n'
+    '        "alias": "debian11",\n'
+    '        "base_image": "debian:bullseye",\n'
+    '        "branch": "debian/bullseye",\n'
+    '        "kernel_package": "linux-headers",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--no-install-recommends",\n'
+    '            "install",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "dpkg-query",\n'
+    '            "-W",\n'
+    '            "-f",\n'
+    '            "${Package}\\\\t${Version}\\\\t${Architecture}\\\\t${db:Status-Abbrev}\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "purge",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "remove",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "dpkg",\n'
+    '            "-r",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "update"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "dpkg-deb -f -- \\"$pkg\\" \\"Depends\\" | sed -e \\"s/ *, */,/g\\" | tr \\",\\" \\"\\\\n\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Debian 11.x (bullseye)",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/os-release",\n'
+    '        "os_id": "debian",\n'
+    '        "os_version_regex": "^11$",\n'
+    '        "regex": "^\\n                    PRETTY_NAME= .*\\n                    Debian \\\\s+ GNU/Linux \\\\s+\\n                    (?: bullseye | 11 ) (?: \\\\s | / )\\n                "\n'
+    "      },\n"
+    '      "family": "debian",\n'
+    '      "file_ext": "deb",\n'
+    '      "initramfs_flavor": "update-initramfs",\n'
+    '      "min_sys_python": "3.9",\n'
+    '      "name": "DEBIAN11",\n'
+    '      "package": {\n'
+    '        "BINDINGS_PYTHON": "python3",\n'
+    '        "BINDINGS_PYTHON_CONFGET": "python3-confget",\n'
+    '        "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",\n'
+    '        "CGROUP": "cgroup-tools",\n'
+    '        "CPUPOWER": "linux-cpupower",\n'
+    '        "LIBSSL": "libssl1.1",\n'
+    '        "MCELOG": "bash"\n'
+    "      },\n"
+    '      "parent": "DEBIAN12",\n'
+    '      "repo": {\n'
+    '        "codename": "bullseye",\n'
+    '        "keyring": "debian/repo/storpool-keyring.gpg",\n'
+    '        "req_packages": [\n'
+    '          "ca-certificates"\n'
+    "        ],\n"
+    '        "sources": "debian/repo/storpool.sources",\n'
+    '        "vendor": "debian"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "lib/systemd/system"\n'
+    "    },\n"
+    '    "DEBIAN12": {\n'
+    '      "builder": {\n'
+    '        "alias": "debian12",\n'
+    '        "base_image": "debian:bookworm",\n'
+    '        "branch": "debian/bookworm",\n'
+    '        "kernel_package": "linux-headers",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--no-install-recommends",\n'
+    '            "install",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "dpkg-query",\n'
+    '            "-W",\n'
+    '            "-f",\n'
+    '            "${Package}\\\\t${Version}\\\\t${Architecture}\\\\t${db:Status-Abbrev}\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "purge",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "remove",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "dpkg",\n'
+    '            "-r",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "update"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "dpkg-deb -f -- \\"$pkg\\" \\"Depends\\" | sed -e \\"s/ *, */,/g\\" | tr \\",\\" \\"\\\\n\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Debian 12.x (bookworm)",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/os-release",\n'
+    '        "os_id": "debian",\n'
+    '        "os_version_regex": "^12$",\n'
+    '        "regex": "^\\n                    PRETTY_NAME= .*\\n                    Debian \\\\s+ GNU/Linux \\\\s+\\n                    (?: bookworm | 12 ) (?: \\\\s | / )\\n                "\n'
+    "      },\n"
+    '      "family": "debian",\n'
+    '      "file_ext": "deb",\n'
+    '      "initramfs_flavor": "update-initramfs",\n'
+    '      "min_sys_python": "3.11",\n'
+    '      "name": "DEBIAN12",\n'
+    '      "package": {\n'
+    '        "BINDINGS_PYTHON": "python3",\n'
+    '        "BINDINGS_PYTHON_CONFGET": "python3-confget",\n'
+    '        "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",\n'
+    '        "CGROUP": "cgroup-tools",\n'
+    '        "CPUPOWER": "linux-cpupower",\n'
+    '        "LIBSSL": "libssl3",\n'
+    '        "MCELOG": "bash"\n'
+    "      },\n"
+    '      "parent": "DEBIAN13",\n'
+    '      "repo": {\n'
+    '        "codename": "bookworm",\n'
+    '        "keyring": "debian/repo/storpool-keyring.gpg",\n'
+    '        "req_packages": [\n'
+    '          "ca-certificates"\n'
+    "        ],\n"
+    '        "sources": "debian/repo/storpool.sources",\n'
+    '        "vendor": "debian"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "lib/systemd/system"\n'
+    "    },\n"
+    '    "DEBIAN13": {\n'
+    '      "builder": {\n'
+    '        "alias": "debian13",\n'
+    '        "base_image": "debian:unstable",\n'
+    '        "branch": "debian/unstable",\n'
+    '        "kernel_package": "linux-headers",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--no-install-recommends",\n'
+    '            "install",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "dpkg-query",\n'
+    '            "-W",\n'
+    '            "-f",\n'
+    '            "${Package}\\\\t${Version}\\\\t${Architecture}\\\\t${db:Status-Abbrev}\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "purge",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "remove",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "dpkg",\n'
+    '            "-r",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "update"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "dpkg-deb -f -- \\"$pkg\\" \\"Depends\\" | sed -e \\"s/ *, */,/g\\" | tr \\",\\" \\"\\\\n\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Debian 13.x (trixie/unstable)",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/os-release",\n'
+    '        "os_id": "debian",\n'
+    '        "os_version_regex": "^13$",\n'
+    '        "regex": "^\\n                    PRETTY_NAME= .*\\n                    Debian \\\\s+ GNU/Linux \\\\s+\\n                    (?: trixie | 13 ) (?: \\\\s | / )\\n                "\n'
+    "      },\n"
+    '      "family": "debian",\n'
+    '      "file_ext": "deb",\n'
+    '      "initramfs_flavor": "update-initramfs",\n'
+    '      "min_sys_python": "3.11",\n'
+    '      "name": "DEBIAN13",\n'
+    '      "package": {\n'
+    '        "BINDINGS_PYTHON": "python3",\n'
+    '        "BINDINGS_PYTHON_CONFGET": "python3-confget",\n'
+    '        "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",\n'
+    '        "CGROUP": "cgroup-tools",\n'
+    '        "CPUPOWER": "linux-cpupower",\n'
+    '        "LIBSSL": "libssl3",\n'
+    '        "MCELOG": "bash"\n'
+    "      },\n"
+    '      "parent": "",\n'
+    '      "repo": {\n'
+    '        "codename": "unstable",\n'
+    '        "keyring": "debian/repo/storpool-keyring.gpg",\n'
+    '        "req_packages": [\n'
+    '          "ca-certificates"\n'
+    "        ],\n"
+    '        "sources": "debian/repo/storpool.sources",\n'
+    '        "vendor": "debian"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": false\n'
+    "      },\n"
+    '      "systemd_lib": "lib/systemd/system"\n'
+    "    },\n"
+    '    "ORACLE7": {\n'
+    '      "builder": {\n'
+    '        "alias": "oracle7",\n'
+    '        "base_image": "IGNORE",\n'
+    '        "branch": "",\n'
+    '        "kernel_package": "kernel",\n'
+    '        "utf8_locale": "en_US.utf8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "yum",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=base",\n'
+    '            "--enablerepo=updates",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    yum install -y --disablerepo=\'*\' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    yum reinstall -y --disablerepo=\'*\' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Oracle Linux 7.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/oracle-release",\n'
+    '        "os_id": "ol",\n'
+    '        "os_version_regex": "^7(?:$|\\\\.[0-9])",\n'
+    '        "regex": "^ Oracle \\\\s+ Linux \\\\s .* \\\\s 7 \\\\."\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.6",\n'
+    '      "name": "ORACLE7",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "libcgroup-tools",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "python2-simplejson",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "CENTOS7",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "ORACLE8": {\n'
+    '      "builder": {\n'
+    '        "alias": "oracle8",\n'
+    '        "base_image": "oraclelinux:8",\n'
+    '        "branch": "",\n'
+    '        "kernel_package": "kernel-core",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "dnf",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=ol8_appstream",\n'
+    '            "--enablerepo=ol8_baseos_latest",\n'
+    '            "--enablerepo=ol8_codeready_builder",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    dnf install -y --disablerepo=\'*\' --enablerepo=ol8_appstream,ol8_baseos_latest,ol8_codeready_builder,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=ol8_appstream,ol8_baseos_latest,ol8_codeready_builder,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Oracle Linux 8.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/oracle-release",\n'
+    '        "os_id": "ol",\n'
+    '        "os_version_regex": "^8(?:$|\\\\.[4-9]|\\\\.[1-9][0-9])",\n'
+    '        "regex": "^ Oracle \\\\s+ Linux \\\\s+ Server \\\\s+ release \\\\s .* \\\\s 8 \\\\. (?: [4-9] | [1-9][0-9] )"\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.6",\n'
+    '      "name": "ORACLE8",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "libcgroup-tools",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "python2-simplejson",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "ALMA8",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "RHEL8": {\n'
+    '      "builder": {\n'
+    '        "alias": "rhel8",\n'
+    '        "base_image": "redhat/ubi8:reg",\n'
+    '        "branch": "",\n'
+    '        "kernel_package": "kernel-core",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "dnf",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=appstream",\n'
+    '            "--enablerepo=baseos",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "--enablerepo=codeready-builder-for-rhel-8-x86_64-rpms",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,codeready-builder-for-rhel-8-x86_64-rpms --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,codeready-builder-for-rhel-8-x86_64-rpms --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "RedHat Enterprise Linux 8.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/redhat-release",\n'
+    '        "os_id": "rhel",\n'
+    '        "os_version_regex": "^8(?:$|\\\\.[4-9]|\\\\.[1-9][0-9])",\n'
+    '        "regex": "^ Red \\\\s+ Hat \\\\s+ Enterprise \\\\s+ Linux \\\\s .* \\\\s 8 \\\\. (?: [4-9] | [1-9][0-9] )"\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.6",\n'
+    '      "name": "RHEL8",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "libcgroup-tools",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "python2-simplejson",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "CENTOS8",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "ROCKY8": {\n'
+    '      "builder": {\n'
+    '        "alias": "rocky8",\n'
+    '        "base_image": "rockylinux:8",\n'
+    '        "branch": "",\n'
+    '        "kernel_package": "kernel-core",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "dnf",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=appstream",\n'
+    '            "--enablerepo=baseos",\n'
+    '            "--enablerepo=powertools",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Rocky Linux 8.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/redhat-release",\n'
+    '        "os_id": "rocky",\n'
+    '        "os_version_regex": "^8(?:$|\\\\.[4-9]|\\\\.[1-9][0-9])",\n'
+    '        "regex": "^ Rocky \\\\s+ Linux \\\\s .* \\\\s 8 \\\\. (?: [4-9] | [1-9][0-9] )"\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.6",\n'
+    '      "name": "ROCKY8",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "libcgroup-tools",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "python2-simplejson",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "CENTOS8",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "ROCKY9": {\n'
+    '      "builder": {\n'
+    '        "alias": "rocky9",\n'
+    '        "base_image": "rockylinux:9",\n'
+    '        "branch": "",\n'
+    '        "kernel_package": "kernel-core",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "dnf",\n'
+    '            "--disablerepo=*",\n'
+    '            "--enablerepo=appstream",\n'
+    '            "--enablerepo=baseos",\n'
+    '            "--enablerepo=crb",\n'
+    '            "--enablerepo=storpool-contrib",\n'
+    '            "install",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "rpm",\n'
+    '            "-qa",\n'
+    '            "--qf",\n'
+    '            "%{Name}\\\\t%{EVR}\\\\t%{Arch}\\\\tii\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "yum",\n'
+    '            "remove",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "rpm",\n'
+    '            "-e",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "true"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "rpm -qpR -- \\"$pkg\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "\\nunset to_install to_reinstall\\nfor f in $packages; do\\n    package=\\"$(rpm -qp \\"$f\\")\\"\\n    if rpm -q -- \\"$package\\"; then\\n        to_reinstall=\\"$to_reinstall ./$f\\"\\n    else\\n        to_install=\\"$to_install ./$f\\"\\n    fi\\ndone\\n\\nif [ -n \\"$to_install\\" ]; then\\n    dnf install -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_install\\nfi\\nif [ -n \\"$to_reinstall\\" ]; then\\n    dnf reinstall -y --disablerepo=\'*\' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall\\nfi\\n"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Rocky Linux 9.x",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/redhat-release",\n'
+    '        "os_id": "rocky",\n'
+    '        "os_version_regex": "^8(?:$|\\\\.[0-9])",\n'
+    '        "regex": "^ Rocky \\\\s+ Linux \\\\s .* \\\\s 9 \\\\. [0-9]"\n'
+    "      },\n"
+    '      "family": "redhat",\n'
+    '      "file_ext": "rpm",\n'
+    '      "initramfs_flavor": "mkinitrd",\n'
+    '      "min_sys_python": "3.9",\n'
+    '      "name": "ROCKY9",\n'
+    '      "package": {\n'
+    '        "KMOD": "kmod",\n'
+    '        "LIBCGROUP": "bash",\n'
+    '        "LIBUDEV": "systemd-libs",\n'
+    '        "OPENSSL": "openssl-libs",\n'
+    '        "PERL_AUTODIE": "perl-autodie",\n'
+    '        "PERL_FILE_PATH": "perl-File-Path",\n'
+    '        "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",\n'
+    '        "PERL_SYS_SYSLOG": "perl-Sys-Syslog",\n'
+    '        "PROCPS": "procps-ng",\n'
+    '        "PYTHON_SIMPLEJSON": "bash",\n'
+    '        "UDEV": "systemd"\n'
+    "      },\n"
+    '      "parent": "ALMA9",\n'
+    '      "repo": {\n'
+    '        "keyring": "redhat/repo/RPM-GPG-KEY-StorPool",\n'
+    '        "yumdef": "redhat/repo/storpool-centos.repo"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": false\n'
+    "      },\n"
+    '      "systemd_lib": "usr/lib/systemd/system"\n'
+    "    },\n"
+    '    "UBUNTU1804": {\n'
+    '      "builder": {\n'
+    '        "alias": "ubuntu-18.04",\n'
+    '        "base_image": "ubuntu:bionic",\n'
+    '        "branch": "ubuntu/bionic",\n'
+    '        "kernel_package": "linux-headers",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--no-install-recommends",\n'
+    '            "install",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "dpkg-query",\n'
+    '            "-W",\n'
+    '            "-f",\n'
+    '            "${Package}\\\\t${Version}\\\\t${Architecture}\\\\t${db:Status-Abbrev}\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "purge",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "remove",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "dpkg",\n'
+    '            "-r",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "update"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "dpkg-deb -f -- \\"$pkg\\" \\"Depends\\" | sed -e \\"s/ *, */,/g\\" | tr \\",\\" \\"\\\\n\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Ubuntu 18.04 LTS (Bionic Beaver)",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/os-release",\n'
+    '        "os_id": "ubuntu",\n'
+    '        "os_version_regex": "^18\\\\.04$",\n'
+    '        "regex": "^ PRETTY_NAME= .* Ubuntu \\\\s+ 18 \\\\. 04 "\n'
+    "      },\n"
+    '      "family": "debian",\n'
+    '      "file_ext": "deb",\n'
+    '      "initramfs_flavor": "update-initramfs",\n'
+    '      "min_sys_python": "3.6",\n'
+    '      "name": "UBUNTU1804",\n'
+    '      "package": {\n'
+    '        "BINDINGS_PYTHON": "python",\n'
+    '        "BINDINGS_PYTHON_CONFGET": "python-confget",\n'
+    '        "BINDINGS_PYTHON_SIMPLEJSON": "python-simplejson",\n'
+    '        "CGROUP": "cgroup-tools",\n'
+    '        "CPUPOWER": "linux-tools-generic",\n'
+    '        "LIBSSL": "libssl1.1",\n'
+    '        "MCELOG": "bash"\n'
+    "      },\n"
+    '      "parent": "UBUNTU2004",\n'
+    '      "repo": {\n'
+    '        "codename": "bionic",\n'
+    '        "keyring": "debian/repo/storpool-keyring.gpg",\n'
+    '        "req_packages": [\n'
+    '          "ca-certificates"\n'
+    "        ],\n"
+    '        "sources": "debian/repo/storpool.sources",\n'
+    '        "vendor": "ubuntu"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "lib/systemd/system"\n'
+    "    },\n"
+    '    "UBUNTU2004": {\n'
+    '      "builder": {\n'
+    '        "alias": "ubuntu-20.04",\n'
+    '        "base_image": "ubuntu:focal",\n'
+    '        "branch": "ubuntu/focal",\n'
+    '        "kernel_package": "linux-headers",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--no-install-recommends",\n'
+    '            "install",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "dpkg-query",\n'
+    '            "-W",\n'
+    '            "-f",\n'
+    '            "${Package}\\\\t${Version}\\\\t${Architecture}\\\\t${db:Status-Abbrev}\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "purge",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "remove",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "dpkg",\n'
+    '            "-r",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "update"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "dpkg-deb -f -- \\"$pkg\\" \\"Depends\\" | sed -e \\"s/ *, */,/g\\" | tr \\",\\" \\"\\\\n\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Ubuntu 20.04 LTS (Focal Fossa)",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/os-release",\n'
+    '        "os_id": "ubuntu",\n'
+    '        "os_version_regex": "^20\\\\.04$",\n'
+    '        "regex": "^ PRETTY_NAME= .* (?: Ubuntu \\\\s+ 20 \\\\. 04 | Mint \\\\s+ 20 ) "\n'
+    "      },\n"
+    '      "family": "debian",\n'
+    '      "file_ext": "deb",\n'
+    '      "initramfs_flavor": "update-initramfs",\n'
+    '      "min_sys_python": "3.8",\n'
+    '      "name": "UBUNTU2004",\n'
+    '      "package": {\n'
+    '        "BINDINGS_PYTHON": "python3",\n'
+    '        "BINDINGS_PYTHON_CONFGET": "python3-confget",\n'
+    '        "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",\n'
+    '        "CGROUP": "cgroup-tools",\n'
+    '        "CPUPOWER": "linux-tools-generic",\n'
+    '        "LIBSSL": "libssl1.1",\n'
+    '        "MCELOG": "bash"\n'
+    "      },\n"
+    '      "parent": "UBUNTU2204",\n'
+    '      "repo": {\n'
+    '        "codename": "focal",\n'
+    '        "keyring": "debian/repo/storpool-keyring.gpg",\n'
+    '        "req_packages": [\n'
+    '          "ca-certificates"\n'
+    "        ],\n"
+    '        "sources": "debian/repo/storpool.sources",\n'
+    '        "vendor": "ubuntu"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "lib/systemd/system"\n'
+    "    },\n"
+    '    "UBUNTU2204": {\n'
+    '      "builder": {\n'
+    '        "alias": "ubuntu-22.04",\n'
+    '        "base_image": "ubuntu:jammy",\n'
+    '        "branch": "ubuntu/jammy",\n'
+    '        "kernel_package": "linux-headers",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--no-install-recommends",\n'
+    '            "install",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "dpkg-query",\n'
+    '            "-W",\n'
+    '            "-f",\n'
+    '            "${Package}\\\\t${Version}\\\\t${Architecture}\\\\t${db:Status-Abbrev}\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "purge",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "remove",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "dpkg",\n'
+    '            "-r",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "update"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "dpkg-deb -f -- \\"$pkg\\" \\"Depends\\" | sed -e \\"s/ *, */,/g\\" | tr \\",\\" \\"\\\\n\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Ubuntu 22.04 LTS (Jammy Jellyfish)",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/os-release",\n'
+    '        "os_id": "ubuntu",\n'
+    '        "os_version_regex": "^22\\\\.04$",\n'
+    '        "regex": "^ PRETTY_NAME= .* (?: Ubuntu \\\\s+ 22 \\\\. 04 | Mint \\\\s+ 21 ) "\n'
+    "      },\n"
+    '      "family": "debian",\n'
+    '      "file_ext": "deb",\n'
+    '      "initramfs_flavor": "update-initramfs",\n'
+    '      "min_sys_python": "3.10",\n'
+    '      "name": "UBUNTU2204",\n'
+    '      "package": {\n'
+    '        "BINDINGS_PYTHON": "python3",\n'
+    '        "BINDINGS_PYTHON_CONFGET": "python3-confget",\n'
+    '        "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",\n'
+    '        "CGROUP": "cgroup-tools",\n'
+    '        "CPUPOWER": "linux-tools-generic",\n'
+    '        "LIBSSL": "libssl3",\n'
+    '        "MCELOG": "bash"\n'
+    "      },\n"
+    '      "parent": "UBUNTU2404",\n'
+    '      "repo": {\n'
+    '        "codename": "jammy",\n'
+    '        "keyring": "debian/repo/storpool-keyring.gpg",\n'
+    '        "req_packages": [\n'
+    '          "ca-certificates"\n'
+    "        ],\n"
+    '        "sources": "debian/repo/storpool.sources",\n'
+    '        "vendor": "ubuntu"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": true\n'
+    "      },\n"
+    '      "systemd_lib": "lib/systemd/system"\n'
+    "    },\n"
+    '    "UBUNTU2404": {\n'
+    '      "builder": {\n'
+    '        "alias": "ubuntu-24.04",\n'
+    '        "base_image": "ubuntu:noble",\n'
+    '        "branch": "ubuntu/noble",\n'
+    '        "kernel_package": "linux-headers",\n'
+    '        "utf8_locale": "C.UTF-8"\n'
+    "      },\n"
+    '      "commands": {\n'
+    '        "package": {\n'
+    '          "install": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "--no-install-recommends",\n'
+    '            "install",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "list_all": [\n'
+    '            "dpkg-query",\n'
+    '            "-W",\n'
+    '            "-f",\n'
+    '            "${Package}\\\\t${Version}\\\\t${Architecture}\\\\t${db:Status-Abbrev}\\\\n",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "purge": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "purge",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "remove",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "remove_impl": [\n'
+    '            "env",\n'
+    '            "DEBIAN_FRONTEND=noninteractive",\n'
+    '            "dpkg",\n'
+    '            "-r",\n'
+    '            "--"\n'
+    "          ],\n"
+    '          "update_db": [\n'
+    '            "apt-get",\n'
+    '            "-q",\n'
+    '            "-y",\n'
+    '            "update"\n'
+    "          ]\n"
+    "        },\n"
+    '        "pkgfile": {\n'
+    '          "dep_query": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "dpkg-deb -f -- \\"$pkg\\" \\"Depends\\" | sed -e \\"s/ *, */,/g\\" | tr \\",\\" \\"\\\\n\\""\n'
+    "          ],\n"
+    '          "install": [\n'
+    '            "sh",\n'
+    '            "-c",\n'
+    '            "env DEBIAN_FRONTEND=noninteractive apt-get install --no-install-recommends --reinstall -y -o DPkg::Options::=--force-confnew -- $packages"\n'
+    "          ]\n"
+    "        }\n"
+    "      },\n"
+    '      "descr": "Ubuntu 24.04 LTS (Noble Numbat)",\n'
+    '      "detect": {\n'
+    '        "filename": "/etc/os-release",\n'
+    '        "os_id": "ubuntu",\n'
+    '        "os_version_regex": "^24\\\\.04$",\n'
+    '        "regex": "^ PRETTY_NAME= .* Ubuntu \\\\s+ .* Noble "\n'
+    "      },\n"
+    '      "family": "debian",\n'
+    '      "file_ext": "deb",\n'
+    '      "initramfs_flavor": "update-initramfs",\n'
+    '      "min_sys_python": "3.12",\n'
+    '      "name": "UBUNTU2404",\n'
+    '      "package": {\n'
+    '        "BINDINGS_PYTHON": "python3",\n'
+    '        "BINDINGS_PYTHON_CONFGET": "python3-confget",\n'
+    '        "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",\n'
+    '        "CGROUP": "cgroup-tools",\n'
+    '        "CPUPOWER": "linux-tools-generic",\n'
+    '        "LIBSSL": "libssl3",\n'
+    '        "MCELOG": "bash"\n'
+    "      },\n"
+    '      "parent": "DEBIAN13",\n'
+    '      "repo": {\n'
+    '        "codename": "noble",\n'
+    '        "keyring": "debian/repo/storpool-keyring.gpg",\n'
+    '        "req_packages": [\n'
+    '          "ca-certificates"\n'
+    "        ],\n"
+    '        "sources": "debian/repo/storpool.sources",\n'
+    '        "vendor": "ubuntu"\n'
+    "      },\n"
+    '      "supported": {\n'
+    '        "repo": false\n'
+    "      },\n"
+    '      "systemd_lib": "lib/systemd/system"\n'
+    "    }\n"
+    "  },\n"
+    '  "version": "3.5.2"\n'
+    "}\n"
+)
+"""The exact `show all` output, including the final newline."""
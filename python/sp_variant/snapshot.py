@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Remember the list of installed packages until the package database changes.
+
+The `take()` function lists the installed packages and stores them in
+the cache directory together with the identity (device, inode, size,
+modification time) of the package database files. The next time it is
+invoked, the stored list is returned as long as none of these files has
+changed, without running the package manager or reading its database.
+The `diff_packages()` function compares two lists of packages, so that
+only the changes need to be sent along.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import typing
+from typing import NamedTuple
+
+from . import cache
+from . import defs
+from . import variant
+
+
+if typing.TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from typing import Any, Final
+
+
+SNAPSHOT_FORMAT: Final = 1
+"""The version of the snapshot file format."""
+
+_SNAPSHOT_MAGIC: Final = "sp-variant-packages-snapshot"
+
+_DB_FILES: Final = {
+    "debian": ("/var/lib/dpkg/status",),
+    "redhat": (
+        "/var/lib/rpm/rpmdb.sqlite",
+        "/var/lib/rpm/rpmdb.sqlite-wal",
+        "/var/lib/rpm/Packages",
+    ),
+}
+"""The files that the package manager updates whenever a package is installed or removed."""
+
+
+class PackageSnapshot(NamedTuple):
+    """The installed packages and the state of the package database at the time."""
+
+    variant: str
+    """The name of the build variant that the packages were listed for."""
+
+    patterns: tuple[str, ...] | None
+    """The patterns that the package names were matched against, if any."""
+
+    files: dict[str, cache.FileId]
+    """The identity of the package database files."""
+
+    packages: tuple[defs.OSPackage, ...]
+    """The installed packages."""
+
+
+class PackageChange(NamedTuple):
+    """A package that was added, removed, or installed in a different version."""
+
+    kind: str
+    """"added", "removed", or "upgraded"; the latter also covers downgrades."""
+
+    old: defs.OSPackage | None
+    """The package as it was before, if it was installed."""
+
+    new: defs.OSPackage | None
+    """The package as it is now, if it is installed."""
+
+
+def snapshot_filename(var: defs.Variant, patterns: Iterable[str] | None = None) -> str:
+    """Get the name of the file within the cache directory to store the snapshot in.
+
+    Each set of patterns gets its own file, so that callers that alternate between
+    several ones do not overwrite each other's snapshots.
+    """
+    key: Final = json.dumps(list(patterns) if patterns is not None else None)
+    digest: Final = hashlib.sha256(key.encode("UTF-8")).hexdigest()[:16]
+    return f"packages-{var.name}-{digest}.json"
+
+
+def database_files(var: defs.Variant) -> dict[str, cache.FileId]:
+    """Obtain the identity of the package database files for the variant's OS family."""
+    return {name: cache.file_id(name) for name in _DB_FILES.get(var.family, ())}
+
+
+def _parse_file_id(raw: Any) -> cache.FileId:  # noqa: ANN401
+    """Validate a stored file identity."""
+    if raw is None:
+        return None
+    if not isinstance(raw, list) or len(raw) != 4 or not all(isinstance(v, int) for v in raw):
+        raise TypeError(f"unexpected file identity {raw!r}")
+    return (raw[0], raw[1], raw[2], raw[3])
+
+
+def _read(cfg: defs.Config, path: pathlib.Path) -> PackageSnapshot | None:
+    """Read a stored snapshot, return None if it is missing or invalid."""
+    try:
+        with path.open(encoding="UTF-8") as snapf:
+            raw: Final[Any] = json.load(snapf)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as err:
+        cfg.diag(f"Could not read the {path} package snapshot: {err}")
+        return None
+
+    try:
+        if raw["format"] != [_SNAPSHOT_MAGIC, SNAPSHOT_FORMAT]:
+            cfg.diag(f"Ignoring the {path} package snapshot: unexpected format")
+            return None
+
+        return PackageSnapshot(
+            variant=raw["variant"],
+            patterns=tuple(raw["patterns"]) if raw["patterns"] is not None else None,
+            files={name: _parse_file_id(fid) for name, fid in raw["files"].items()},
+            packages=tuple(itertools.starmap(defs.OSPackage, raw["packages"])),
+        )
+    except (KeyError, TypeError, AttributeError) as err:
+        cfg.diag(f"Ignoring the {path} package snapshot: {err!r}")
+        return None
+
+
+def _load(
+    cfg: defs.Config,
+    var: defs.Variant,
+    patterns: tuple[str, ...] | None,
+    files: dict[str, cache.FileId],
+) -> PackageSnapshot | None:
+    """Return the stored snapshot if it is for the same database files and patterns."""
+    if cfg.cache_dir is None:
+        return None
+
+    path: Final = cfg.cache_dir / snapshot_filename(var, patterns)
+    stored: Final = _read(cfg, path)
+    if stored is None:
+        return None
+    if stored.variant != var.name or stored.patterns != patterns:
+        cfg.diag(f"Ignoring the {path} package snapshot: different query")
+        return None
+    if stored.files != files:
+        cfg.diag(f"The package database has changed, ignoring the {path} package snapshot")
+        return None
+    return stored
+
+
+def _store(cfg: defs.Config, var: defs.Variant, snap: PackageSnapshot) -> None:
+    """Write the snapshot to the cache directory."""
+    contents: Final = json.dumps(
+        {
+            "format": [_SNAPSHOT_MAGIC, SNAPSHOT_FORMAT],
+            "variant": snap.variant,
+            "patterns": snap.patterns,
+            "files": snap.files,
+            "packages": snap.packages,
+        },
+    )
+    cache.write_file(
+        cfg,
+        snapshot_filename(var, snap.patterns),
+        contents + "\n",
+        "package snapshot",
+    )
+
+
+def take(
+    cfg: defs.Config,
+    var: defs.Variant,
+    patterns: Iterable[str] | None = None,
+) -> PackageSnapshot:
+    """List the installed packages unless the package database has not changed.
+
+    The snapshots are stored in `cfg.cache_dir`, one for each set of patterns;
+    if that is None, the packages are listed every time and nothing is stored.
+    If there are no known package database files for the variant's OS family,
+    or if the database is being modified while the packages are listed,
+    the packages will be listed again the next time.
+    """
+    pats: Final = tuple(patterns) if patterns is not None else None
+    files: Final = database_files(var)
+    cacheable: Final = any(fid is not None for fid in files.values())
+    if cacheable:
+        stored: Final = _load(cfg, var, pats, files)
+        if stored is not None:
+            return stored
+
+    snap: Final = PackageSnapshot(
+        variant=var.name,
+        patterns=pats,
+        files=files,
+        packages=tuple(variant.iter_all_packages(var, pats)),
+    )
+    if cacheable and database_files(var) == files:
+        _store(cfg, var, snap)
+    return snap
+
+
+def _by_key(pkgs: Iterable[defs.OSPackage]) -> dict[tuple[str, str], list[defs.OSPackage]]:
+    """Group the packages by name and architecture."""
+    res: Final[dict[tuple[str, str], list[defs.OSPackage]]] = {}
+    for pkg in pkgs:
+        res.setdefault((pkg.name, pkg.arch), []).append(pkg)
+    return res
+
+
+def diff_packages(
+    old: Iterable[defs.OSPackage],
+    new: Iterable[defs.OSPackage],
+) -> Generator[PackageChange, None, None]:
+    """Compare two lists of packages, yield the changes sorted by name and architecture.
+
+    A package is considered upgraded if a single version of it was installed
+    before and a single, different version is installed now; if several versions
+    of the same package may be installed at the same time (e.g. the Linux kernel
+    on Red Hat-family systems), the separate versions are reported as added or
+    removed.
+    """
+    old_keys: Final = _by_key(old)
+    new_keys: Final = _by_key(new)
+    for key in sorted(old_keys.keys() | new_keys.keys()):
+        before = {pkg.version: pkg for pkg in old_keys.get(key, [])}
+        after = {pkg.version: pkg for pkg in new_keys.get(key, [])}
+        removed = [pkg for version, pkg in before.items() if version not in after]
+        added = [pkg for version, pkg in after.items() if version not in before]
+        if len(before) == 1 and len(after) == 1 and removed and added:
+            yield PackageChange(kind="upgraded", old=removed[0], new=added[0])
+            continue
+
+        for pkg in removed:
+            yield PackageChange(kind="removed", old=pkg, new=None)
+        for pkg in added:
+            yield PackageChange(kind="added", old=None, new=pkg)
+
+
+__all__ = (
+    "SNAPSHOT_FORMAT",
+    "PackageChange",
+    "PackageSnapshot",
+    "database_files",
+    "diff_packages",
+    "snapshot_filename",
+    "take",
+)
@@ -6,10 +6,9 @@ from __future__ import annotations
 
 import errno
 import pathlib
-import shlex
-import subprocess
 import typing
 
+from . import cache
 from . import defs
 from . import vbuild
 from . import yaiparser
@@ -19,11 +18,14 @@ from .defs import (
     Variant,
     VariantError,
 )
+from .vbuild import VariantRegistry
 from .vbuild import update_namedtuple
 
 
 if typing.TYPE_CHECKING:
-    from typing import Final, Iterable
+    from typing import Any, Callable, Final, Generator, Iterable, Iterator, Literal
+
+    from . import pkgtable
 
 
 class VariantKeyError(VariantError):
@@ -58,15 +60,27 @@ class VariantDetectError(VariantError):
     """An error that occurred during the detection of a variant."""
 
 
+class VariantQueryError(VariantError):
+    """The `sp_variant serve` daemon could not answer a query."""
+
+
 _DEFAULT_CONFIG = Config()
 
 SAFEENC = "Latin-1"
 
 
-def _detect_from_os_release(cfg: Config) -> Variant | None:
+_OS_RELEASE: Final = "/etc/os-release"
+
+
+def _detect_from_os_release(
+    cfg: Config,
+    registry: VariantRegistry,
+    files: dict[str, cache.FileId],
+) -> Variant | None:
     """Try to match the contents of /etc/os-release with a known variant."""
+    files[_OS_RELEASE] = cache.file_id(_OS_RELEASE)
     try:
-        data: Final = yaiparser.YAIParser("/etc/os-release").parse()
+        data: Final = yaiparser.YAIParser(_OS_RELEASE).parse()
     except OSError as err:
         if err.errno != errno.ENOENT:
             raise
@@ -76,45 +90,88 @@ def _detect_from_os_release(cfg: Config) -> Variant | None:
 
     if os_id is not None and os_version is not None:
         cfg.diag(f"Matching os-release id {os_id!r} version {os_version!r}")
-        for var in vbuild.DETECT_ORDER:
+        for var in registry.detect_by_os_id.get(os_id, []):
             cfg.diag(f"- trying {var.name}")
-            if var.detect.os_id == os_id and var.detect.os_version_regex.match(os_version):
+            if var.detect.os_version_regex.match(os_version):
                 cfg.diag("  - found it!")
                 return var
 
     return None
 
 
-def _detect_from_files(cfg: Config) -> Variant | None:
-    """Try to match the contents of some variant-specific files."""
+def _detect_from_files(
+    cfg: Config,
+    registry: VariantRegistry,
+    files: dict[str, cache.FileId],
+) -> Variant | None:
+    """Try to match the contents of some variant-specific files.
+
+    Each file is read only once, and all the patterns of the variants that
+    look at it are matched against each line in a single pass.
+    The variant that comes first in the detect order wins.
+    """
     cfg.diag("Trying non-os-release-based heuristics")
-    for var in vbuild.DETECT_ORDER:
-        cfg.diag(f"- trying {var.name}")
+    best: int | None = None
+    for dfile in registry.detect_files:
+        if best is not None and best < dfile.order[0]:
+            break
+
+        cfg.diag(
+            "- trying {filename} for {names}".format(
+                filename=dfile.filename,
+                names=" ".join(registry.detect_order[idx].name for idx in dfile.order),
+            ),
+        )
         try:
-            cfg.diag(f"  - {var.detect.filename}")
-            for line in pathlib.Path(var.detect.filename).read_text(encoding=SAFEENC).splitlines():
-                if var.detect.regex.match(line):
-                    cfg.diag(f"  - found it: {line}")
-                    return var
+            if dfile.filename not in files:
+                files[dfile.filename] = cache.file_id(dfile.filename)
+            lines = pathlib.Path(dfile.filename).read_text(encoding=SAFEENC).splitlines()
         except OSError as err:
             if err.errno != errno.ENOENT:
                 raise VariantDetectError(
-                    f"Could not read the {var.detect.filename} file: {err}",
+                    f"Could not read the {dfile.filename} file: {err}",
                 ) from err
-            cfg.diag(f"  - no {var.detect.filename}")
+            cfg.diag(f"  - no {dfile.filename}")
+            continue
 
-    return None
+        for line in lines:
+            if (match := dfile.regex.match(line)) is None:
+                continue
+
+            assert match.lastgroup is not None  # noqa: S101  # mypy needs this
+            idx = int(match.lastgroup[1:])
+            cfg.diag(f"  - found {registry.detect_order[idx].name}: {line}")
+            if best is None or idx < best:
+                best = idx
+                if best == dfile.order[0]:
+                    break
+
+    return registry.detect_order[best] if best is not None else None
 
 
 def detect_variant(cfg: Config = _DEFAULT_CONFIG) -> Variant:
-    """Detect the build variant for the current host."""
-    vbuild.build_variants(cfg)
+    """Detect the build variant for the current host.
+
+    If `cfg.cache_dir` is set, first check whether a previous detection result
+    has been recorded there and none of the files examined at that time has
+    changed since. After a successful detection, record the result there.
+    """
+    registry: Final = vbuild.get_registry(cfg)
+    if (name := cache.load(cfg)) is not None and (
+        cached := registry.lookup_variant(cfg, name)
+    ) is not None:
+        cfg.diag(f"Using the cached detection result {name}")
+        return cached
+
+    registry.build(cfg)
     cfg.diag("Trying to detect the current hosts's build variant")
+    files: Final[dict[str, cache.FileId]] = {}
+    var: Variant | None = _detect_from_os_release(cfg, registry, files)
+    if var is None:
+        var = _detect_from_files(cfg, registry, files)
 
-    if (var := _detect_from_os_release(cfg)) is not None:
-        return var
-
-    if (var := _detect_from_files(cfg)) is not None:
+    if var is not None:
+        cache.store(cfg, var.name, files)
         return var
 
     raise VariantDetectError("Could not detect the current host's build variant")
@@ -122,59 +179,282 @@ def detect_variant(cfg: Config = _DEFAULT_CONFIG) -> Variant:
 
 def get_all_variants(cfg: Config = _DEFAULT_CONFIG) -> dict[str, Variant]:
     """Return information about all the supported variants."""
-    vbuild.build_variants(cfg)
-    return dict(vbuild.VARIANTS)
+    registry: Final = vbuild.get_registry(cfg)
+    registry.build(cfg)
+    return dict(registry.variants)
 
 
 def get_all_variants_in_order(cfg: Config = _DEFAULT_CONFIG) -> list[Variant]:
     """Return information about all supported variants in detect order."""
-    vbuild.build_variants(cfg)
-    return list(vbuild.DETECT_ORDER)
+    registry: Final = vbuild.get_registry(cfg)
+    registry.build(cfg)
+    return list(registry.detect_order)
 
 
 def get_by_alias(alias: str, cfg: Config = _DEFAULT_CONFIG) -> Variant:
     """Return the variant with the specified name."""
-    vbuild.build_variants(cfg)
-    for var in vbuild.VARIANTS.values():
-        if var.builder.alias == alias:
-            return var
-    raise VariantKeyError(f"No variant with alias {alias}")
+    var: Final = vbuild.lookup_by_alias(cfg, alias)
+    if var is None:
+        raise VariantKeyError(f"No variant with alias {alias}")
+    return var
+
+
+def get_by_branch(branch: str, cfg: Config = _DEFAULT_CONFIG) -> Variant:
+    """Return the variant with the specified sp-pkg builder branch."""
+    var: Final = vbuild.lookup_by_branch(cfg, branch)
+    if var is None:
+        raise VariantKeyError(f"No variant with branch {branch}")
+    return var
 
 
 def get_variant(name: str, cfg: Config = _DEFAULT_CONFIG) -> Variant:
     """Return the variant with the specified name."""
-    vbuild.build_variants(cfg)
+    var: Final = vbuild.lookup_variant(cfg, name)
+    if var is None:
+        raise VariantKeyError(f"No variant named {name}")
+    return var
+
+
+def _parse_package_line(cmd: list[str], raw: bytes) -> defs.OSPackage | None:
+    """Parse a single line output by the "list installed packages" command."""
+    line: Final = raw.decode("UTF-8").rstrip("\n")
+    fields: Final = line.split("\t")
+    if len(fields) != 4:  # name, version, architecture, status
+        import shlex
+
+        raise VariantFileError(f"Unexpected line in the '{shlex.join(cmd)}' output: {line!r}")
+    # This may need updating at some point, but it'll work for now
+    if not fields[3].startswith("ii"):
+        return None
+
+    return defs.OSPackage(
+        name=fields[0],
+        version=fields[1],
+        arch=fields[2],
+        status="installed",
+    )
+
+
+def _iter_dpkg_installed(
+    var: Variant,
+    patterns: Iterable[str] | None,
+) -> Generator[defs.OSPackage, None, None]:
+    """Read the dpkg status database, fail as `dpkg-query` does if a pattern matches nothing."""
+    import subprocess
+
+    from . import dpkg
+
+    pats: Final = list(patterns) if patterns is not None else None
     try:
-        return vbuild.VARIANTS[name]
-    except KeyError as err:
-        raise VariantKeyError(f"No variant named {name}") from err
+        yield from dpkg.iter_installed(pats)
+    except dpkg.VariantDpkgNoMatchError as err:
+        raise subprocess.CalledProcessError(
+            1,
+            [*var.commands.package.list_all, *(pats or [])],
+            stderr=str(err),
+        ) from err
+
+
+def _get_native_lister(
+    var: Variant,
+) -> Callable[[Iterable[str] | None], Iterator[defs.OSPackage]] | None:
+    """Find an in-process reader for the variant's package database, if there is one."""
+    list_all: Final = var.commands.package.list_all
+    if var.family == "debian" and list_all[:1] == ("dpkg-query",):
+        import functools
+
+        from . import dpkg
+
+        if dpkg.has_pending_updates():
+            # Let dpkg-query apply the journal left over by an interrupted dpkg run.
+            return None
+        return functools.partial(_iter_dpkg_installed, var)
+
+    if var.family == "redhat" and list_all[:1] == ("rpm",):
+        try:
+            from . import rpmdb
+        except ImportError:
+            # Python may have been built without the sqlite3 module.
+            return None
 
+        return rpmdb.iter_installed
+
+    return None
+
+
+def _run_list_all(
+    var: Variant,
+    patterns: Iterable[str] | None,
+) -> Generator[defs.OSPackage, None, None]:
+    """Run the "list installed packages" command, parse its output line by line."""
+    import subprocess
 
-def list_all_packages(var: Variant, patterns: Iterable[str] | None = None) -> list[defs.OSPackage]:
-    """Parse the output of the "list installed packages" command."""
     cmd: Final = list(var.commands.package.list_all)
     if patterns is not None:
         cmd.extend(patterns)
 
-    res: Final = []
-    for line in subprocess.check_output(cmd, shell=False).decode("UTF-8").splitlines():
-        fields = line.split("\t")
-        if len(fields) != 4:
-            raise VariantFileError(f"Unexpected line in the '{shlex.join(cmd)}' output: {line!r}")
-        # This may need updating at some point, but it'll work for now
-        if not fields[3].startswith("ii"):
-            continue
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, shell=False) as proc:
+        assert proc.stdout is not None  # noqa: S101  # mypy needs this
+        finished = False
+        try:
+            for raw in proc.stdout:
+                pkg = _parse_package_line(cmd, raw)
+                if pkg is not None:
+                    yield pkg
+            finished = True
+        finally:
+            if not finished and proc.poll() is None:
+                proc.kill()
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def iter_all_packages(
+    var: Variant,
+    patterns: Iterable[str] | None = None,
+) -> Generator[defs.OSPackage, None, None]:
+    """Run the "list installed packages" command, parse its output line by line.
+
+    If the caller stops iterating early or an unexpected line is found,
+    the command is killed. If the command fails, `subprocess.CalledProcessError`
+    is raised after all the packages that it did output have been yielded.
+
+    For Debian-family variants that use `dpkg-query` and Red Hat-family ones
+    that use `rpm` to list the packages, the package database is read
+    directly instead, see the `sp_variant.dpkg` and `sp_variant.rpmdb`
+    modules; the command is only run if the database cannot be opened or,
+    for dpkg, if an interrupted run left pending journal entries. As with
+    `dpkg-query`, `subprocess.CalledProcessError` is raised if a pattern
+    does not match any package in the dpkg database.
+    """
+    native: Final = _get_native_lister(var)
+    if native is None:
+        yield from _run_list_all(var, patterns)
+        return
 
-        res.append(
-            defs.OSPackage(
-                name=fields[0],
-                version=fields[1],
-                arch=fields[2],
-                status="installed",
-            ),
-        )
+    if patterns is not None:
+        patterns = list(patterns)
+    yielded = False
+    try:
+        for pkg in native(patterns):
+            yielded = True
+            yield pkg
+    except OSError:
+        if yielded:
+            raise
+    else:
+        return
+
+    yield from _run_list_all(var, patterns)
+
+
+@typing.overload
+def list_all_packages(
+    var: Variant,
+    patterns: Iterable[str] | None = None,
+    *,
+    as_table: Literal[False] = False,
+) -> list[defs.OSPackage]: ...
+
+
+@typing.overload
+def list_all_packages(
+    var: Variant,
+    patterns: Iterable[str] | None = None,
+    *,
+    as_table: Literal[True],
+) -> pkgtable.PackageTable: ...
+
+
+def list_all_packages(
+    var: Variant,
+    patterns: Iterable[str] | None = None,
+    *,
+    as_table: bool = False,
+) -> list[defs.OSPackage] | pkgtable.PackageTable:
+    """Parse the output of the "list installed packages" command.
+
+    If `as_table` is true, return a compact `PackageTable` instead of a list.
+    """
+    if as_table:
+        from . import pkgtable
+
+        return pkgtable.PackageTable(iter_all_packages(var, patterns))
+    return list(iter_all_packages(var, patterns))
+
+
+def are_installed(var: Variant, names: Iterable[str]) -> dict[str, bool]:
+    """Check which of the specified OS packages are installed.
+
+    The installed packages are listed only once, without any patterns, and
+    each name is looked up in the resulting table. For the Debian-family
+    variants, a name may be followed by a colon and an architecture,
+    e.g. "libc6:i386".
+    """
+    from . import pkgtable
+
+    table: Final = pkgtable.PackageTable(iter_all_packages(var))
+    result: Final[dict[str, bool]] = {}
+    for name in names:
+        if var.family == "debian" and ":" in name:
+            pkg_name, arch = name.split(":", 1)
+            result[name] = table.get_version(pkg_name, arch) is not None
+        else:
+            result[name] = name in table
+    return result
+
+
+def query(
+    method: str,
+    params: dict[str, Any] | None = None,
+    *,
+    cfg: Config = _DEFAULT_CONFIG,
+    socket_path: pathlib.Path | None = None,
+    timeout: float = 5.0,
+) -> Any:  # noqa: ANN401
+    """Ask the `sp_variant serve` daemon, or do the work in-process if it is not running.
+
+    The result is the decoded JSON value, e.g. a string for the `detect` method or
+    a dictionary for the `show` one; see the `sp_variant.server` module for
+    the supported methods.
+    """
+    import json
+    import socket
+
+    from . import serialize
+
+    path: Final = socket_path if socket_path is not None else pathlib.Path(defs.SOCKET_PATH)
+    req_params: Final = params if params is not None else {}
+    request: Final = {"method": method, "params": req_params}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode("UTF-8") + b"\n")
+            with sock.makefile(mode="rb") as infile:
+                line: Final = infile.readline()
+    except (FileNotFoundError, ConnectionRefusedError) as err:
+        cfg.diag(f"Could not connect to {path}: {err}; answering the query in-process")
+        from . import server
 
-    return res
+        try:
+            result: Final = server.Handler(cfg).handle(method, req_params)
+        except VariantError as herr:
+            raise VariantQueryError(str(herr)) from herr
+        return json.loads(serialize.dumps(result, compact=True))
+    except OSError as err:
+        raise VariantQueryError(f"Could not query the {path} daemon: {err}") from err
+
+    try:
+        response: Final = json.loads(line)
+    except ValueError as err:
+        raise VariantQueryError(f"Invalid response from the {path} daemon: {line!r}") from err
+    if not isinstance(response, dict) or ("result" not in response and "error" not in response):
+        raise VariantQueryError(f"Unexpected response from the {path} daemon: {line!r}")
+    if "error" in response:
+        raise VariantQueryError(str(response["error"]))
+    return response["result"]
 
 
 __all__ = (
@@ -182,11 +462,16 @@ __all__ = (
     "Config",
     "Variant",
     "VariantError",
+    "VariantRegistry",
+    "are_installed",
     "detect_variant",
     "get_all_variants",
     "get_all_variants_in_order",
     "get_by_alias",
+    "get_by_branch",
     "get_variant",
+    "iter_all_packages",
     "list_all_packages",
+    "query",
     "update_namedtuple",
 )
@@ -4,20 +4,35 @@
 
 from __future__ import annotations
 
+import itertools
 import pathlib
 import re
+import threading
 from typing import TYPE_CHECKING, NamedTuple
 
 from . import defs
 
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Final, TypeVar
+    from typing import Any, Callable, Final, Pattern, TypeVar
 
     _TNamedTuple = TypeVar("_TNamedTuple", bound=NamedTuple)
 
 
-CMD_NOOP: Final[list[str]] = ["true"]
+class DetectFile(NamedTuple):
+    """The variants that may be detected by examining a single file."""
+
+    filename: str
+    """The name of the file to read."""
+
+    order: list[int]
+    """The indices of the variants in the detect order list."""
+
+    regex: defs.LazyPattern
+    """The combined regular expression; the `v<index>` groups denote the variants."""
+
+
+CMD_NOOP: Final[tuple[str, ...]] = ("true",)
 
 _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
     defs.Variant(
@@ -27,7 +42,7 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         family="debian",
         detect=defs.Detect(
             filename="/etc/os-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"""^
                     PRETTY_NAME= .*
                     Debian \s+ GNU/Linux \s+
@@ -36,13 +51,13 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
                 re.X,
             ),
             os_id="debian",
-            os_version_regex=re.compile(r"^13$"),
+            os_version_regex=defs.lazy_pattern(r"^13$"),
         ),
         supported=defs.Supported(repo=False),
         commands=defs.Commands(
             package=defs.CommandsPackage(
-                update_db=["apt-get", "-q", "-y", "update"],
-                install=[
+                update_db=("apt-get", "-q", "-y", "update"),
+                install=(
                     "env",
                     "DEBIAN_FRONTEND=noninteractive",
                     "apt-get",
@@ -51,15 +66,15 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
                     "--no-install-recommends",
                     "install",
                     "--",
-                ],
-                list_all=[
+                ),
+                list_all=(
                     "dpkg-query",
                     "-W",
                     "-f",
                     r"${Package}\t${Version}\t${Architecture}\t${db:Status-Abbrev}\n",
                     "--",
-                ],
-                purge=[
+                ),
+                purge=(
                     "env",
                     "DEBIAN_FRONTEND=noninteractive",
                     "apt-get",
@@ -67,8 +82,8 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
                     "-y",
                     "purge",
                     "--",
-                ],
-                remove=[
+                ),
+                remove=(
                     "env",
                     "DEBIAN_FRONTEND=noninteractive",
                     "apt-get",
@@ -76,29 +91,29 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
                     "-y",
                     "remove",
                     "--",
-                ],
-                remove_impl=[
+                ),
+                remove_impl=(
                     "env",
                     "DEBIAN_FRONTEND=noninteractive",
                     "dpkg",
                     "-r",
                     "--",
-                ],
+                ),
             ),
             pkgfile=defs.CommandsPkgFile(
-                dep_query=[
+                dep_query=(
                     "sh",
                     "-c",
                     'dpkg-deb -f -- "$pkg" "Depends" | sed -e "s/ *, */,/g" | tr "," "\\n"',
-                ],
-                install=[
+                ),
+                install=(
                     "sh",
                     "-c",
                     "env DEBIAN_FRONTEND=noninteractive apt-get install "
                     "--no-install-recommends --reinstall -y "
                     "-o DPkg::Options::=--force-confnew "
                     "-- $packages",
-                ],
+                ),
             ),
         ),
         min_sys_python="3.11",
@@ -107,17 +122,19 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
             codename="unstable",
             sources="debian/repo/storpool.sources",
             keyring="debian/repo/storpool-keyring.gpg",
-            req_packages=["ca-certificates"],
+            req_packages=("ca-certificates",),
+        ),
+        package=defs.FrozenDict(
+            {
+                "BINDINGS_PYTHON": "python3",
+                "BINDINGS_PYTHON_CONFGET": "python3-confget",
+                "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",
+                "CGROUP": "cgroup-tools",
+                "CPUPOWER": "linux-cpupower",
+                "LIBSSL": "libssl3",
+                "MCELOG": "bash",
+            },
         ),
-        package={
-            "BINDINGS_PYTHON": "python3",
-            "BINDINGS_PYTHON_CONFGET": "python3-confget",
-            "BINDINGS_PYTHON_SIMPLEJSON": "python3-simplejson",
-            "CGROUP": "cgroup-tools",
-            "CPUPOWER": "linux-cpupower",
-            "LIBSSL": "libssl3",
-            "MCELOG": "bash",
-        },
         systemd_lib="lib/systemd/system",
         file_ext="deb",
         initramfs_flavor="update-initramfs",
@@ -135,7 +152,7 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         parent="DEBIAN13",
         detect=defs.Detect(
             filename="/etc/os-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"""^
                     PRETTY_NAME= .*
                     Debian \s+ GNU/Linux \s+
@@ -144,7 +161,7 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
                 re.X,
             ),
             os_id="debian",
-            os_version_regex=re.compile(r"^12$"),
+            os_version_regex=defs.lazy_pattern(r"^12$"),
         ),
         updates={
             "supported": {"repo": True},
@@ -162,7 +179,7 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         parent="DEBIAN12",
         detect=defs.Detect(
             filename="/etc/os-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"""^
                     PRETTY_NAME= .*
                     Debian \s+ GNU/Linux \s+
@@ -171,7 +188,7 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
                 re.X,
             ),
             os_id="debian",
-            os_version_regex=re.compile(r"^11$"),
+            os_version_regex=defs.lazy_pattern(r"^11$"),
         ),
         updates={
             "min_sys_python": "3.9",
@@ -192,7 +209,7 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         parent="DEBIAN11",
         detect=defs.Detect(
             filename="/etc/os-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"""^
                     PRETTY_NAME= .*
                     Debian \s+ GNU/Linux \s+
@@ -201,7 +218,7 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
                 re.X,
             ),
             os_id="debian",
-            os_version_regex=re.compile(r"^10$"),
+            os_version_regex=defs.lazy_pattern(r"^10$"),
         ),
         updates={
             "supported": {"repo": False},
@@ -227,12 +244,12 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         parent="DEBIAN13",
         detect=defs.Detect(
             filename="/etc/os-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"^ PRETTY_NAME= .* Ubuntu \s+ .* Noble ",
                 re.X,
             ),
             os_id="ubuntu",
-            os_version_regex=re.compile(r"^24\.04$"),
+            os_version_regex=defs.lazy_pattern(r"^24\.04$"),
         ),
         updates={
             "supported": {"repo": False},
@@ -257,12 +274,12 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         parent="UBUNTU2404",
         detect=defs.Detect(
             filename="/etc/os-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"^ PRETTY_NAME= .* (?: Ubuntu \s+ 22 \. 04 | Mint \s+ 21 ) ",
                 re.X,
             ),
             os_id="ubuntu",
-            os_version_regex=re.compile(r"^22\.04$"),
+            os_version_regex=defs.lazy_pattern(r"^22\.04$"),
         ),
         updates={
             "supported": {"repo": True},
@@ -284,12 +301,12 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         parent="UBUNTU2204",
         detect=defs.Detect(
             filename="/etc/os-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"^ PRETTY_NAME= .* (?: Ubuntu \s+ 20 \. 04 | Mint \s+ 20 ) ",
                 re.X,
             ),
             os_id="ubuntu",
-            os_version_regex=re.compile(r"^20\.04$"),
+            os_version_regex=defs.lazy_pattern(r"^20\.04$"),
         ),
         updates={
             "supported": {"repo": True},
@@ -314,12 +331,12 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         parent="UBUNTU2004",
         detect=defs.Detect(
             filename="/etc/os-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"^ PRETTY_NAME= .* Ubuntu \s+ 18 \. 04 ",
                 re.X,
             ),
             os_id="ubuntu",
-            os_version_regex=re.compile(r"^18\.04$"),
+            os_version_regex=defs.lazy_pattern(r"^18\.04$"),
         ),
         updates={
             "repo": {
@@ -345,15 +362,15 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
         family="redhat",
         detect=defs.Detect(
             filename="/etc/redhat-release",
-            regex=re.compile(r"^ AlmaLinux \s .* \s 9 \. [0-9]", re.X),
+            regex=defs.lazy_pattern(r"^ AlmaLinux \s .* \s 9 \. [0-9]", re.X),
             os_id="almalinux",
-            os_version_regex=re.compile(r"^9(?:$|\.[0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^9(?:$|\.[0-9])"),
         ),
         supported=defs.Supported(repo=False),
         commands=defs.Commands(
             package=defs.CommandsPackage(
                 update_db=CMD_NOOP,
-                install=[
+                install=(
                     "dnf",
                     "--disablerepo=*",
                     "--enablerepo=appstream",
@@ -364,41 +381,41 @@ _VARIANT_DEF: Final[list[defs.Variant | defs.VariantUpdate]] = [
                     "-q",
                     "-y",
                     "--",
-                ],
-                list_all=[
+                ),
+                list_all=(
                     "rpm",
                     "-qa",
                     "--qf",
                     r"%{Name}\t%{EVR}\t%{Arch}\tii\n",
                     "--",
-                ],
-                purge=[
+                ),
+                purge=(
                     "yum",
                     "remove",
                     "-q",
                     "-y",
                     "--",
-                ],
-                remove=[
+                ),
+                remove=(
                     "yum",
                     "remove",
                     "-q",
                     "-y",
                     "--",
-                ],
-                remove_impl=[
+                ),
+                remove_impl=(
                     "rpm",
                     "-e",
                     "--",
-                ],
+                ),
             ),
             pkgfile=defs.CommandsPkgFile(
-                dep_query=[
+                dep_query=(
                     "sh",
                     "-c",
                     'rpm -qpR -- "$pkg"',
-                ],
-                install=[
+                ),
+                install=(
                     "sh",
                     "-c",
                     """
@@ -419,7 +436,7 @@ if [ -n "$to_reinstall" ]; then
     dnf reinstall -y --disablerepo='*' --enablerepo=appstream,baseos,crb,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall
 fi
 """,  # noqa: E501
-                ],
+                ),
             ),
         ),
         min_sys_python="3.9",
@@ -427,19 +444,21 @@ fi
             yumdef="redhat/repo/storpool-centos.repo",
             keyring="redhat/repo/RPM-GPG-KEY-StorPool",
         ),
-        package={
-            "KMOD": "kmod",
-            "LIBCGROUP": "bash",
-            "LIBUDEV": "systemd-libs",
-            "OPENSSL": "openssl-libs",
-            "PERL_AUTODIE": "perl-autodie",
-            "PERL_FILE_PATH": "perl-File-Path",
-            "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
-            "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
-            "PYTHON_SIMPLEJSON": "bash",
-            "PROCPS": "procps-ng",
-            "UDEV": "systemd",
-        },
+        package=defs.FrozenDict(
+            {
+                "KMOD": "kmod",
+                "LIBCGROUP": "bash",
+                "LIBUDEV": "systemd-libs",
+                "OPENSSL": "openssl-libs",
+                "PERL_AUTODIE": "perl-autodie",
+                "PERL_FILE_PATH": "perl-File-Path",
+                "PERL_LWP_PROTO_HTTPS": "perl-LWP-Protocol-https",
+                "PERL_SYS_SYSLOG": "perl-Sys-Syslog",
+                "PYTHON_SIMPLEJSON": "bash",
+                "PROCPS": "procps-ng",
+                "UDEV": "systemd",
+            },
+        ),
         systemd_lib="usr/lib/systemd/system",
         file_ext="rpm",
         initramfs_flavor="mkinitrd",
@@ -457,9 +476,9 @@ fi
         parent="ALMA9",
         detect=defs.Detect(
             filename="/etc/redhat-release",
-            regex=re.compile(r"^ AlmaLinux \s .* \s 8 \. (?: [4-9] | [1-9][0-9] )", re.X),
+            regex=defs.lazy_pattern(r"^ AlmaLinux \s .* \s 8 \. (?: [4-9] | [1-9][0-9] )", re.X),
             os_id="almalinux",
-            os_version_regex=re.compile(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
         ),
         updates={
             "supported": {"repo": True},
@@ -470,7 +489,7 @@ fi
             "min_sys_python": "3.6",
             "commands": {
                 "package": {
-                    "install": [
+                    "install": (
                         "dnf",
                         "--disablerepo=*",
                         "--enablerepo=appstream",
@@ -481,10 +500,10 @@ fi
                         "-q",
                         "-y",
                         "--",
-                    ],
+                    ),
                 },
                 "pkgfile": {
-                    "install": [
+                    "install": (
                         "sh",
                         "-c",
                         """
@@ -505,7 +524,7 @@ if [ -n "$to_reinstall" ]; then
     dnf reinstall -y --disablerepo='*' --enablerepo=appstream,baseos,storpool-contrib,powertools --setopt=localpkg_gpgcheck=0 -- $to_reinstall
 fi
 """,  # noqa: E501
-                    ],
+                    ),
                 },
             },
             "builder": {
@@ -521,9 +540,9 @@ fi
         parent="ALMA9",
         detect=defs.Detect(
             filename="/etc/redhat-release",
-            regex=re.compile(r"^ CentOS Stream release 9", re.X),
+            regex=defs.lazy_pattern(r"^ CentOS Stream release 9", re.X),
             os_id="centos",
-            os_version_regex=re.compile(r"^9(?:$|\.[4-9]|\.[1-9][0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^9(?:$|\.[4-9]|\.[1-9][0-9])"),
         ),
         updates={
             "builder": {
@@ -539,9 +558,9 @@ fi
         parent="ALMA8",
         detect=defs.Detect(
             filename="/etc/redhat-release",
-            regex=re.compile(r"^ CentOS \s .* \s 8 \. (?: [3-9] | (?: [12][0-9] ) )", re.X),
+            regex=defs.lazy_pattern(r"^ CentOS \s .* \s 8 \. (?: [3-9] | (?: [12][0-9] ) )", re.X),
             os_id="centos",
-            os_version_regex=re.compile(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
         ),
         updates={
             "builder": {
@@ -557,14 +576,14 @@ fi
         parent="CENTOS8",
         detect=defs.Detect(
             filename="/etc/redhat-release",
-            regex=re.compile(r"^ (?: CentOS | Virtuozzo ) \s .* \s 7 \.", re.X),
+            regex=defs.lazy_pattern(r"^ (?: CentOS | Virtuozzo ) \s .* \s 7 \.", re.X),
             os_id="centos",
-            os_version_regex=re.compile(r"^7(?:$|\.[0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^7(?:$|\.[0-9])"),
         ),
         updates={
             "commands": {
                 "package": {
-                    "install": [
+                    "install": (
                         "yum",
                         "--disablerepo=*",
                         "--enablerepo=base",
@@ -573,10 +592,10 @@ fi
                         "install",
                         "-q",
                         "-y",
-                    ],
+                    ),
                 },
                 "pkgfile": {
-                    "install": [
+                    "install": (
                         """
 unset to_install to_reinstall
 for f in $packages; do
@@ -595,7 +614,7 @@ if [ -n "$to_reinstall" ]; then
     yum reinstall -y --disablerepo='*' --enablerepo=base,updates,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall
 fi
 """,  # noqa: E501
-                    ],
+                    ),
                 },
             },
             "builder": {
@@ -613,9 +632,9 @@ fi
         parent="CENTOS7",
         detect=defs.Detect(
             filename="/etc/oracle-release",
-            regex=re.compile(r"^ Oracle \s+ Linux \s .* \s 7 \.", re.X),
+            regex=defs.lazy_pattern(r"^ Oracle \s+ Linux \s .* \s 7 \.", re.X),
             os_id="ol",
-            os_version_regex=re.compile(r"^7(?:$|\.[0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^7(?:$|\.[0-9])"),
         ),
         updates={
             "builder": {
@@ -631,18 +650,18 @@ fi
         parent="ALMA8",
         detect=defs.Detect(
             filename="/etc/oracle-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"^ Oracle \s+ Linux \s+ Server \s+ release \s .* "
                 r"\s 8 \. (?: [4-9] | [1-9][0-9] )",
                 re.X,
             ),
             os_id="ol",
-            os_version_regex=re.compile(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
         ),
         updates={
             "commands": {
                 "package": {
-                    "install": [
+                    "install": (
                         "dnf",
                         "--disablerepo=*",
                         "--enablerepo=ol8_appstream",
@@ -653,10 +672,10 @@ fi
                         "-q",
                         "-y",
                         "--",
-                    ],
+                    ),
                 },
                 "pkgfile": {
-                    "install": [
+                    "install": (
                         "sh",
                         "-c",
                         """
@@ -677,7 +696,7 @@ if [ -n "$to_reinstall" ]; then
     dnf reinstall -y --disablerepo='*' --enablerepo=ol8_appstream,ol8_baseos_latest,ol8_codeready_builder,storpool-contrib --setopt=localpkg_gpgcheck=0 -- $to_reinstall
 fi
 """,  # noqa: E501
-                    ],
+                    ),
                 },
             },
             "builder": {
@@ -693,18 +712,18 @@ fi
         parent="CENTOS8",
         detect=defs.Detect(
             filename="/etc/redhat-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"^ Red \s+ Hat \s+ Enterprise \s+ Linux \s .* "
                 r"\s 8 \. (?: [4-9] | [1-9][0-9] )",
                 re.X,
             ),
             os_id="rhel",
-            os_version_regex=re.compile(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
         ),
         updates={
             "commands": {
                 "package": {
-                    "install": [
+                    "install": (
                         "dnf",
                         "--disablerepo=*",
                         "--enablerepo=appstream",
@@ -715,10 +734,10 @@ fi
                         "-q",
                         "-y",
                         "--",
-                    ],
+                    ),
                 },
                 "pkgfile": {
-                    "install": [
+                    "install": (
                         "sh",
                         "-c",
                         """
@@ -739,7 +758,7 @@ if [ -n "$to_reinstall" ]; then
     dnf reinstall -y --disablerepo='*' --enablerepo=appstream,baseos,storpool-contrib,codeready-builder-for-rhel-8-x86_64-rpms --setopt=localpkg_gpgcheck=0 -- $to_reinstall
 fi
 """,  # noqa: E501
-                    ],
+                    ),
                 },
             },
             "builder": {
@@ -755,12 +774,12 @@ fi
         parent="ALMA9",
         detect=defs.Detect(
             filename="/etc/redhat-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"^ Rocky \s+ Linux \s .* \s 9 \. [0-9]",
                 re.X,
             ),
             os_id="rocky",
-            os_version_regex=re.compile(r"^8(?:$|\.[0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^8(?:$|\.[0-9])"),
         ),
         updates={
             "builder": {
@@ -776,12 +795,12 @@ fi
         parent="CENTOS8",
         detect=defs.Detect(
             filename="/etc/redhat-release",
-            regex=re.compile(
+            regex=defs.lazy_pattern(
                 r"^ Rocky \s+ Linux \s .* \s 8 \. (?: [4-9] | [1-9][0-9] )",
                 re.X,
             ),
             os_id="rocky",
-            os_version_regex=re.compile(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
+            os_version_regex=defs.lazy_pattern(r"^8(?:$|\.[4-9]|\.[1-9][0-9])"),
         ),
         updates={
             "builder": {
@@ -793,9 +812,7 @@ fi
     ),
 ]
 
-VARIANTS: Final[dict[str, defs.Variant]] = {}
-
-DETECT_ORDER: Final[list[defs.Variant]] = []
+_INLINE_FLAGS: Final = ((re.I, "i"), (re.M, "m"), (re.S, "s"), (re.X, "x"))
 
 
 def _check_type(
@@ -811,13 +828,15 @@ def _check_type(
 
 
 def _update_dict(prefix: str, name: str, orig: Any, value: Any) -> Any:
-    """Recurse into a tuple or replace a dictionary."""
-    if isinstance(orig, tuple):
+    """Recurse into a named tuple or build a new dictionary with some values replaced."""
+    if isinstance(orig, tuple) and hasattr(orig, "_fields"):
         return update_namedtuple(orig, value)  # type: ignore[type-var]  # argh
 
+    if isinstance(orig, defs.FrozenDict):
+        return orig | value
+
     if isinstance(orig, dict):
-        orig.update(value)
-        return orig
+        return {**orig, **value}
 
     raise defs.VariantConfigError(f"{prefix}: {name} is not a tuple")
 
@@ -842,9 +861,10 @@ def _update_path(prefix: str, name: str, orig: Any, value: Any) -> Any:
 
 
 def _update_list(prefix: str, name: str, orig: Any, value: Any) -> Any:
-    """Replace a list of values."""
-    _check_type(prefix, name, orig, list, "list")
-    return value
+    """Replace a list of values, e.g. a command; share it with other users of the same one."""
+    if not isinstance(orig, tuple) or hasattr(orig, "_fields"):
+        raise defs.VariantConfigError(f"{prefix}: {name} is not a list")
+    return defs.intern_command(value)
 
 
 _UPDATE_HANDLERS: tuple[tuple[type[Any], Callable[[str, str, Any, Any], Any]], ...] = (
@@ -853,6 +873,7 @@ _UPDATE_HANDLERS: tuple[tuple[type[Any], Callable[[str, str, Any, Any], Any]], .
     (bool, _update_bool),
     (pathlib.Path, _update_path),
     (list, _update_list),
+    (tuple, _update_list),
 )
 
 
@@ -900,7 +921,7 @@ def merge_into_parent(
             supported=parent.supported,
             commands=parent.commands,
             repo=parent.repo,
-            package=dict(parent.package),
+            package=parent.package,
             min_sys_python=parent.min_sys_python,
             systemd_lib=parent.systemd_lib,
             file_ext=parent.file_ext,
@@ -911,27 +932,300 @@ def merge_into_parent(
     )
 
 
-def build_variants(cfg: defs.Config) -> None:
-    """Build the variant definitions from the parent/child relations."""
-    # We really hope these asserts will not trigger, but let's leave them in for now.
-    if VARIANTS:
-        assert len(VARIANTS) == len(_VARIANT_DEF)  # noqa: S101
-        assert DETECT_ORDER  # noqa: S101
-        assert len(DETECT_ORDER) == len(_VARIANT_DEF)  # noqa: S101
-        return
-    assert not DETECT_ORDER  # noqa: S101
-
-    cfg.diag("Building the list of variants")
-    order: Final[list[str]] = []
+def _combine_regexes(
+    regexes: list[tuple[int, Pattern[str] | defs.LazyPattern]],
+) -> defs.LazyPattern:
+    """Build a single alternation with `v<index>` named groups out of several patterns."""
+
+    def wrap(idx: int, regex: Pattern[str] | defs.LazyPattern) -> str:
+        """Preserve the flags of the pattern, name the group after the variant index."""
+        flags: Final = "".join(flag for value, flag in _INLINE_FLAGS if regex.flags & value)
+        if not flags:
+            return f"(?P<v{idx}>{regex.pattern})"
+        end: Final = "\n" if regex.flags & re.X else ""
+        return f"(?P<v{idx}>(?{flags}:{regex.pattern}{end}))"
+
+    return defs.LazyPattern("|".join(itertools.starmap(wrap, regexes)))
+
+
+def merge_definitions(cfg: defs.Config) -> dict[str, defs.Variant]:
+    """Merge the variant definitions from the parent/child relations.
+
+    This is only needed to generate the `data` module; the library itself
+    uses the pre-merged definitions from there.
+    """
+    cfg.diag("Merging the variant definitions")
+    merged: Final[dict[str, defs.Variant]] = {}
     for var in _VARIANT_DEF:
-        current = (
-            merge_into_parent(cfg, VARIANTS[var.parent], var)
+        merged[var.name] = (
+            merge_into_parent(cfg, merged[var.parent], var)
             if isinstance(var, defs.VariantUpdate)
             else var
         )
-        VARIANTS[var.name] = current
-        order.append(var.name)
+    return merged
+
+
+def _build_index(
+    variants: list[defs.Variant],
+    what: str,
+    get_key: Callable[[defs.Variant], str],
+) -> dict[str, defs.Variant]:
+    """Index the variants by some unique key, skip the ones that do not define it."""
+    index: Final[dict[str, defs.Variant]] = {}
+    for var in variants:
+        key = get_key(var)
+        if not key:
+            continue
+        if key in index:
+            raise defs.VariantConfigError(
+                f"Duplicate {what} {key!r} for both {index[key].name} and {var.name}",
+            )
+        index[key] = var
+    return index
+
+
+def _share_unchanged(new: _TNamedTuple, old: _TNamedTuple) -> _TNamedTuple:
+    """Reuse the parts of the original structure that have not been changed."""
+    if new == old:
+        return old
+
+    shared: Final[dict[str, Any]] = {}
+    for name, new_value, old_value in zip(new._fields, new, old):
+        if new_value == old_value:
+            shared[name] = old_value
+        elif hasattr(new_value, "_fields") and type(new_value) is type(old_value):
+            shared[name] = _share_unchanged(new_value, old_value)
+        elif isinstance(new_value, tuple):
+            shared[name] = defs.intern_command(new_value)
+    return new._replace(**shared)
+
+
+def _apply_overrides(
+    cfg: defs.Config,
+    base: dict[str, defs.Variant],
+    overrides: tuple[dict[str, dict[str, Any]], ...],
+) -> dict[str, defs.Variant]:
+    """Apply the overrides to the variant definitions, reuse the unaffected variants.
+
+    A variant is merged into its parent again only if the parent itself
+    was changed; otherwise the variant from the `base` dictionary is used as is.
+    The fields that end up unchanged are shared with the `base` variants.
+    """
+    for layer in overrides:
+        unknown = sorted(set(layer) - set(base))
+        if unknown:
+            raise defs.VariantConfigError(
+                "Overrides specified for unknown variants: {names}".format(names=" ".join(unknown)),
+            )
+
+    result: Final[dict[str, defs.Variant]] = {}
+    for vdef in _VARIANT_DEF:
+        if isinstance(vdef, defs.VariantUpdate) and result[vdef.parent] is not base[vdef.parent]:
+            var = merge_into_parent(cfg, result[vdef.parent], vdef)
+        else:
+            var = base[vdef.name]
+
+        for layer in overrides:
+            updates = layer.get(vdef.name)
+            if updates is not None:
+                cfg.diag(f"- overriding {vdef.name}: {updates!r}")
+                var = update_namedtuple(var, updates)
+
+        result[vdef.name] = _share_unchanged(var, base[vdef.name])
+
+    return result
+
+
+class VariantRegistry:
+    """A set of merged variant definitions and the indices built from them.
+
+    The default registry uses the pre-merged definitions from the `data`
+    module as they are. A registry created by `with_overrides()` reuses
+    the variants that are not affected by the overrides, and the changed
+    variants share all their unchanged fields with the original ones.
+    """
+
+    overrides: tuple[dict[str, dict[str, Any]], ...]
+    """The changes applied to the variant definitions, in order."""
+
+    variants: dict[str, defs.Variant]
+    """The variants in definition order; populated by `build()`."""
+
+    detect_order: list[defs.Variant]
+    """The variants in detect order; populated by `build()`."""
+
+    detect_by_os_id: dict[str, list[defs.Variant]]
+    """The variants with the same os-release "ID" field, in detect order."""
+
+    detect_files: list[DetectFile]
+    """The files to examine if the os-release detection fails, in detect order."""
+
+    by_alias: dict[str, defs.Variant]
+    """The variants indexed by their StorPool builder alias."""
+
+    by_branch: dict[str, defs.Variant]
+    """The variants indexed by their sp-pkg branch, if they have one."""
+
+    _merged: dict[str, defs.Variant] | None
+    _lock: threading.RLock
+    _built: threading.Event
+
+    def __init__(self, overrides: tuple[dict[str, dict[str, Any]], ...] = ()) -> None:
+        """Store the overrides, do not load any data yet."""
+        self.overrides = overrides
+        self.variants = {}
+        self.detect_order = []
+        self.detect_by_os_id = {}
+        self.detect_files = []
+        self.by_alias = {}
+        self.by_branch = {}
+        self._merged = None
+        self._lock = threading.RLock()
+        self._built = threading.Event()
+
+    def __repr__(self) -> str:
+        """Provide a Python-esque representation of the registry."""
+        return f"{type(self).__name__}(overrides={self.overrides!r})"
+
+    def with_overrides(
+        self,
+        cfg: defs.Config,
+        overrides: dict[str, dict[str, Any]],
+    ) -> VariantRegistry:
+        """Create a new registry with some variant fields changed.
+
+        The `overrides` dictionary is keyed by variant name; the values are
+        field updates in the same format as the ones in the variant definitions.
+        Changes to a variant are also inherited by the variants based on it.
+        """
+        registry: Final = VariantRegistry((*self.overrides, overrides))
+        registry.source(cfg)
+        return registry
+
+    def source(self, cfg: defs.Config) -> dict[str, defs.Variant]:
+        """Return the merged variant definitions without building any indices."""
+        from . import data  # noqa: PLC0415  # the `subst` tool must work without it
+
+        if not self.overrides:
+            return data.VARIANTS
+
+        with self._lock:
+            if self._merged is None:
+                cfg.diag("Applying the variant overrides")
+                self._merged = _apply_overrides(cfg, data.VARIANTS, self.overrides)
+            return self._merged
+
+    def build(self, cfg: defs.Config) -> None:
+        """Load the merged variant definitions, build the detection indices.
+
+        This may safely be invoked from several threads at once; the data is
+        built into local variables and the registry's structures are only
+        populated once, while holding a lock.
+        """
+        if self._built.is_set():
+            return
+
+        with self._lock:
+            if self._built.is_set():
+                return
+            self._build_locked(cfg)
+            self._built.set()
+
+    def _build_locked(self, cfg: defs.Config) -> None:
+        """Build the variant data and indices, publish them at the end."""
+        # We really hope these asserts will not trigger, but let's leave them in for now.
+        assert not self.variants  # noqa: S101
+        assert not self.detect_order  # noqa: S101
+        assert not self.detect_by_os_id  # noqa: S101
+        assert not self.detect_files  # noqa: S101
+        assert not self.by_alias  # noqa: S101
+        assert not self.by_branch  # noqa: S101
+
+        from . import data  # noqa: PLC0415  # the `subst` tool must work without it
+
+        cfg.diag("Loading the list of variants")
+        source: Final = self.source(cfg)
+        variants: Final = list(source.values())
+        by_alias: Final = _build_index(variants, "builder alias", lambda var: var.builder.alias)
+        if len(by_alias) != len(variants):
+            raise defs.VariantConfigError("Not all the variants define a builder alias")
+        by_branch: Final = _build_index(
+            variants,
+            "builder branch",
+            lambda var: var.builder.branch,
+        )
+
+        order: Final = [source[name] for name in data.DETECT_ORDER]
+        by_os_id: Final[dict[str, list[defs.Variant]]] = {}
+        by_filename: Final[dict[str, list[int]]] = {}
+        for idx, var in enumerate(order):
+            by_os_id.setdefault(var.detect.os_id, []).append(var)
+            by_filename.setdefault(var.detect.filename, []).append(idx)
+        detect_files: Final = [
+            DetectFile(
+                filename=filename,
+                order=indices,
+                regex=_combine_regexes([(idx, order[idx].detect.regex) for idx in indices]),
+            )
+            for filename, indices in by_filename.items()
+        ]
+
+        self.by_alias.update(by_alias)
+        self.by_branch.update(by_branch)
+        self.detect_by_os_id.update(by_os_id)
+        self.detect_files.extend(detect_files)
+        self.variants.update(source)
+        self.detect_order.extend(order)
+        cfg.diag(
+            "Detect order: {names}".format(names=" ".join(var.name for var in self.detect_order)),
+        )
+
+    def lookup_variant(self, cfg: defs.Config, name: str) -> defs.Variant | None:
+        """Return a single merged variant without building the detection indices."""
+        cfg.diag(f"Looking for the {name} variant")
+        return self.source(cfg).get(name)
+
+    def lookup_by_alias(self, cfg: defs.Config, alias: str) -> defs.Variant | None:
+        """Return the variant with the specified builder alias."""
+        self.build(cfg)
+        return self.by_alias.get(alias)
+
+    def lookup_by_branch(self, cfg: defs.Config, branch: str) -> defs.Variant | None:
+        """Return the variant with the specified sp-pkg branch."""
+        self.build(cfg)
+        return self.by_branch.get(branch)
+
+
+DEFAULT_REGISTRY: Final = VariantRegistry()
+"""The registry used unless another one is specified in the runtime configuration."""
+
+VARIANTS: Final = DEFAULT_REGISTRY.variants
+"""The default registry's variants; kept for compatibility."""
+
+DETECT_ORDER: Final = DEFAULT_REGISTRY.detect_order
+"""The default registry's variants in detect order; kept for compatibility."""
+
+
+def get_registry(cfg: defs.Config) -> VariantRegistry:
+    """Return the variant registry to use for the specified runtime configuration."""
+    return cfg.registry if cfg.registry is not None else DEFAULT_REGISTRY
+
+
+def build_variants(cfg: defs.Config) -> None:
+    """Load the variant definitions, build the indices of the registry in use."""
+    get_registry(cfg).build(cfg)
+
+
+def lookup_variant(cfg: defs.Config, name: str) -> defs.Variant | None:
+    """Return a single merged variant without building the detection indices."""
+    return get_registry(cfg).lookup_variant(cfg, name)
+
+
+def lookup_by_alias(cfg: defs.Config, alias: str) -> defs.Variant | None:
+    """Return the variant with the specified builder alias."""
+    return get_registry(cfg).lookup_by_alias(cfg, alias)
+
 
-    order.reverse()
-    DETECT_ORDER.extend([VARIANTS[name] for name in order])
-    cfg.diag("Detect order: {names}".format(names=" ".join(var.name for var in DETECT_ORDER)))
+def lookup_by_branch(cfg: defs.Config, branch: str) -> defs.Variant | None:
+    """Return the variant with the specified sp-pkg branch."""
+    return get_registry(cfg).lookup_by_branch(cfg, branch)
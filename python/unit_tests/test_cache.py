@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the on-disk cache of the detected build variant."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+import tempfile
+import typing
+from unittest import mock
+
+import pytest
+
+from sp_variant import __main__ as sp_main
+from sp_variant import cache
+from sp_variant import defs
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+def test_detect_store() -> None:
+    """Make sure that detect_variant() records the examined files."""
+    with tempfile.TemporaryDirectory() as tempd_obj:
+        tempd: Final = pathlib.Path(tempd_obj)
+        cfg: Final = defs.Config(cache_dir=tempd / "cache")
+        var: Final = variant.detect_variant(cfg)
+        assert cache.load(cfg) == var.name
+
+        cache_file: Final = tempd / "cache" / cache.CACHE_FILENAME
+        lines: Final = cache_file.read_text(encoding="UTF-8").splitlines()
+        assert f"variant\t{var.name}" in lines
+        assert any(line.split("\t")[1] == "/etc/os-release" for line in lines[2:])
+
+        with mock.patch.object(
+            variant,
+            "_detect_from_os_release",
+            side_effect=AssertionError("the cache was not used"),
+        ):
+            assert variant.detect_variant(cfg) == var
+
+
+def test_invalidate() -> None:
+    """Make sure the cache is ignored if any of the files changes."""
+    with tempfile.TemporaryDirectory() as tempd_obj:
+        tempd: Final = pathlib.Path(tempd_obj)
+        cfg: Final = defs.Config(cache_dir=tempd / "cache")
+
+        present: Final = tempd / "present.txt"
+        present.write_text("hello\n", encoding="UTF-8")
+        missing: Final = tempd / "missing.txt"
+        files: Final = {str(present): cache.file_id(str(present)), str(missing): None}
+        assert files[str(present)] is not None
+
+        cache.store(cfg, "CENTOS7", files)
+        assert cache.load(cfg) == "CENTOS7"
+        assert variant.detect_variant(cfg).name == "CENTOS7"
+
+        missing.write_text("now it is here\n", encoding="UTF-8")
+        assert cache.load(cfg) is None
+        missing.unlink()
+        assert cache.load(cfg) == "CENTOS7"
+
+        present.write_text("hello there\n", encoding="UTF-8")
+        assert cache.load(cfg) is None
+        assert variant.detect_variant(cfg).name != "CENTOS7"
+        assert cache.load(cfg) != "CENTOS7"
+
+
+@pytest.mark.parametrize(
+    ("args", "env", "cached"),
+    [
+        ([], None, False),
+        (["--no-cache"], None, False),
+        (["--cache"], None, True),
+        ([], "1", True),
+        ([], "0", False),
+        (["--no-cache"], "1", False),
+    ],
+)
+def test_no_cache(args: list[str], env: str | None, *, cached: bool) -> None:
+    """Make sure the command-line tool only uses the cache if asked to."""
+    with tempfile.TemporaryDirectory() as tempd_obj:
+        cache_dir: Final = pathlib.Path(tempd_obj) / "cache"
+        with mock.patch.object(sp_main, "_PATH_CACHE_DIR", new=cache_dir), mock.patch.object(
+            sys,
+            "argv",
+            ["sp_variant", *args, "detect"],
+        ), mock.patch.dict(os.environ, {} if env is None else {"SP_VARIANT_CACHE": env}):
+            if env is None:
+                os.environ.pop("SP_VARIANT_CACHE", None)
+            cfg, _ = sp_main.parse_arguments()
+        assert cfg.cache_dir == (cache_dir if cached else None)
+
+        var: Final = variant.detect_variant(cfg)
+        if not cached:
+            assert not cache_dir.exists()
+            assert cache.load(cfg) is None
+            return
+
+        assert sorted(path.name for path in cache_dir.iterdir()) == [cache.CACHE_FILENAME]
+        assert cache.load(cfg) == var.name
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the CBOR encoder and the loader of the encoded variant definitions."""
+
+from __future__ import annotations
+
+import json
+import re
+import typing
+
+import pytest
+
+from sp_variant import cbor
+from sp_variant import defs
+from sp_variant import serialize
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Final
+
+
+@pytest.mark.parametrize(
+    ("obj", "encoded"),
+    [
+        (0, "00"),
+        (23, "17"),
+        (24, "1818"),
+        (1000, "1903e8"),
+        (1000000, "1a000f4240"),
+        (1000000000000, "1b000000e8d4a51000"),
+        (-1, "20"),
+        (-1000, "3903e7"),
+        (1.5, "fb3ff8000000000000"),
+        (False, "f4"),
+        (True, "f5"),
+        (None, "f6"),
+        ("", "60"),
+        ("IETF", "6449455446"),
+        ("ü", "62c3bc"),
+        ([], "80"),
+        ((1, [2, 3]), "8201820203"),
+        ({"b": 1, "a": [2]}, "a261618102616201"),
+    ],
+)
+def test_values(obj: Any, encoded: str) -> None:  # noqa: ANN401
+    """Encode and decode some simple values, compare with RFC 8949, appendix A."""
+    data: Final = cbor.dumps(obj)
+    assert data == bytes.fromhex("d9d9f7" + encoded)
+    assert cbor.loads(data) == json.loads(json.dumps(obj))
+    assert cbor.loads(bytes.fromhex(encoded)) == json.loads(json.dumps(obj))
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    [
+        "",
+        "19e8",
+        "62c3",
+        "0000",
+        "9f01ff",
+        "a10102",
+        "c11a514b67b0",
+        "f7",
+        "62c328",
+    ],
+)
+def test_invalid(encoded: str) -> None:
+    """Make sure invalid or unsupported CBOR data is rejected."""
+    with pytest.raises(cbor.VariantCBORError):
+        cbor.loads(bytes.fromhex(encoded))
+
+
+def test_show_all() -> None:
+    """Make sure the CBOR document matches the JSON one and may be loaded back."""
+    all_variants: Final = variant.get_all_variants()
+    order: Final = variant.get_all_variants_in_order()
+    doc: Final = serialize.build_show_all(all_variants, order)
+    data: Final = cbor.dumps(doc)
+    assert cbor.loads(data) == json.loads(serialize.dumps(doc))
+
+    loaded, loaded_order = cbor.load_show_all(data)
+    assert loaded == all_variants
+    assert loaded_order == order
+
+
+@pytest.mark.parametrize("var", variant.get_all_variants_in_order(), ids=lambda var: var.name)
+def test_show(var: defs.Variant) -> None:
+    """Make sure a single variant definition may be loaded back."""
+    data: Final = cbor.dumps(serialize.build_show(var))
+    assert cbor.loads(data) == json.loads(serialize.dumps(serialize.build_show(var)))
+    assert cbor.load_show(data) == var
+
+
+def test_format_version() -> None:
+    """Make sure a document with a different major format version is rejected."""
+    doc: Final = serialize.build_show(variant.get_by_alias("alma8"))
+    newer: Final = {
+        **doc,
+        "format": {"version": {"major": defs.FORMAT_VERSION[0], "minor": 999}},
+        "extra": "ignored",
+    }
+    assert cbor.load_show(cbor.dumps(newer)) == doc["variant"]
+
+    incompatible: Final = {
+        **doc,
+        "format": {"version": {"major": defs.FORMAT_VERSION[0] + 1, "minor": 0}},
+    }
+    with pytest.raises(cbor.VariantCBORError, match="format version"):
+        cbor.load_show(cbor.dumps(incompatible))
+
+    with pytest.raises(cbor.VariantCBORError, match="variant"):
+        cbor.load_show(cbor.dumps({**doc, "variant": {"name": "ALMA8"}}))
+
+
+def test_regex_flags() -> None:
+    """Make sure patterns with flags that would be lost are not encoded."""
+    var: Final = variant.get_variant("ALMA9")
+    doc: Final = serialize.build_show(var)
+    assert cbor.load_show(cbor.dumps(doc)).detect == var.detect
+
+    for detect in (
+        var.detect._replace(regex=defs.lazy_pattern(var.detect.regex.pattern, re.X | re.I)),
+        var.detect._replace(regex=defs.lazy_pattern(var.detect.regex.pattern)),
+        var.detect._replace(os_version_regex=re.compile(var.detect.os_version_regex.pattern, re.M)),
+    ):
+        with pytest.raises(cbor.VariantCBORError, match="unexpected flags"):
+            cbor.dumps({**doc, "variant": var._replace(detect=detect)})
+
+
+def test_nesting() -> None:
+    """Make sure deeply nested data is rejected without exhausting the stack."""
+    nested: Final = bytes.fromhex("81") * (cbor.MAX_DEPTH - 1) + bytes.fromhex("80")
+    assert cbor.loads(nested) is not None
+    with pytest.raises(cbor.VariantCBORError, match="nested too deeply"):
+        cbor.loads(bytes.fromhex("81") * cbor.MAX_DEPTH + bytes.fromhex("80"))
+    with pytest.raises(cbor.VariantCBORError, match="nested too deeply"):
+        cbor.loads(bytes.fromhex("81") * 100000)
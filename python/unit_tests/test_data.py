@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Make sure the pre-merged variant data and `show all` modules are up to date."""
+
+from __future__ import annotations
+
+import io
+import pathlib
+import tempfile
+import typing
+from unittest import mock
+
+import pytest
+
+from sp_build_repo import diag
+from sp_build_repo import subst
+from sp_variant import __main__ as sp_main
+from sp_variant import data
+from sp_variant import defs
+from sp_variant import serialize
+from sp_variant import show_all
+from sp_variant import variant
+from sp_variant import vbuild
+
+
+if typing.TYPE_CHECKING:
+    import types
+    from typing import Final
+
+
+def test_merged() -> None:
+    """Make sure the data module contains the merged variant definitions."""
+    merged: Final = vbuild.merge_definitions(defs.Config(verbose=False))
+    assert list(data.VARIANTS) == list(merged)
+    assert list(reversed(merged)) == data.DETECT_ORDER
+
+    for name, var in merged.items():
+        pre: defs.Variant = data.VARIANTS[name]
+        assert defs.jsonify(pre) == defs.jsonify(var)
+        for regex, pre_regex in (
+            (var.detect.regex, pre.detect.regex),
+            (var.detect.os_version_regex, pre.detect.os_version_regex),
+        ):
+            assert isinstance(pre_regex, defs.LazyPattern)
+            assert pre_regex is regex
+
+
+@pytest.mark.parametrize("module", [data, show_all])
+def test_rendered(module: types.ModuleType) -> None:
+    """Make sure the generated module is the same as the one the template would produce."""
+    data_file: Final = pathlib.Path(typing.cast(str, module.__file__))
+    with tempfile.TemporaryDirectory() as tempd_obj:
+        tempd: Final = pathlib.Path(tempd_obj)
+        diag.setup_logger(verbose=False)
+        cfg: Final = subst.Config(
+            output=tempd / data_file.name,
+            output_mode=0o644,
+            template=data_file.with_suffix(".py.j2"),
+            verbose=False,
+        )
+        subst.substitute(cfg)
+
+        assert cfg.output.read_text(encoding="UTF-8") == data_file.read_text(encoding="UTF-8")
+
+
+def test_show_all() -> None:
+    """Make sure the precomputed `show all` output matches the variant data."""
+    expected: Final = (
+        serialize.dumps(
+            serialize.build_show_all(
+                variant.get_all_variants(),
+                variant.get_all_variants_in_order(),
+            ),
+        )
+        + "\n"
+    )
+    assert expected == show_all.SHOW_ALL
+    assert serialize.fingerprint(expected) == show_all.SHOW_ALL_FINGERPRINT
+
+
+def test_show_all_precomputed(capsys: pytest.CaptureFixture[str]) -> None:
+    """Make sure plain `show all` outputs the precomputed document without building it."""
+    with mock.patch.object(sp_main, "show_get_data") as get_data:
+        sp_main.cmd_show(defs.Config(cache_dir=None, command="all"))
+    get_data.assert_not_called()
+    assert capsys.readouterr().out == show_all.SHOW_ALL
+
+
+@pytest.mark.parametrize("name", ["all", "ALMA8"])
+def test_if_changed(name: str, capsys: pytest.CaptureFixture[str]) -> None:
+    """Make sure `show --if-changed` only outputs anything if the fingerprint differs."""
+    sp_main.cmd_show(defs.Config(cache_dir=None, command=name))
+    full: Final = capsys.readouterr().out
+    fingerprint: Final = serialize.fingerprint(full)
+
+    sp_main.cmd_show(defs.Config(cache_dir=None, command=name, if_changed="0" * 64))
+    assert capsys.readouterr().out == full
+
+    with pytest.raises(SystemExit) as exc_info:
+        sp_main.cmd_show(defs.Config(cache_dir=None, command=name, if_changed=fingerprint))
+    assert exc_info.value.code == sp_main.EXIT_UNCHANGED
+    assert not capsys.readouterr().out
+
+    staging: Final = vbuild.DEFAULT_REGISTRY.with_overrides(
+        defs.Config(),
+        {"ALMA8": {"descr": "AlmaLinux, staging"}},
+    )
+    sp_main.cmd_show(
+        defs.Config(cache_dir=None, command=name, if_changed=fingerprint, registry=staging),
+    )
+    assert "AlmaLinux, staging" in capsys.readouterr().out
+
+
+def test_show_batch(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    """Make sure several variants may be displayed, one per line."""
+    names: Final = ["ALMA9", "debian12", "ubuntu-22.04"]
+    expected: Final = [
+        serialize.dumps(serialize.build_show(var), compact=True)
+        for var in (
+            variant.get_variant("ALMA9"),
+            variant.get_variant("DEBIAN12"),
+            variant.get_variant("UBUNTU2204"),
+        )
+    ]
+    sp_main.cmd_show_batch(defs.Config(cache_dir=None, names=names))
+    assert capsys.readouterr().out.splitlines() == expected
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join([*names, "", "nope", ""])))
+    with pytest.raises(SystemExit) as exc_info:
+        sp_main.cmd_show_batch(defs.Config(cache_dir=None, fields=["builder.alias"]))
+    assert exc_info.value.code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "alma9",
+        "debian12",
+        "ubuntu-22.04",
+        '{"error":"Invalid build variant \'nope\'","name":"nope"}',
+    ]
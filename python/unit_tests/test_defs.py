@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test some of the common definitions for the variant detection library."""
+
+from __future__ import annotations
+
+import re
+import typing
+
+import pytest
+
+from sp_variant import defs
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+def test_lazy_pattern() -> None:
+    """Make sure a lazy pattern is only compiled when needed and behaves like one."""
+    lazy: Final = defs.LazyPattern(r"^ (?P<word> [a-z]+ ) \s+ 9 ", re.X)
+    assert lazy._compiled is None  # noqa: SLF001
+    assert lazy.pattern == r"^ (?P<word> [a-z]+ ) \s+ 9 "
+    assert lazy.flags == re.X
+    assert defs.jsonify({"regex": lazy}) == {"regex": lazy.pattern}
+    assert lazy._compiled is None  # noqa: SLF001
+
+    match: Final = lazy.match("alma  9.3")
+    assert match is not None
+    assert match.group("word") == "alma"
+    assert lazy._compiled is not None  # noqa: SLF001
+    assert lazy.groupindex == {"word": 1}
+    assert lazy.search("not at the start: rocky 9") is None
+    assert lazy.fullmatch("rocky 9") is not None
+
+    assert lazy == defs.LazyPattern(lazy.pattern, re.X)
+    assert lazy != defs.LazyPattern(lazy.pattern)
+    assert len({lazy, defs.LazyPattern(lazy.pattern, re.X)}) == 1
+
+
+def test_lazy_pattern_shared() -> None:
+    """Make sure the same lazy pattern object is returned for the same regular expression."""
+    first: Final = defs.lazy_pattern(r"^7(?:$|\.[0-9])")
+    assert defs.lazy_pattern(r"^7(?:$|\.[0-9])") is first
+    assert defs.lazy_pattern(r"^7(?:$|\.[0-9])", re.X) is not first
+
+
+def test_frozen_dict() -> None:
+    """Make sure a frozen dictionary behaves like a read-only mapping."""
+    fdict: Final = defs.FrozenDict({"a": "1", "b": "2"})
+    assert fdict == {"a": "1", "b": "2"}
+    assert fdict == defs.FrozenDict([("b", "2"), ("a", "1")])
+    assert fdict != {"a": "1"}
+    assert hash(fdict) == hash(defs.FrozenDict({"b": "2", "a": "1"}))
+    assert len({fdict, defs.FrozenDict({"b": "2", "a": "1"})}) == 1
+    assert list(fdict) == ["a", "b"]
+    assert fdict["b"] == "2"
+    assert fdict.get("c") is None
+    assert defs.jsonify({"package": fdict}) == {"package": {"a": "1", "b": "2"}}
+
+    updated: Final = fdict | {"b": "3", "c": "4"}
+    assert updated == {"a": "1", "b": "3", "c": "4"}
+    assert fdict == {"a": "1", "b": "2"}
+
+    with pytest.raises(TypeError):
+        fdict["a"] = "3"  # type: ignore[index]
+
+
+def test_intern_command() -> None:
+    """Make sure identical command vectors are shared."""
+    first: Final = defs.intern_command(["echo", "hello", "world"])
+    second: Final = defs.intern_command(("echo", "hello", "world"))
+    assert first == ("echo", "hello", "world")
+    assert first is second
+    assert defs.intern_command(["echo", "hello"]) is not first
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the file-based build variant detection heuristics."""
+
+from __future__ import annotations
+
+import errno
+import itertools
+import pathlib
+import typing
+from unittest import mock
+
+import pytest
+
+from sp_variant import defs
+from sp_variant import variant
+from sp_variant import vbuild
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+_OS_RELEASE_LINES: Final = [
+    None,
+    'PRETTY_NAME="Debian GNU/Linux 12 (bookworm)"',
+    'PRETTY_NAME="Debian GNU/Linux trixie/sid"',
+    'PRETTY_NAME="Ubuntu 22.04.3 LTS"',
+    'NAME="Ubuntu"\nPRETTY_NAME="Linux Mint 20.3"',
+    'PRETTY_NAME="Ubuntu 24.04 LTS (Noble Numbat)"',
+]
+
+_REDHAT_RELEASE_LINES: Final = [
+    None,
+    errno.EACCES,
+    "AlmaLinux release 9.3 (Shamrock Pampas Cat)",
+    "AlmaLinux release 8.9 (Midnight Oncilla)",
+    "CentOS Stream release 9",
+    "CentOS Linux release 7.9.2009 (Core)",
+    "CentOS Linux release 8.5.2111",
+    "Red Hat Enterprise Linux release 8.6 (Ootpa)",
+    "Rocky Linux release 8.7 (Green Obsidian)",
+    "Rocky Linux release 9.1 (Blue Onyx)\nCentOS Linux release 8.5.2111",
+    "Something else entirely",
+]
+
+_ORACLE_RELEASE_LINES: Final = [
+    None,
+    errno.EACCES,
+    "Oracle Linux Server release 7.9",
+    "Oracle Linux Server release 8.6",
+]
+
+
+def _detect_linear() -> defs.Variant | None:
+    """Examine the files one variant at a time, the way it used to be done."""
+    for var in vbuild.DEFAULT_REGISTRY.detect_order:
+        try:
+            contents = pathlib.Path(var.detect.filename).read_text(encoding="Latin-1")
+            if any(var.detect.regex.match(line) for line in contents.splitlines()):
+                return var
+        except OSError as err:
+            if err.errno != errno.ENOENT:
+                raise variant.VariantDetectError(str(err)) from err
+
+    return None
+
+
+@pytest.mark.parametrize(
+    ("os_release", "redhat_release", "oracle_release"),
+    itertools.product(_OS_RELEASE_LINES, _REDHAT_RELEASE_LINES, _ORACLE_RELEASE_LINES),
+)
+def test_detect_from_files(
+    os_release: str | None,
+    redhat_release: str | int | None,
+    oracle_release: str | int | None,
+) -> None:
+    """Make sure the single-pass combined matcher yields the same result as a linear scan."""
+    contents: Final = {
+        "/etc/os-release": os_release,
+        "/etc/redhat-release": redhat_release,
+        "/etc/oracle-release": oracle_release,
+    }
+    registry: Final = vbuild.DEFAULT_REGISTRY
+    registry.build(variant.Config())
+    assert sorted(dfile.filename for dfile in registry.detect_files) == sorted(contents)
+    reads: Final[list[str]] = []
+
+    def read_text(path: pathlib.Path, *, encoding: str) -> str:
+        """Simulate reading one of the examined files."""
+        assert encoding == "Latin-1"
+        reads.append(str(path))
+        value: Final = contents[str(path)]
+        if value is None:
+            raise FileNotFoundError(errno.ENOENT, "No such file", str(path))
+        if isinstance(value, int):
+            raise OSError(value, "Nope", str(path))
+        return value + "\n"
+
+    with mock.patch.object(pathlib.Path, "read_text", autospec=True, side_effect=read_text):
+        try:
+            expected: defs.Variant | None = _detect_linear()
+        except variant.VariantDetectError:
+            with pytest.raises(variant.VariantDetectError):
+                variant._detect_from_files(variant.Config(), registry, {})  # noqa: SLF001
+            return
+
+        reads.clear()
+        assert variant._detect_from_files(variant.Config(), registry, {}) == expected  # noqa: SLF001
+
+    assert len(reads) == len(set(reads))
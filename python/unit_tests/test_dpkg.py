@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the dpkg status database reader."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess  # noqa: S404
+import typing
+from unittest import mock
+
+import pytest
+
+from sp_variant import defs
+from sp_variant import dpkg
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    import pathlib
+    from typing import Final
+
+
+_COUNT: Final = 20000
+"""The number of packages in the synthetic status database."""
+
+_STATUSES: Final = (
+    "install ok installed",
+    "deinstall ok config-files",
+    "install ok installed",
+    "hold ok installed",
+    "install reinstreq half-installed",
+    "purge ok not-installed",
+    "install ok installed",
+)
+"""The package states to cycle through, only some of them "ii"."""
+
+
+def _stanza(idx: int) -> tuple[str, defs.OSPackage | None]:
+    """Build a single stanza and the package record expected for it, if any."""
+    name: Final = f"pkg{idx:05d}-{'dev' if idx % 3 else 'lib'}"
+    status: Final = _STATUSES[idx % len(_STATUSES)]
+    version: Final = f"{idx % 4}:{idx}.{idx % 10}-{idx % 7}" if idx % 5 else f"{idx}.0"
+    arch: Final = ("amd64", "all", "i386")[idx % 3]
+    # Vary the order of the fields a bit, add some multiline ones.
+    fields: Final = [
+        f"Status: {status}",
+        f"Package: {name}",
+        "Priority: optional",
+        "Maintainer: Nobody <nobody@example.com>",
+        f"Architecture: {arch}",
+        f"Version: {version}",
+        "Depends: libc6 (>= 2.36)",
+        "Description: a synthetic package\n This is not a real package.\n .\n Status: fake",
+    ]
+    if idx % 2:
+        fields[0], fields[1] = fields[1], fields[0]
+    expected: Final = (
+        defs.OSPackage(
+            name=name,
+            version=version[2:] if version.startswith("0:") else version,
+            arch=arch,
+            status="installed",
+        )
+        if status == "install ok installed"
+        else None
+    )
+    return "\n".join(fields) + "\n", expected
+
+
+@pytest.fixture(scope="module")
+def status_db(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[pathlib.Path, list[defs.OSPackage]]:
+    """Generate a synthetic status database, return its path and the installed packages."""
+    admindir: Final = tmp_path_factory.mktemp("dpkg")
+    stanzas: Final = [_stanza(idx) for idx in range(_COUNT)]
+    path: Final = admindir / "status"
+    path.write_text("\n".join(text for text, _ in stanzas), encoding="UTF-8")
+    return path, [pkg for _, pkg in stanzas if pkg is not None]
+
+
+def test_all(status_db: tuple[pathlib.Path, list[defs.OSPackage]]) -> None:
+    """Read all the installed packages."""
+    path, expected = status_db
+    assert list(dpkg.iter_installed(path=path)) == expected
+
+
+_PATTERNS: Final = [
+    ["pkg0000*"],
+    ["pkg1234[0-4]-*", "pkg19999-dev", "pkg1234?-*"],
+    ["*-lib:amd64", "pkg0001?-dev:i3*"],
+    ["pkg000[!0-4]*", "nothing*"],
+]
+"""The `dpkg-query` patterns to test with."""
+
+
+@pytest.mark.parametrize("patterns", _PATTERNS)
+def test_patterns(
+    status_db: tuple[pathlib.Path, list[defs.OSPackage]],
+    patterns: list[str],
+) -> None:
+    """Make sure the patterns select the expected packages, each one only once."""
+    path, expected = status_db
+    pats: Final = dpkg._parse_patterns(patterns)  # noqa: SLF001
+    res: Final[list[defs.OSPackage]] = []
+    if "nothing*" in patterns:
+        with pytest.raises(dpkg.VariantDpkgNoMatchError, match="nothing") as exc_info:
+            res.extend(dpkg.iter_installed(patterns, path=path))
+        assert exc_info.value.patterns == ["nothing*"]
+    else:
+        res.extend(dpkg.iter_installed(patterns, path=path))
+    assert res
+    assert res == [pkg for pkg in expected if dpkg._matches(pkg.name, pkg.arch, pats)]  # noqa: SLF001
+
+
+@pytest.mark.skipif(shutil.which("dpkg-query") is None, reason="No dpkg-query program")
+@pytest.mark.parametrize("patterns", [None, *_PATTERNS])
+def test_dpkg_query(
+    status_db: tuple[pathlib.Path, list[defs.OSPackage]],
+    patterns: list[str] | None,
+) -> None:
+    """Make sure the results and the failures are the same as the ones of `dpkg-query`."""
+    path, _ = status_db
+    debian: Final = variant.get_variant("DEBIAN12")
+    subproc: Final = debian._replace(
+        commands=debian.commands._replace(
+            package=debian.commands.package._replace(
+                list_all=(
+                    "dpkg-query",
+                    f"--admindir={path.parent}",
+                    *debian.commands.package.list_all[1:],
+                ),
+            ),
+        ),
+    )
+
+    def collect(var: defs.Variant) -> tuple[list[defs.OSPackage], bool]:
+        """List the packages, check whether the listing failed afterwards."""
+        res: Final[list[defs.OSPackage]] = []
+        try:
+            res.extend(variant.iter_all_packages(var, patterns))
+        except subprocess.CalledProcessError:
+            return res, True
+        return res, False
+
+    with mock.patch("sp_variant.dpkg.STATUS_PATH", new=path.parent / "nothing"):
+        via_cmd: Final = collect(subproc)
+    with mock.patch("sp_variant.dpkg.STATUS_PATH", new=path), mock.patch(
+        "subprocess.Popen",
+    ) as popen:
+        via_db: Final = collect(debian)
+    popen.assert_not_called()
+    assert via_db == via_cmd
+    assert via_cmd[1] == (patterns is not None and "nothing*" in patterns)
+
+
+def test_edge_cases(tmp_path: pathlib.Path) -> None:
+    """Empty files, extra blank lines, no trailing newline, missing files."""
+    path: Final = tmp_path / "status"
+    path.write_bytes(b"")
+    assert not list(dpkg.iter_installed(path=path))
+
+    path.write_bytes(
+        b"\n\nPackage: a\nStatus: install ok installed\nVersion: 1\n\n\n\n"
+        b"Package: b\nVersion: 2\nArchitecture: all\nStatus: install ok installed",
+    )
+    assert list(dpkg.iter_installed(path=path)) == [
+        defs.OSPackage(name="a", version="1", arch="", status="installed"),
+        defs.OSPackage(name="b", version="2", arch="all", status="installed"),
+    ]
+
+    path.write_bytes(b"Status: install ok installed\nVersion: 1\n")
+    with pytest.raises(dpkg.VariantDpkgError):
+        list(dpkg.iter_installed(path=path))
+
+    with pytest.raises(FileNotFoundError):
+        list(dpkg.iter_installed(path=tmp_path / "nothing"))
+
+
+def test_iter_all_packages(status_db: tuple[pathlib.Path, list[defs.OSPackage]]) -> None:
+    """Make sure the status database is used for Debian, the command is the fallback."""
+    path, expected = status_db
+    debian: Final = variant.get_variant("DEBIAN12")
+    with mock.patch("sp_variant.dpkg.STATUS_PATH", new=path), mock.patch(
+        "subprocess.Popen",
+    ) as popen:
+        assert variant.list_all_packages(debian, iter(["pkg0000*"])) == [
+            pkg for pkg in expected if pkg.name.startswith("pkg0000")
+        ]
+        assert len(variant.list_all_packages(debian)) == len(expected)
+    popen.assert_not_called()
+
+    with mock.patch("sp_variant.dpkg.STATUS_PATH", new=path.parent / "nothing"), mock.patch(
+        "subprocess.Popen",
+        side_effect=FileNotFoundError("no dpkg-query"),
+    ) as popen, pytest.raises(FileNotFoundError, match="no dpkg-query"):
+        variant.list_all_packages(debian, iter(["a*"]))
+    popen.assert_called_once()
+    assert popen.call_args.args[0] == [*debian.commands.package.list_all, "a*"]
+
+
+def test_pending_updates(tmp_path: pathlib.Path) -> None:
+    """Make sure `dpkg-query` is run if an interrupted dpkg run left journal entries."""
+    path: Final = tmp_path / "status"
+    path.write_bytes(
+        b"Package: a\nStatus: install ok installed\nVersion: 1\n\n"
+        b"Package: b\nStatus: deinstall ok config-files\nVersion: 2\n",
+    )
+    assert not dpkg.has_pending_updates(path)
+    updates: Final = tmp_path / "updates"
+    updates.mkdir()
+    (updates / "tmp.i").write_bytes(b"")
+    assert not dpkg.has_pending_updates(path)
+
+    debian: Final = variant.get_variant("DEBIAN12")
+    with mock.patch("sp_variant.dpkg.STATUS_PATH", new=path), mock.patch(
+        "subprocess.Popen",
+    ) as popen:
+        assert variant.list_all_packages(debian, ["a", "b*"]) == [
+            defs.OSPackage(name="a", version="1", arch="", status="installed"),
+        ]
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            variant.list_all_packages(debian, ["a", "c*"])
+        assert exc_info.value.cmd == [*debian.commands.package.list_all, "a", "c*"]
+        popen.assert_not_called()
+
+        (updates / "0001").write_bytes(b"Package: a\nStatus: install ok half-configured\n")
+        assert dpkg.has_pending_updates(path)
+        popen.side_effect = FileNotFoundError("no dpkg-query")
+        with pytest.raises(FileNotFoundError, match="no dpkg-query"):
+            variant.list_all_packages(debian)
+        popen.assert_called_once()
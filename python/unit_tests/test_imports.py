@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Make sure the command-line tool does not import modules it does not need."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import subprocess  # noqa: S404
+import sys
+import typing
+
+import pytest
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+_FORBIDDEN: Final = {
+    "hashlib",
+    "json",
+    "shlex",
+    "socket",
+    "socketserver",
+    "subprocess",
+    "tempfile",
+    "sp_variant.cbor",
+    "sp_variant.rpc",
+    "sp_variant.serialize",
+    "sp_variant.server",
+    "sp_variant.show_all",
+}
+"""The modules that `sp_variant detect` should never need."""
+
+_MAX_EXTRA_MODULES: Final = 120
+"""The number of modules that `sp_variant detect` may import over a bare interpreter."""
+
+
+def _imported(*args: str) -> set[str]:
+    """Run the Python interpreter with `-X importtime`, return the names of the modules."""
+    env: Final = dict(os.environ)
+    srcdir: Final = str(pathlib.Path(__file__).parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [srcdir, env["PYTHONPATH"]] if env.get("PYTHONPATH") else [srcdir],
+    )
+    cmd: Final = [sys.executable, "-X", "importtime", *args]
+    res: Final = subprocess.run(cmd, capture_output=True, check=False, encoding="UTF-8", env=env)  # noqa: S603
+    assert res.returncode in {0, 1}, res.stderr
+    return {
+        fields[2].strip()
+        for fields in (line.split("|") for line in res.stderr.splitlines())
+        if len(fields) == 3 and fields[0].startswith("import time:") and fields[1].strip().isdigit()
+    }
+
+
+@pytest.mark.skipif(sys.implementation.name != "cpython", reason="-X importtime is CPython-only")
+def test_detect_imports() -> None:
+    """Run `sp_variant detect`, make sure it does not import anything heavyweight."""
+    baseline: Final = _imported("-c", "pass")
+    detect: Final = _imported("-m", "sp_variant", "--no-cache", "detect")
+    assert "sp_variant.variant" in detect
+    assert not detect & _FORBIDDEN
+    assert len(detect - baseline) <= _MAX_EXTRA_MODULES
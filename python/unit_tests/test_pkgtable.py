@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the compact package table."""
+
+from __future__ import annotations
+
+import typing
+from unittest import mock
+
+import pytest
+
+from sp_variant import defs
+from sp_variant import pkgtable
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    from typing import Final
+
+
+_PKGS: Final = [
+    defs.OSPackage(name="zsh", version="5.9-4", arch="amd64", status="installed"),
+    defs.OSPackage(name="libc6", version="2.36-9", arch="amd64", status="installed"),
+    defs.OSPackage(name="kernel", version="5.14.0-2", arch="x86_64", status="installed"),
+    defs.OSPackage(name="libc6", version="2.36-8", arch="i386", status="installed"),
+    defs.OSPackage(name="", version="", arch="", status="config-files"),
+    defs.OSPackage(name="kernel", version="5.14.0-1", arch="x86_64", status="installed"),
+    defs.OSPackage(name="bash", version="1:5.2.15-2+b7", arch="amd64", status="installed"),
+]
+
+
+def test_convert() -> None:
+    """Convert a list of packages to a table and back."""
+    table: Final = pkgtable.PackageTable(iter(_PKGS))
+    assert len(table) == len(_PKGS)
+    assert table.to_list() == _PKGS
+    assert list(table) == _PKGS
+    assert table[-1] == _PKGS[-1]
+    assert table == pkgtable.PackageTable(_PKGS)
+    assert table != pkgtable.PackageTable(_PKGS[1:])
+    assert table.name(2) == "kernel"
+    assert table.version(6) == "1:5.2.15-2+b7"
+    with pytest.raises(IndexError):
+        table[len(_PKGS)]
+
+    empty: Final = pkgtable.PackageTable()
+    assert not empty
+    assert not empty.to_list()
+    assert "bash" not in empty
+
+
+def test_lookup() -> None:
+    """Look packages up by name and architecture."""
+    table: Final = pkgtable.PackageTable(_PKGS)
+    for pkg in _PKGS:
+        assert pkg.name in table
+        assert pkg in table
+    for name in ("a", "bas", "bash2", "libc", "zzz"):
+        assert name not in table
+    assert _PKGS[0]._replace(version="5.8") not in table
+    assert 42 not in table
+
+    assert table.rows("kernel") == [2, 5]
+    assert table.find("libc6") == [_PKGS[1], _PKGS[3]]
+    assert table.get_version("libc6") == "2.36-9"
+    assert table.get_version("libc6", "i386") == "2.36-8"
+    assert table.get_version("libc6", "arm64") is None
+    assert table.get_version("nothing") is None
+
+
+def test_list_all_packages() -> None:
+    """Make sure `list_all_packages()` may return a table."""
+    var: Final = variant.get_variant("ALMA9")
+    with mock.patch("sp_variant.variant.iter_all_packages", return_value=iter(_PKGS)) as iter_all:
+        table: Final = variant.list_all_packages(var, ["*"], as_table=True)
+    iter_all.assert_called_once_with(var, ["*"])
+    assert isinstance(table, pkgtable.PackageTable)
+    assert table.to_list() == _PKGS
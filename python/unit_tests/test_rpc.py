@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the JSON-RPC co-process mode."""
+
+from __future__ import annotations
+
+import io
+import json
+import typing
+from unittest import mock
+
+import pytest
+
+from sp_variant import defs
+from sp_variant import rpc
+from sp_variant import server
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Final
+
+
+def _ask(handler: server.Handler, req: Any) -> Any:  # noqa: ANN401
+    """Send a single request, decode the response."""
+    resp: Final = rpc.respond(handler, json.dumps(req))
+    assert resp is not None
+    assert resp.endswith("\n")
+    return json.loads(resp)
+
+
+def test_methods() -> None:
+    """Invoke some methods, check the results."""
+    handler: Final = server.Handler(defs.Config(cache_dir=None))
+    alma9: Final = variant.get_variant("ALMA9")
+    resp: Final = _ask(
+        handler,
+        {"jsonrpc": "2.0", "id": "x", "method": "command_list", "params": {"variant": "alma9"}},
+    )
+    assert resp["id"] == "x"
+    assert resp["result"]["package.install"] == list(alma9.commands.package.install)
+    assert resp["result"]["pkgfile.dep_query"] == list(alma9.commands.pkgfile.dep_query)
+
+    pkg: Final = defs.OSPackage(name="bash", version="5.2", arch="x86_64", status="installed")
+    with mock.patch("sp_variant.variant.list_all_packages", return_value=[pkg]) as list_all:
+        assert _ask(
+            handler,
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "list_packages",
+                "params": {"variant": "ALMA9", "patterns": ["bash"]},
+            },
+        ) == {"jsonrpc": "2.0", "id": 2, "result": [pkg._asdict()]}
+    list_all.assert_called_once_with(alma9, ["bash"])
+
+
+@pytest.mark.parametrize(
+    ("req", "code"),
+    [
+        ({"id": 1, "method": "detect"}, rpc.INVALID_REQUEST),
+        ({"jsonrpc": "2.0", "id": 1}, rpc.INVALID_REQUEST),
+        ({"jsonrpc": "2.0", "id": 1, "method": "nothing"}, rpc.METHOD_NOT_FOUND),
+        ({"jsonrpc": "2.0", "id": 1, "method": "show", "params": ["ALMA9"]}, rpc.INVALID_PARAMS),
+        (
+            {"jsonrpc": "2.0", "id": 1, "method": "show", "params": {"name": "nothing"}},
+            rpc.INVALID_PARAMS,
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 1, "method": "list_packages", "params": {"patterns": "a"}},
+            rpc.INVALID_PARAMS,
+        ),
+        ([], rpc.INVALID_REQUEST),
+    ],
+)
+def test_errors(req: Any, code: int) -> None:  # noqa: ANN401
+    """Make sure invalid requests are reported with the correct error code."""
+    resp: Final = _ask(server.Handler(defs.Config(cache_dir=None)), req)
+    assert set(resp) == {"jsonrpc", "id", "error"}
+    assert resp["error"]["code"] == code
+
+
+def test_serve() -> None:
+    """Read several requests, skip the notifications, answer a batch."""
+    requests: Final = [
+        {"jsonrpc": "2.0", "id": 1, "method": "features"},
+        {"jsonrpc": "2.0", "method": "features"},
+        [
+            {"jsonrpc": "2.0", "id": 2, "method": "package", "params": {"name": "KMOD"}},
+            {"jsonrpc": "2.0", "method": "detect"},
+        ],
+    ]
+    infile: Final = io.StringIO("".join(json.dumps(req) + "\n\n" for req in requests) + "{\n")
+    outfile: Final = io.StringIO()
+    alma8: Final = variant.get_variant("ALMA8")
+    with mock.patch("sp_variant.variant.detect_variant", return_value=alma8) as detect:
+        rpc.serve(defs.Config(cache_dir=None), infile, outfile)
+    detect.assert_called_once()
+
+    lines: Final = [json.loads(line) for line in outfile.getvalue().splitlines()]
+    assert len(lines) == 3
+    assert lines[0]["result"]["variant"] == defs.VERSION
+    assert lines[1] == [{"jsonrpc": "2.0", "id": 2, "result": alma8.package["KMOD"]}]
+    assert lines[2]["error"]["code"] == rpc.PARSE_ERROR
+
+
+def test_unexpected_errors() -> None:
+    """Make sure unexpected exceptions are reported and the co-process keeps running."""
+    requests: Final = [
+        {"jsonrpc": "2.0", "id": 1, "method": "detect"},
+        {"jsonrpc": "2.0", "id": 2, "method": "features"},
+    ]
+    infile: Final = io.StringIO("".join(json.dumps(req) + "\n" for req in requests))
+    outfile: Final = io.StringIO()
+    with mock.patch(
+        "sp_variant.variant.detect_variant",
+        side_effect=PermissionError("no access to os-release"),
+    ):
+        rpc.serve(defs.Config(cache_dir=None), infile, outfile)
+
+    lines: Final = [json.loads(line) for line in outfile.getvalue().splitlines()]
+    assert lines[0] == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "error": {
+            "code": rpc.SERVER_ERROR,
+            "message": "Could not handle the request: no access to os-release",
+        },
+    }
+    assert lines[1]["id"] == 2
+    assert lines[1]["result"]["variant"] == defs.VERSION
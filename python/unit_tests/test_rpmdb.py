@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the SQLite RPM database reader."""
+
+from __future__ import annotations
+
+import sqlite3
+import struct
+import typing
+from unittest import mock
+
+import pytest
+
+from sp_variant import defs
+from sp_variant import rpmdb
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    import pathlib
+    from typing import Final
+
+
+_COUNT: Final = 2000
+"""The number of packages in the synthetic database."""
+
+_TYPE_BIN: Final = 7
+_TYPE_I18NSTRING: Final = 9
+
+_TAG_HEADERIMMUTABLE: Final = 63
+_TAG_SUMMARY: Final = 1004
+
+
+def _build_header(entries: list[tuple[int, int, str | int | bytes]]) -> bytes:
+    """Build an RPM header blob out of (tag, type, value) entries."""
+    index: Final = bytearray()
+    store: Final = bytearray()
+    for tag, tag_type, value in entries:
+        if tag_type == rpmdb.TYPE_INT32:
+            assert isinstance(value, int)
+            while len(store) % 4:
+                store.append(0)
+            raw = struct.pack(">I", value)
+        elif isinstance(value, str):
+            raw = value.encode("UTF-8") + b"\0"
+        else:
+            assert isinstance(value, bytes)
+            raw = value
+        index.extend(struct.pack(">iIiI", tag, tag_type, len(store), 1))
+        store.extend(raw)
+
+    return struct.pack(">II", len(entries), len(store)) + bytes(index) + bytes(store)
+
+
+def _package(idx: int) -> tuple[bytes, defs.OSPackage]:
+    """Build the header of a synthetic package and the expected record."""
+    if idx % 100 == 99:
+        # Like the gpg-pubkey pseudo-packages: no architecture.
+        return _build_header(
+            [
+                (rpmdb.TAG_NAME, rpmdb.TYPE_STRING, "gpg-pubkey"),
+                (rpmdb.TAG_VERSION, rpmdb.TYPE_STRING, f"{idx:08x}"),
+                (rpmdb.TAG_RELEASE, rpmdb.TYPE_STRING, "5a6340b3"),
+            ],
+        ), defs.OSPackage(
+            name="gpg-pubkey",
+            version=f"{idx:08x}-5a6340b3",
+            arch="(none)",
+            status="installed",
+        )
+
+    name: Final = f"pkg{idx:04d}-{'devel' if idx % 3 else 'libs'}"
+    arch: Final = "noarch" if idx % 4 else "x86_64"
+    entries: Final[list[tuple[int, int, str | int | bytes]]] = [
+        (_TAG_HEADERIMMUTABLE, _TYPE_BIN, b"\0" * 16),
+        (rpmdb.TAG_NAME, rpmdb.TYPE_STRING, name),
+        (rpmdb.TAG_VERSION, rpmdb.TYPE_STRING, f"{idx}.{idx % 10}"),
+        (rpmdb.TAG_RELEASE, rpmdb.TYPE_STRING, f"{idx % 7}.el9"),
+        (_TAG_SUMMARY, _TYPE_I18NSTRING, "A synthetic package"),
+        (rpmdb.TAG_ARCH, rpmdb.TYPE_STRING, arch),
+    ]
+    if idx % 5 == 0:
+        entries.insert(4, (rpmdb.TAG_EPOCH, rpmdb.TYPE_INT32, idx % 3))
+    evr: Final = f"{idx}.{idx % 10}-{idx % 7}.el9"
+    return _build_header(entries), defs.OSPackage(
+        name=name,
+        version=f"{idx % 3}:{evr}" if idx % 5 == 0 else evr,
+        arch=arch,
+        status="installed",
+    )
+
+
+@pytest.fixture(scope="module")
+def rpm_db(tmp_path_factory: pytest.TempPathFactory) -> tuple[pathlib.Path, list[defs.OSPackage]]:
+    """Generate a synthetic RPM database, return its path and the packages in it."""
+    path: Final = tmp_path_factory.mktemp("rpm") / "rpmdb.sqlite"
+    pkgs: Final = [_package(idx) for idx in range(_COUNT)]
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE Packages (hnum INTEGER PRIMARY KEY AUTOINCREMENT, blob BLOB NOT NULL)",
+        )
+        conn.executemany("INSERT INTO Packages (blob) VALUES (?)", [(blob,) for blob, _ in pkgs])
+    conn.close()
+    return path, [pkg for _, pkg in pkgs]
+
+
+def test_all(rpm_db: tuple[pathlib.Path, list[defs.OSPackage]]) -> None:
+    """Read all the packages."""
+    path, expected = rpm_db
+    assert list(rpmdb.iter_installed(path=path)) == expected
+
+
+@pytest.mark.parametrize(
+    ("patterns", "count"),
+    [
+        (["pkg000*"], 10),
+        (["pkg123[0-4]-*", "gpg-pubkey"], 25),
+        (["*-libs", "*-libs"], 660),
+        (["nothing"], 0),
+    ],
+)
+def test_patterns(
+    rpm_db: tuple[pathlib.Path, list[defs.OSPackage]],
+    patterns: list[str],
+    count: int,
+) -> None:
+    """Make sure the patterns are matched against the package names."""
+    path, _ = rpm_db
+    res: Final = list(rpmdb.iter_installed(iter(patterns), path=path))
+    assert len(res) == count
+    assert len(set(res)) == len(res)
+
+
+@pytest.mark.parametrize(
+    "blob",
+    [
+        b"\0\0\0",
+        struct.pack(">IIiIiI", 1, 4, rpmdb.TAG_NAME, rpmdb.TYPE_STRING, 0, 1),
+        struct.pack(">IIiIiI", 1, 4, rpmdb.TAG_NAME, rpmdb.TYPE_STRING, 0, 1) + b"abcd",
+        struct.pack(">IIiIiI", 1, 4, rpmdb.TAG_NAME, rpmdb.TYPE_STRING, 8, 1) + b"abc\0",
+        struct.pack(">IIiIiI", 1, 4, rpmdb.TAG_EPOCH, rpmdb.TYPE_STRING + 2, 0, 1) + b"abc\0",
+    ],
+)
+def test_parse_header_errors(blob: bytes) -> None:
+    """Make sure malformed headers are reported."""
+    with pytest.raises(rpmdb.VariantRpmdbError):
+        rpmdb.parse_header(blob)
+
+
+def test_open_errors(tmp_path: pathlib.Path) -> None:
+    """Missing files, files that are not SQLite databases, missing tables."""
+    with pytest.raises(FileNotFoundError):
+        list(rpmdb.iter_installed(path=tmp_path / "nothing.sqlite"))
+    assert not (tmp_path / "nothing.sqlite").exists()
+
+    path: Final = tmp_path / "rpmdb.sqlite"
+    path.write_bytes(b"This is not a database.\n" * 100)
+    with pytest.raises(OSError, match="RPM database"):
+        list(rpmdb.iter_installed(path=path))
+
+    path.unlink()
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE Other (id INTEGER)")
+    conn.close()
+    with pytest.raises(OSError, match="RPM database"):
+        list(rpmdb.iter_installed(path=path))
+
+
+def test_iter_all_packages(rpm_db: tuple[pathlib.Path, list[defs.OSPackage]]) -> None:
+    """Make sure the database is used for the Red Hat family, the command is the fallback."""
+    path, expected = rpm_db
+    alma9: Final = variant.get_variant("ALMA9")
+    with mock.patch("sp_variant.rpmdb.DB_PATH", new=path), mock.patch("subprocess.Popen") as popen:
+        assert variant.list_all_packages(alma9) == expected
+        assert variant.list_all_packages(alma9, ["gpg-*"]) == [
+            pkg for pkg in expected if pkg.name == "gpg-pubkey"
+        ]
+    popen.assert_not_called()
+
+    with mock.patch("sp_variant.rpmdb.DB_PATH", new=path.parent / "nothing"), mock.patch(
+        "subprocess.Popen",
+        side_effect=FileNotFoundError("no rpm"),
+    ) as popen, pytest.raises(FileNotFoundError, match="no rpm"):
+        variant.list_all_packages(alma9, iter(["a*"]))
+    popen.assert_called_once()
+    assert popen.call_args.args[0] == [*alma9.commands.package.list_all, "a*"]
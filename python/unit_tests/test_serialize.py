@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the streaming JSON serializer."""
+
+from __future__ import annotations
+
+import enum
+import io
+import json
+import re
+import shlex
+import subprocess  # noqa: S404
+import typing
+
+import pytest
+
+from sp_variant import defs
+from sp_variant import serialize
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Final
+
+
+class _Point(typing.NamedTuple):
+    """A named tuple with fields that are not in sorted order."""
+
+    y: int
+    x: float
+
+
+class _Color(enum.IntEnum):
+    """An integer subclass."""
+
+    RED = 1
+
+
+def _expected(obj: Any) -> str:  # noqa: ANN401
+    """Serialize an object the way the command-line tool used to."""
+    return json.dumps(defs.jsonify(obj), sort_keys=True, indent=2)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        None,
+        True,
+        False,
+        0,
+        -17,
+        3.5,
+        float("nan"),
+        float("-inf"),
+        "",
+        "hello",
+        'quote " backslash \\ newline \n tab \t unicode é中\U0001f600',
+        [],
+        (),
+        {},
+        [[], {}, [[]], {"a": {}}],
+        {"b": 1, "a": [1, 2, {"d": None, "c": True}], "c": "three"},
+        _Point(y=2, x=1.5),
+        [_Point(y=0, x=0.0), {"point": _Point(y=-1, x=2.25)}],
+        defs.FrozenDict({"z": "1", "a": "2"}),
+        re.compile(r"^a \s+ b$", re.X),
+        defs.LazyPattern(r"^a \s+ b$", re.X),
+        _Color.RED,
+    ],
+)
+def test_values(obj: Any) -> None:  # noqa: ANN401
+    """Make sure various values are serialized exactly as `json.dumps()` would do it."""
+    assert serialize.dumps(obj) == _expected(obj)
+    assert serialize.dumps(obj, compact=True) == json.dumps(
+        defs.jsonify(obj),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def test_show_all() -> None:
+    """Make sure all the variant definitions are serialized the same way."""
+    data: Final = {
+        "format": {"version": {"major": defs.FORMAT_VERSION[0], "minor": defs.FORMAT_VERSION[1]}},
+        "version": defs.VERSION,
+        "variants": variant.get_all_variants(),
+        "order": [var.name for var in variant.get_all_variants_in_order()],
+    }
+    with io.StringIO() as buf:
+        serialize.dump(data, buf)
+        assert buf.getvalue() == _expected(data)
+
+    for var in variant.get_all_variants_in_order():
+        assert serialize.dumps({"variant": var}) == _expected({"variant": var})
+
+
+def test_unsupported() -> None:
+    """Make sure unsupported types are rejected."""
+    with pytest.raises(TypeError, match="object is not JSON serializable"):
+        serialize.dumps({"a": [1, object()]})
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected"),
+    [
+        (["builder.utf8_locale"], "C.UTF-8"),
+        (["supported.repo"], "true"),
+        (["package.KMOD"], "kmod"),
+        (
+            ["supported.repo", "family"],
+            '{\n  "family": "redhat",\n  "supported.repo": true\n}',
+        ),
+        (
+            ["commands.package.install", "builder.alias"],
+            json.dumps(
+                {
+                    "builder.alias": "alma8",
+                    "commands.package.install": list(
+                        variant.get_by_alias("alma8").commands.package.install,
+                    ),
+                },
+                indent=2,
+            ),
+        ),
+    ],
+)
+def test_project(fields: list[str], expected: str) -> None:
+    """Look up some fields of a variant definition."""
+    var: Final = variant.get_by_alias("alma8")
+    assert serialize.format_projection(serialize.project(var, fields)) == expected
+
+
+@pytest.mark.parametrize("path", ["nothing", "builder.nothing", "package.nothing", "name.more"])
+def test_project_invalid(path: str) -> None:
+    """Make sure invalid field paths are rejected."""
+    var: Final = variant.get_by_alias("alma8")
+    with pytest.raises(defs.VariantConfigError):
+        serialize.resolve_field(var, path)
+
+
+@pytest.mark.parametrize("var", variant.get_all_variants_in_order(), ids=lambda var: var.name)
+def test_format_shell(var: defs.Variant) -> None:
+    """Make sure the shell variable assignments may be evaluated."""
+    flat: Final = dict(serialize.flatten(var))
+    assert flat["builder.utf8_locale"] == var.builder.utf8_locale
+    assert flat["supported.repo"] == ("true" if var.supported.repo else "false")
+    assert shlex.split(flat["commands.package.install"]) == list(var.commands.package.install)
+    assert {name: flat[f"package.{name}"] for name in var.package} == dict(var.package)
+
+    names: Final = {serialize.shell_var_name(path): value for path, value in flat.items()}
+    assert len(names) == len(flat)
+    script: Final = 'eval "$1"\nprintf "%s\\0"' + "".join(f' "${name}"' for name in names)
+    cmd: Final = ["sh", "-c", script, "sh", serialize.format_shell(flat.items())]
+    output: Final = subprocess.check_output(cmd, encoding="UTF-8", shell=False)  # noqa: S603
+    assert output.split("\0")[:-1] == list(names.values())
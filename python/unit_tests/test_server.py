@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the query daemon and its client."""
+
+from __future__ import annotations
+
+import json
+import threading
+import typing
+from unittest import mock
+
+import pytest
+
+from sp_variant import defs
+from sp_variant import serialize
+from sp_variant import server
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    import pathlib
+    from typing import Final
+
+
+def test_detect_invalidate() -> None:
+    """Make sure the detected variant is only remembered until os-release changes."""
+    alma8: Final = variant.get_variant("ALMA8")
+    handler: Final = server.Handler(defs.Config(cache_dir=None))
+    with mock.patch("sp_variant.cache.file_id", return_value=(1, 2, 3, 4)) as file_id, mock.patch(
+        "sp_variant.variant.detect_variant",
+        return_value=alma8,
+    ) as detect:
+        assert handler.detect() is alma8
+        assert handler.handle("detect", {}) == "ALMA8"
+        assert detect.call_count == 1
+
+        file_id.return_value = (1, 2, 3, 5)
+        assert handler.handle("show", {"name": "current"}) == serialize.build_show(alma8)
+        assert handler.handle("package", {"name": "KMOD"}) == alma8.package["KMOD"]
+        assert detect.call_count == 2
+
+
+def test_respond() -> None:
+    """Make sure the requests are parsed and the errors are reported."""
+    handler: Final = server.Handler(defs.Config(cache_dir=None))
+    alma9: Final = variant.get_variant("ALMA9")
+
+    def ask(line: str) -> dict[str, typing.Any]:
+        """Send a request line, decode the response."""
+        resp: Final = server.respond(handler, line)
+        assert resp.endswith("\n")
+        assert "\n" not in resp[:-1]
+        res: Final[dict[str, typing.Any]] = json.loads(resp)
+        return res
+
+    assert ask(
+        '{"id": 3, "method": "command", "params": {"command": "package.install", '
+        '"variant": "alma9"}}',
+    ) == {"id": 3, "result": list(alma9.commands.package.install)}
+    assert ask('{"method": "show", "params": {"name": "ALMA9"}}') == {
+        "result": json.loads(serialize.dumps(serialize.build_show(alma9))),
+    }
+    assert ask('{"method": "show", "params": {"name": "all"}}')["result"]["order"][0] == "ROCKY8"
+
+    for line in [
+        "not json",
+        "[]",
+        '{"params": {}}',
+        '{"method": "nothing"}',
+        '{"method": "show", "params": {"name": "nothing"}}',
+        '{"method": "show", "params": {"name": 42}}',
+        '{"method": "command", "params": {"command": "package", "variant": "ALMA9"}}',
+        '{"method": "command", "params": {"command": "package.nothing", "variant": "ALMA9"}}',
+        '{"method": "package", "params": {"name": "NOTHING", "variant": "ALMA9"}}',
+    ]:
+        assert set(ask(line)) == {"error"}, line
+
+    with mock.patch(
+        "sp_variant.variant.detect_variant",
+        side_effect=PermissionError("no access to os-release"),
+    ):
+        assert ask('{"id": 5, "method": "detect"}') == {
+            "id": 5,
+            "error": "Could not handle the request: no access to os-release",
+        }
+    with mock.patch.object(handler, "handle", side_effect=KeyError("oops")):
+        assert set(ask('{"id": 6, "method": "detect"}')) == {"id", "error"}
+
+
+def test_query(tmp_path: pathlib.Path) -> None:
+    """Query a running server, then fall back to in-process work."""
+    path: Final = tmp_path / "sp-variant.sock"
+    expected: Final = json.loads(serialize.dumps(variant.get_variant("UBUNTU2204").builder))
+    params: Final = {"name": "ubuntu-22.04"}
+
+    handler: Final = server.Handler(defs.Config(cache_dir=None))
+    with server._Server(path, handler) as srv:  # noqa: SLF001
+        thr: Final = threading.Thread(target=srv.serve_forever)
+        thr.start()
+        try:
+            with mock.patch.object(handler, "handle", wraps=handler.handle) as handle:
+                res = variant.query("show", params, socket_path=path)
+                assert res["variant"]["builder"] == expected
+                assert handle.call_count == 1
+
+                with pytest.raises(variant.VariantQueryError, match="nothing"):
+                    variant.query("show", {"name": "nothing"}, socket_path=path)
+
+            with pytest.raises(defs.VariantConfigError, match="already listening"):
+                server._remove_stale_socket(defs.Config(cache_dir=None), path)  # noqa: SLF001
+            assert path.is_socket()
+        finally:
+            srv.shutdown()
+            thr.join()
+
+    server._remove_stale_socket(defs.Config(cache_dir=None), path)  # noqa: SLF001
+    assert not path.exists()
+
+    with mock.patch("sp_variant.server.Handler.handle", wraps=handler.handle) as handle:
+        assert variant.query("show", params, socket_path=path)["variant"]["builder"] == expected
+        assert handle.call_count == 1
+
+        with pytest.raises(variant.VariantQueryError, match="nothing"):
+            variant.query("show", {"name": "nothing"}, socket_path=path)
+        assert handle.call_count == 2
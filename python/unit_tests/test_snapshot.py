@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2021 - 2024  StorPool <support@storpool.com>
+# SPDX-License-Identifier: BSD-2-Clause
+"""Test the package list snapshots."""
+
+from __future__ import annotations
+
+import typing
+from unittest import mock
+
+from sp_variant import cache
+from sp_variant import defs
+from sp_variant import snapshot
+from sp_variant import variant
+
+
+if typing.TYPE_CHECKING:
+    import pathlib
+    from typing import Final
+
+
+def _write_status(path: pathlib.Path, pkgs: dict[str, str]) -> None:
+    """Write a dpkg status database containing the specified packages."""
+    path.write_text(
+        "".join(
+            f"Package: {name}\nStatus: install ok installed\nArchitecture: amd64\n"
+            f"Version: {version}\n\n"
+            for name, version in pkgs.items()
+        ),
+        encoding="UTF-8",
+    )
+
+
+def _pkg(name: str, version: str, arch: str = "amd64") -> defs.OSPackage:
+    """Build an installed package record."""
+    return defs.OSPackage(name=name, version=version, arch=arch, status="installed")
+
+
+def test_take(tmp_path: pathlib.Path) -> None:
+    """Make sure the stored snapshot is used until the database changes."""
+    status: Final = tmp_path / "status"
+    _write_status(status, {"bash": "5.2", "coreutils": "9.1"})
+    cfg: Final = defs.Config(cache_dir=tmp_path / "cache")
+    debian: Final = variant.get_variant("DEBIAN12")
+    with mock.patch("sp_variant.dpkg.STATUS_PATH", new=status), mock.patch.dict(
+        "sp_variant.snapshot._DB_FILES",
+        {"debian": (str(status),)},
+    ):
+        first: Final = snapshot.take(cfg, debian, ["*"])
+        assert first.packages == (_pkg("bash", "5.2"), _pkg("coreutils", "9.1"))
+        assert (tmp_path / "cache" / snapshot.snapshot_filename(debian, ["*"])).is_file()
+
+        with mock.patch("sp_variant.variant.iter_all_packages") as iter_all:
+            assert snapshot.take(cfg, debian, iter(["*"])) == first
+            iter_all.assert_not_called()
+
+            assert not snapshot.take(cfg, debian, ["b*"]).packages
+            iter_all.assert_called_once_with(debian, ("b*",))
+
+        # Both snapshots are kept, neither pattern set needs to list the packages again.
+        assert sorted(path.name for path in (tmp_path / "cache").iterdir()) == sorted(
+            snapshot.snapshot_filename(debian, pats) for pats in (["*"], ["b*"])
+        )
+        with mock.patch("sp_variant.variant.iter_all_packages") as iter_all:
+            assert snapshot.take(cfg, debian, ["*"]) == first
+            assert not snapshot.take(cfg, debian, ["b*"]).packages
+            iter_all.assert_not_called()
+
+        _write_status(status, {"bash": "5.3", "dash": "0.5"})
+        second: Final = snapshot.take(cfg, debian, ["*"])
+        assert second.packages == (_pkg("bash", "5.3"), _pkg("dash", "0.5"))
+        assert list(snapshot.diff_packages(first.packages, second.packages)) == [
+            snapshot.PackageChange(
+                kind="upgraded",
+                old=_pkg("bash", "5.2"),
+                new=_pkg("bash", "5.3"),
+            ),
+            snapshot.PackageChange(kind="removed", old=_pkg("coreutils", "9.1"), new=None),
+            snapshot.PackageChange(kind="added", old=None, new=_pkg("dash", "0.5")),
+        ]
+
+        (tmp_path / "cache" / snapshot.snapshot_filename(debian, ["*"])).write_text(
+            '{"format": "something else"}\n',
+            encoding="UTF-8",
+        )
+        assert snapshot.take(cfg, debian, ["*"]) == second
+
+        with mock.patch("sp_variant.variant.iter_all_packages", return_value=[]) as iter_all:
+            assert not snapshot.take(defs.Config(cache_dir=None), debian, ["*"]).packages
+            iter_all.assert_called_once()
+
+
+def test_diff_packages() -> None:
+    """Several versions of the same package, several architectures."""
+    old: Final = [
+        _pkg("kernel", "5.14.0-1"),
+        _pkg("kernel", "5.14.0-2"),
+        _pkg("libc6", "2.36", arch="amd64"),
+        _pkg("libc6", "2.36", arch="i386"),
+        _pkg("zsh", "5.9"),
+    ]
+    new: Final = [
+        _pkg("libc6", "2.37", arch="i386"),
+        _pkg("zsh", "5.9"),
+        _pkg("kernel", "5.14.0-3"),
+        _pkg("kernel", "5.14.0-2"),
+        _pkg("libc6", "2.36", arch="amd64"),
+    ]
+    assert not list(snapshot.diff_packages(old, reversed(old)))
+    assert list(snapshot.diff_packages(old, new)) == [
+        snapshot.PackageChange(kind="removed", old=_pkg("kernel", "5.14.0-1"), new=None),
+        snapshot.PackageChange(kind="added", old=None, new=_pkg("kernel", "5.14.0-3")),
+        snapshot.PackageChange(
+            kind="upgraded",
+            old=_pkg("libc6", "2.36", arch="i386"),
+            new=_pkg("libc6", "2.37", arch="i386"),
+        ),
+    ]
+
+
+def test_type_hints() -> None:
+    """Make sure the annotations of the snapshot records may be resolved at runtime."""
+    assert typing.get_type_hints(snapshot.PackageSnapshot)["files"] == dict[str, cache.FileId]
@@ -5,22 +5,29 @@
 from __future__ import annotations
 
 import collections
+import concurrent.futures as cfutures
 import dataclasses
+import functools
 import pathlib
 import re
+import subprocess  # noqa: S404
 import sys
+import threading
 import typing
 from unittest import mock
 
 import pytest
 
+from sp_variant import __main__ as sp_main
+from sp_variant import data
 from sp_variant import defs
 from sp_variant import variant
 from sp_variant import vbuild
+from sp_variant import yaiparser
 
 
 if typing.TYPE_CHECKING:
-    from typing import IO, Final
+    from typing import IO, Any, Final
 
 
 _MSG_NOT_SEEN = "This should not be seen"
@@ -56,6 +63,13 @@ def test_roundtrip() -> None:
         assert var.name == name
         avar = variant.get_by_alias(var.builder.alias)
         assert avar == var
+        if var.builder.branch:
+            assert variant.get_by_branch(var.builder.branch) == var
+
+    with pytest.raises(variant.VariantKeyError):
+        variant.get_by_alias("whee")
+    with pytest.raises(variant.VariantKeyError):
+        variant.get_by_branch("")
 
 
 def test_detect() -> None:
@@ -71,7 +85,7 @@ def test_list_all() -> None:
 
     var: Final = variant.detect_variant()
     assert var is not None
-    det_cmd: Final = list(var.commands.package.list_all)
+    det_cmd: Final = tuple(var.commands.package.list_all)
     print(f"list_all command: {det_cmd!r}")
 
     pkgs_a: Final = variant.list_all_packages(var, patterns=["a*"])
@@ -93,6 +107,90 @@ def test_list_all() -> None:
     assert pkgs_all
 
 
+def _with_list_all(script: str) -> defs.Variant:
+    """Build a variant that lists packages by running a shell script."""
+    var: Final = variant.get_variant("DEBIAN12")
+    return var._replace(
+        commands=var.commands._replace(
+            package=var.commands.package._replace(list_all=("sh", "-c", script, "sh")),
+        ),
+    )
+
+
+def test_iter_all() -> None:
+    """Make sure the packages are yielded as they are output, errors are reported."""
+    var: Final = _with_list_all(
+        r"printf 'a\t1.0\tamd64\tii \nb\t2\tall\trc \n'; "
+        r"""for pkg; do printf '%s\t3\tall\tii \n' "$pkg"; done""",
+    )
+    pkgs: Final = variant.iter_all_packages(var, ["c", "d"])
+    assert next(pkgs) == defs.OSPackage(name="a", version="1.0", arch="amd64", status="installed")
+    assert [pkg.name for pkg in pkgs] == ["c", "d"]
+    assert variant.list_all_packages(var) == [
+        defs.OSPackage(name="a", version="1.0", arch="amd64", status="installed"),
+    ]
+
+    failing: Final = variant.iter_all_packages(
+        _with_list_all(r"printf 'a\t1\tall\tii \n'; exit 3"),
+    )
+    assert next(failing).name == "a"
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        next(failing)
+    assert exc_info.value.returncode == 3
+
+    with pytest.raises(variant.VariantFileError):
+        variant.list_all_packages(_with_list_all(r"printf 'a\t1\n'; sleep 60"))
+
+    endless: Final = variant.iter_all_packages(
+        _with_list_all(r"while :; do printf 'a\t1\tall\tii \n'; done"),
+    )
+    assert [next(endless).name for _ in range(100)] == ["a"] * 100
+    endless.close()
+
+
+def test_are_installed() -> None:
+    """Make sure the packages are listed once and looked up by name and architecture."""
+    var: Final = _with_list_all(
+        r"printf 'bash\t5.2\tamd64\tii \nlibc6\t2.36\ti386\tii \nvim\t9.0\tamd64\trc \n'",
+    )
+    with mock.patch.object(
+        variant,
+        "iter_all_packages",
+        wraps=variant.iter_all_packages,
+    ) as iter_all:
+        assert variant.are_installed(
+            var,
+            iter(["bash", "libc6:i386", "libc6:amd64", "vim", "zsh"]),
+        ) == {
+            "bash": True,
+            "libc6:i386": True,
+            "libc6:amd64": False,
+            "vim": False,
+            "zsh": False,
+        }
+    iter_all.assert_called_once_with(var)
+
+
+def test_only_missing() -> None:
+    """Make sure `command run --only-missing` skips the installed packages."""
+    var: Final = _with_list_all(r"printf 'bash\t5.2\tamd64\tii \n'")
+
+    def run(*args: str, command: str = "package.install") -> list[list[str]]:
+        """Run the command, return the commands passed to `subprocess.check_call()`."""
+        with mock.patch("sp_variant.variant.detect_variant", return_value=var), mock.patch(
+            "subprocess.check_call",
+        ) as check_call:
+            sp_main.command_run(
+                defs.Config(args=list(args), cache_dir=None, command=command, only_missing=True),
+            )
+        return [call.args[0] for call in check_call.call_args_list]
+
+    assert run("bash", "zsh") == [[*var.commands.package.install, "zsh"]]
+    assert not run("bash")
+    with pytest.raises(defs.VariantConfigError):
+        run("bash", command="package.remove_impl")
+
+
 def test_config_diag() -> None:
     """Test the `cfg_diag`-like functionality of the `Config` class."""
     output: list[tuple[str, IO[str]]] = []
@@ -197,3 +295,244 @@ def test_builder_branches() -> None:
         if item[1] != 1
     )
     assert not dup_branches
+
+
+def test_detect_by_os_id() -> None:
+    """Make sure the os-release "ID" index preserves the detect order."""
+    all_variants: Final = variant.get_all_variants_in_order()
+    by_os_id: Final = vbuild.DEFAULT_REGISTRY.detect_by_os_id
+    assert sorted(by_os_id) == sorted({var.detect.os_id for var in all_variants})
+    for os_id, candidates in by_os_id.items():
+        assert candidates == [var for var in all_variants if var.detect.os_id == os_id]
+
+
+@pytest.mark.parametrize(
+    ("os_id", "os_version", "expected"),
+    [
+        ("almalinux", "9.3", "ALMA9"),
+        ("centos", "7", "CENTOS7"),
+        ("centos", "8.5", "CENTOS8"),
+        ("debian", "12", "DEBIAN12"),
+        ("ol", "7.9", "ORACLE7"),
+        ("ubuntu", "22.04", "UBUNTU2204"),
+        ("ubuntu", "16.04", None),
+        ("weird", "1.0", None),
+    ],
+)
+def test_detect_from_os_release(os_id: str, os_version: str, expected: str | None) -> None:
+    """Make sure the os-release detection matches a linear scan of the variants."""
+
+    def linear_scan() -> str | None:
+        """Look for the variant the slow way."""
+        return next(
+            (
+                var.name
+                for var in variant.get_all_variants_in_order()
+                if var.detect.os_id == os_id and var.detect.os_version_regex.match(os_version)
+            ),
+            None,
+        )
+
+    assert linear_scan() == expected
+    with mock.patch.object(
+        yaiparser.YAIParser,
+        "parse",
+        return_value={"ID": os_id, "VERSION_ID": os_version},
+    ):
+        res: Final = variant._detect_from_os_release(  # noqa: SLF001
+            variant.Config(),
+            vbuild.DEFAULT_REGISTRY,
+            {},
+        )
+    assert (res.name if res is not None else None) == expected
+
+
+def test_lazy() -> None:
+    """Make sure single variant lookups do not merge or index anything."""
+    registry: Final = vbuild.VariantRegistry()
+    with mock.patch.multiple(
+        vbuild,
+        DEFAULT_REGISTRY=registry,
+        merge_into_parent=mock.Mock(side_effect=AssertionError("merging")),
+    ):
+        assert variant.get_variant("CENTOS8").name == "CENTOS8"
+        with pytest.raises(variant.VariantKeyError):
+            variant.get_variant("whee")
+        assert not registry.variants
+        assert not registry.detect_order
+
+        all_variants: Final = variant.get_all_variants()
+        assert list(all_variants) == [vdef.name for vdef in vbuild._VARIANT_DEF]  # noqa: SLF001
+        assert variant.get_all_variants_in_order() == list(reversed(all_variants.values()))
+
+
+def test_build_duplicate_alias() -> None:
+    """Make sure build_variants() refuses to index two variants with the same alias."""
+    weird: Final = data.VARIANTS["ALMA8"]._replace(
+        builder=data.VARIANTS["ALMA8"].builder._replace(alias="alma9"),
+    )
+    with mock.patch.dict(data.VARIANTS, {"ALMA8": weird}), mock.patch.object(
+        vbuild,
+        "DEFAULT_REGISTRY",
+        vbuild.VariantRegistry(),
+    ), pytest.raises(defs.VariantConfigError, match="alma9"):
+        vbuild.build_variants(variant.Config())
+
+
+def _first_access(barrier: threading.Barrier, idx: int) -> tuple[str, int, str, str]:
+    """Wait for all the other threads, then look some variants up."""
+    barrier.wait()
+    cfg: Final = defs.Config(cache_dir=None)
+    if idx % 3 == 0:
+        name = variant.detect_variant(cfg).name
+    elif idx % 3 == 1:
+        name = variant.get_by_alias("alma8", cfg).name
+    else:
+        name = variant.get_variant("CENTOS8", cfg).name
+    return (
+        name,
+        len(variant.get_all_variants_in_order(cfg)),
+        variant.get_by_alias("ubuntu-22.04", cfg).name,
+        variant.get_by_branch("debian/bookworm", cfg).name,
+    )
+
+
+@pytest.mark.parametrize("rnd", range(5))
+def test_build_threads(rnd: int) -> None:
+    """Make sure many threads may trigger the registry initialization at once."""
+    nthreads: Final = 16 + rnd * 8
+    barrier: Final = threading.Barrier(nthreads)
+    old_interval: Final = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        registry: Final = vbuild.VariantRegistry()
+        with mock.patch.object(vbuild, "DEFAULT_REGISTRY", registry), mock.patch.object(
+            vbuild,
+            "_build_index",
+            wraps=vbuild._build_index,  # noqa: SLF001
+        ) as build_index, cfutures.ThreadPoolExecutor(max_workers=nthreads) as pool:
+            results: Final = list(
+                pool.map(lambda idx: _first_access(barrier, idx), range(nthreads)),
+            )
+            assert len(registry.detect_order) == len(data.DETECT_ORDER)
+            assert build_index.call_count == 2
+    finally:
+        sys.setswitchinterval(old_interval)
+
+    detected: Final = variant.detect_variant(defs.Config(cache_dir=None)).name
+    expected: Final = [
+        (
+            [detected, "ALMA8", "CENTOS8"][idx % 3],
+            len(data.DETECT_ORDER),
+            "UBUNTU2204",
+            "DEBIAN12",
+        )
+        for idx in range(nthreads)
+    ]
+    assert results == expected
+
+
+def test_registry_overrides() -> None:
+    """Make sure a registry with overrides shares the unchanged data."""
+    cfg: Final = defs.Config(cache_dir=None)
+    staging: Final = vbuild.DEFAULT_REGISTRY.with_overrides(
+        cfg,
+        {"ALMA9": {"package": {"KMOD": "kmod-staging"}}},
+    )
+    scfg: Final = defs.Config(cache_dir=None, registry=staging)
+
+    orig: Final = variant.get_variant("ALMA9", cfg)
+    changed: Final = variant.get_variant("ALMA9", scfg)
+    assert changed.package["KMOD"] == "kmod-staging"
+    assert orig.package["KMOD"] != "kmod-staging"
+    assert data.VARIANTS["ALMA9"] is orig
+    assert changed.detect is orig.detect
+    assert changed.commands is orig.commands
+    assert changed.package["LIBUDEV"] == orig.package["LIBUDEV"]
+
+    all_orig: Final = variant.get_all_variants(cfg)
+    all_changed: Final = variant.get_all_variants(scfg)
+    assert list(all_changed) == list(all_orig)
+    for name, var in all_changed.items():
+        if var.family == "debian":
+            assert var is all_orig[name]
+        else:
+            assert var.package["KMOD"] == "kmod-staging"
+            assert var.builder is all_orig[name].builder
+
+    assert variant.get_by_alias("rocky9", scfg) is all_changed["ROCKY9"]
+    assert variant.get_all_variants_in_order(scfg) == [
+        all_changed[var.name] for var in variant.get_all_variants_in_order(cfg)
+    ]
+    assert variant.detect_variant(scfg) is all_changed[variant.detect_variant(cfg).name]
+
+    layered: Final = staging.with_overrides(cfg, {"ROCKY9": {"descr": "Rocky, staging"}})
+    rocky: Final = variant.get_variant("ROCKY9", defs.Config(registry=layered))
+    assert rocky.descr == "Rocky, staging"
+    assert rocky.package["KMOD"] == "kmod-staging"
+    assert variant.get_variant("ROCKY9", scfg).descr == all_orig["ROCKY9"].descr
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"WHEE": {"descr": "Whee"}}, "WHEE"),
+        ({"ALMA9": {"whee": "Whee"}}, "unexpected field whee"),
+        ({"ALMA9": {"supported": {"repo": "yes"}}}, "repo is not a string"),
+    ],
+)
+def test_registry_overrides_invalid(overrides: dict[str, dict[str, Any]], message: str) -> None:
+    """Make sure invalid overrides are rejected right away."""
+    with pytest.raises(defs.VariantConfigError, match=message):
+        vbuild.DEFAULT_REGISTRY.with_overrides(defs.Config(), overrides)
+
+
+def test_hashable() -> None:
+    """Make sure the variants may be used as dictionary keys and memoization arguments."""
+    all_variants: Final = variant.get_all_variants_in_order()
+    assert len(set(all_variants)) == len(all_variants)
+    assert {var: var.name for var in all_variants} == {var: var.name for var in all_variants}
+
+    @functools.lru_cache(maxsize=None)
+    def describe(var: defs.Variant) -> str:
+        """Do something with a variant."""
+        return f"{var.name}: {var.descr}"
+
+    for var in all_variants:
+        assert describe(var) == describe(variant.get_variant(var.name))
+    assert describe.cache_info().misses == len(all_variants)
+
+
+def test_shared_commands() -> None:
+    """Make sure identical command vectors and substructures are shared."""
+    by_family: Final[dict[str, list[defs.Variant]]] = {}
+    for var in variant.get_all_variants_in_order():
+        by_family.setdefault(var.family, []).append(var)
+    assert sorted(by_family) == ["debian", "redhat"]
+
+    for variants in by_family.values():
+        first = variants[0]
+        for var in variants[1:]:
+            for name, cmd in var.commands.package._asdict().items():
+                first_cmd = getattr(first.commands.package, name)
+                assert (cmd is first_cmd) == (cmd == first_cmd)
+            for name, cmd in var.commands.pkgfile._asdict().items():
+                first_cmd = getattr(first.commands.pkgfile, name)
+                assert (cmd is first_cmd) == (cmd == first_cmd)
+
+    staging: Final = vbuild.DEFAULT_REGISTRY.with_overrides(
+        defs.Config(),
+        {"CENTOS8": {"commands": {"package": {"update_db": ["dnf", "makecache"]}}}},
+    )
+    scfg: Final = defs.Config(registry=staging)
+    orig: Final = variant.get_variant("ROCKY8")
+    changed: Final = variant.get_variant("ROCKY8", scfg)
+    assert changed.commands.package.update_db == ("dnf", "makecache")
+    assert (
+        changed.commands.package.update_db
+        is variant.get_variant("RHEL8", scfg).commands.package.update_db
+    )
+    assert changed.commands.package.install is orig.commands.package.install
+    assert changed.commands.pkgfile is orig.commands.pkgfile
+    assert changed.package is orig.package
+    assert changed.repo is orig.repo